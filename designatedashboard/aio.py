@@ -0,0 +1,151 @@
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+"""Runs Designate calls concurrently on a shared event loop.
+
+openstacksdk and keystoneauth only make blocking HTTP calls, so every call
+runs in a thread of a bounded executor. A single event loop thread per
+process schedules the calls, limits how many run at once and enforces their
+timeouts. Views stay synchronous and wait for all the results, so fanning
+out to N calls costs about the wall time of the slowest one rather than
+the sum of all of them.
+
+The executors are shared by all the requests of the process, and a call
+that timed out holds its thread until it returns. Region fan-out, whose
+calls wait on whole remote regions, therefore has its own executor of
+``DESIGNATE_ASYNC_REGION_WORKERS`` threads (8 by default), so that a slow
+region does not starve the batch, import and status calls of the
+``DESIGNATE_ASYNC_WORKERS`` threads (32 by default) of the default
+executor. Size the default executor for the batch concurrency times the
+number of requests served at once, and the region executor for the number
+of regions times the listings served at once.
+
+A gather called from a thread of the executor it would use runs its calls
+one after the other in that thread instead, since waiting there for other
+threads of the same executor can deadlock once all of them are waiting.
+"""
+import asyncio
+from concurrent import futures
+import logging
+import threading
+
+from django.conf import settings
+
+
+LOG = logging.getLogger(__name__)
+
+MAX_WORKERS = getattr(settings, 'DESIGNATE_ASYNC_WORKERS', 32)
+REGION_WORKERS = getattr(settings, 'DESIGNATE_ASYNC_REGION_WORKERS', 8)
+
+# Names of the executors, see gather.
+DEFAULT_POOL = 'default'
+REGION_POOL = 'regions'
+
+# Holds the name of the executor of the current thread, if any.
+_thread_pool = threading.local()
+
+
+def _mark_thread(pool):
+    _thread_pool.name = pool
+
+
+class _LoopThread(object):
+    """An event loop running forever in a daemon thread, started lazily.
+
+    :param pools: Dictionary of the number of threads of each executor, by
+        name
+    """
+
+    def __init__(self, pools):
+        self.pools = pools
+        self._lock = threading.Lock()
+        self._loop = None
+        self._executors = {}
+
+    def get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                for pool, max_workers in self.pools.items():
+                    self._executors[pool] = futures.ThreadPoolExecutor(
+                        max_workers=max_workers,
+                        thread_name_prefix='designatedashboard-aio-%s' % pool,
+                        initializer=_mark_thread, initargs=(pool,))
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name='designatedashboard-aio-loop', daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def get_executor(self, pool):
+        return self._executors[pool]
+
+
+_loop_thread = _LoopThread({DEFAULT_POOL: MAX_WORKERS,
+                            REGION_POOL: REGION_WORKERS})
+
+
+async def _call(executor, function, timeout):
+    call = asyncio.get_running_loop().run_in_executor(executor, function)
+    if timeout:
+        return await asyncio.wait_for(call, timeout)
+    return await call
+
+
+async def _gather(executor, functions, timeout, concurrency):
+    semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+    async def run(function):
+        if semaphore is None:
+            return await _call(executor, function, timeout)
+        async with semaphore:
+            return await _call(executor, function, timeout)
+
+    return await asyncio.gather(*[run(function) for function in functions],
+                                return_exceptions=True)
+
+
+def _run_inline(functions):
+    results = []
+    for function in functions:
+        try:
+            results.append(function())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def gather(functions, timeout=None, concurrency=None, pool=DEFAULT_POOL):
+    """Calls functions concurrently and waits for all of them.
+
+    :param functions: Iterable of callables taking no arguments
+    :param timeout: Seconds after which a call gives up, or None. The thread
+        of a call that timed out runs on until the call returns, but its
+        result is dropped.
+    :param concurrency: Maximum number of calls running at once, or None
+    :param pool: Name of the executor running the calls, DEFAULT_POOL or
+        REGION_POOL. When called from one of its own threads, the calls run
+        one after the other in the calling thread, without timeout.
+    :returns: List of the results, in the order of functions, holding the
+        exception raised instead for the calls that failed, or a
+        ``TimeoutError`` for those that timed out
+    """
+    functions = list(functions)
+    if not functions:
+        return []
+    if getattr(_thread_pool, 'name', None) == pool:
+        LOG.debug('nested gather on the %s executor, running inline', pool)
+        return _run_inline(functions)
+    loop = _loop_thread.get_loop()
+    return asyncio.run_coroutine_threadsafe(
+        _gather(_loop_thread.get_executor(pool), functions, timeout,
+                concurrency), loop).result()
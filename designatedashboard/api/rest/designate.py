@@ -12,27 +12,493 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import contextlib
+import datetime
+from designatedashboard import aio
+from designatedashboard import result_cache
 from designatedashboard.sdk_connection import get_sdk_connection
+from designatedashboard import zonefile
+from django.conf import settings
+from django.core import cache as django_cache
+from django import http
+from django.utils import cache as cache_utils
 from django.views import generic
+import functools
+import hashlib
+import ipaddress
+import itertools
 import logging
+import re
+import string
+import time
+from urllib import parse
 
+from horizon.utils import functions as utils
+from openstack.dns.v2 import floating_ip as _fip
+from openstack.dns.v2 import recordset as _rs
+from openstack.dns.v2 import zone as _zone
+from openstack import exceptions as sdk_exceptions
+from openstack import resource as sdk_resource
+from openstack_auth import utils as auth_utils
 from openstack_dashboard.api.rest import urls
 from openstack_dashboard.api.rest import utils as rest_utils
+from oslo_serialization import jsonutils
 
 
 LOG = logging.getLogger(__name__)
 
+# Designate collection paths. They are also the scopes of the result cache.
+ZONES_PATH = '/zones'
+RECORDSETS_PATH = '/zones/%s/recordsets'
+FLOATINGIPS_PATH = '/reverse/floatingips'
 
-def _sdk_object_to_list(object):
-    """Converts an SDK generator object to a list of dictionaries.
+# Query parameters used to page through a listing. They are handled by the
+# dashboard rather than passed on to Designate as filters.
+PAGINATION_KEYWORDS = ('paginate', 'limit', 'marker', 'sort_key', 'sort_dir',
+                       'reversed_order')
 
-    :param object: SDK generator object
-    :returns: List of dictionaries
-    """
-    result_list = []
-    for item in object:
-        result_list.append(item.to_dict())
-    return result_list
+# Filters accepted by the Designate listings. Names may contain '*' wildcards.
+ZONE_FILTERS = ('name', 'email', 'status', 'description', 'ttl', 'type')
+RECORDSET_FILTERS = ('name', 'type', 'ttl', 'data', 'status', 'description')
+# Designate does not filter floating IP PTRs, so the dashboard does it.
+FLOATINGIP_FILTERS = ('address', 'ptrdname', 'description', 'status')
+
+# Query parameter listing the keys to return for each resource, either comma
+# separated or repeated.
+FIELDS_KEYWORD = 'fields'
+
+# Size in bytes of the chunks of streamed responses.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Number of operations of a batch request run at the same time.
+BATCH_CONCURRENCY = getattr(settings, 'DESIGNATE_BATCH_CONCURRENCY', 8)
+# Actions of the operations of batch recordset requests.
+BATCH_ACTIONS = ('create', 'update', 'delete')
+
+# Query parameter asking for the resources of every region with a DNS
+# endpoint, and the seconds after which a region is given up on.
+ALL_REGIONS_KEYWORD = 'all_regions'
+REGION_TIMEOUT = getattr(settings, 'DESIGNATE_REGION_TIMEOUT', 10)
+
+# Number of recordsets written at a time by zone file imports, and of
+# recordset failures they report.
+IMPORT_BATCH_SIZE = getattr(settings, 'DESIGNATE_IMPORT_BATCH_SIZE', 100)
+IMPORT_MAX_ERRORS = 100
+# Page size of the recordset listings of zone file exports, Designate's
+# default maximum.
+EXPORT_PAGE_SIZE = 1000
+
+# Longest time a status request waits for pending resources to change, and
+# the seconds between its polls of Designate. A waiting request holds a web
+# server worker, so at most STATUS_MAX_WAITS requests of a session wait at a
+# time, the others poll Designate once. A STATUS_WAIT of 0 turns the long
+# polling off.
+STATUS_WAIT = getattr(settings, 'DESIGNATE_STATUS_WAIT', 25)
+STATUS_POLL_INTERVAL = getattr(settings, 'DESIGNATE_STATUS_POLL_INTERVAL', 2)
+STATUS_MAX_WAITS = getattr(settings, 'DESIGNATE_STATUS_MAX_WAITS', 2)
+
+# Query parameter asking only for the changes since the timestamp of a former
+# listing, and the seconds of clock difference with Designate allowed for.
+CHANGED_SINCE_KEYWORD = 'changed_since'
+CHANGES_MARGIN = getattr(settings, 'DESIGNATE_CHANGES_MARGIN', 60)
+
+# Query parameter asking for the Neutron port that owns each floating IP,
+# and the keys added to the floating IPs for it.
+OWNERS_KEYWORD = 'owners'
+OWNER_FIELDS = ('floating_network_id', 'fixed_ip_address', 'port_id',
+                'port_name', 'device_id', 'device_owner')
+# Number of port ids in each Neutron port listing of the owners.
+PORT_FILTER_SIZE = 100
+
+# Address used to check the PTR name templates of batch requests.
+PTR_TEMPLATE_EXAMPLE = '192.0.2.1'
+# Longest label, and longest domain name without its final dot, in DNS.
+MAX_LABEL_LENGTH = 63
+MAX_NAME_LENGTH = 253
+
+
+class StreamingJSONResponse(http.StreamingHttpResponse):
+    """Streams a JSON object holding a list of items under ``key``."""
+
+    def __init__(self, key, items, **data):
+        super(StreamingJSONResponse, self).__init__(
+            self._serialize(key, items, data),
+            content_type='application/json')
+
+    @staticmethod
+    def _serialize(key, items, data):
+        chunk = ['{%s: [' % jsonutils.dumps(key)]
+        size = 0
+        try:
+            for index, item in enumerate(items):
+                text = jsonutils.dumps(item)
+                chunk.append(',' + text if index else text)
+                size += len(text)
+                if size >= STREAM_CHUNK_SIZE:
+                    yield ''.join(chunk)
+                    chunk, size = [], 0
+        except Exception:
+            # The status line has already been sent, all that can be done is
+            # to cut the response short so that the client fails to parse it.
+            LOG.exception('error streaming %s', key)
+            yield ''.join(chunk)
+            return
+        chunk.append(']')
+        for name, value in data.items():
+            chunk.append(', %s: %s' % (jsonutils.dumps(name),
+                                       jsonutils.dumps(value)))
+        chunk.append('}')
+        yield ''.join(chunk)
+
+
+class _StreamingResult(http.HttpResponse):
+    """Carries a streaming response through ``rest_utils.ajax``."""
+
+    def __init__(self, response):
+        super(_StreamingResult, self).__init__()
+        self.response = response
+
+
+def streaming(function):
+    """Lets a ``rest_utils.ajax`` view return a StreamingJSONResponse."""
+    @functools.wraps(function)
+    def _wrapped(self, request, *args, **kwargs):
+        response = function(self, request, *args, **kwargs)
+        if isinstance(response, _StreamingResult):
+            return response.response
+        return response
+    return _wrapped
+
+
+def file_view(function):
+    """Like ``rest_utils.ajax``, for views that upload or download files."""
+    @functools.wraps(function)
+    def _wrapped(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return rest_utils.JSONResponse('not logged in', 401)
+        try:
+            data = function(self, request, *args, **kwargs)
+        except rest_utils.AjaxError as e:
+            return rest_utils.JSONResponse(str(e), e.http_status)
+        except sdk_exceptions.HttpException as e:
+            return rest_utils.JSONResponse(str(e), e.status_code or 500)
+        except Exception as e:
+            LOG.exception('error invoking apiclient')
+            return rest_utils.JSONResponse(str(e), 500)
+        if isinstance(data, http.HttpResponseBase):
+            return data
+        return rest_utils.JSONResponse(data)
+    return _wrapped
+
+
+def _get_fields(request):
+    """Returns the keys requested with the ``fields`` GET parameter."""
+    fields = set(field.strip()
+                 for value in request.GET.getlist(FIELDS_KEYWORD)
+                 for field in value.split(','))
+    fields.discard('')
+    if not fields:
+        return None
+    # The id, and the region of all regions listings, are always needed to
+    # tell the resources apart.
+    fields.update(('id', 'region'))
+    return fields
+
+
+def _select_fields(item, fields):
+    """Trims a resource dictionary to the given keys."""
+    if fields is None:
+        return item
+    return {key: value for key, value in item.items() if key in fields}
+
+
+def _validator(item):
+    """Returns what identifies the state of a resource dictionary."""
+    # Resources without a version, such as floating IP PTRs, count as a whole
+    if item.get('version') is None and not item.get('updated_at'):
+        return item
+    return [item.get(key) for key in
+            ('id', 'version', 'updated_at', 'status', 'action')]
+
+
+def _conditional_response(request, data, validator):
+    """Returns a JSON response, or a 304 when the ETag of validator matches."""
+    # The same resources trimmed to other fields make another representation
+    validator = [validator, sorted(_get_fields(request) or [])]
+    digest = hashlib.sha1(jsonutils.dumps(
+        validator, sort_keys=True).encode('utf-8')).hexdigest()
+    etag = '"%s"' % digest
+    response = cache_utils.get_conditional_response(request, etag=etag)
+    if response is None:
+        response = rest_utils.JSONResponse(data)
+    response['ETag'] = etag
+    # Have the browser check back every time rather than guess a lifetime
+    cache_utils.patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _resource_response(request, item):
+    """Returns the response of a detail view, trimmed to ``fields``."""
+    item = _select_fields(item, _get_fields(request))
+    return _conditional_response(request, item, _validator(item))
+
+
+def _list_response(request, key, items, markers=None):
+    """Returns the response of a list view, trimmed to ``fields``."""
+    markers = markers or {}
+    fields = _get_fields(request)
+    if isinstance(items, list):
+        items = [_select_fields(item, fields) for item in items]
+        # The timestamp changes on every request. A client answered 304
+        # keeps the timestamp of its former response, which only makes its
+        # next changed_since listing reach further back.
+        validator = [[_validator(item) for item in items],
+                     {name: value for name, value in markers.items()
+                      if name != 'timestamp'}]
+        return _conditional_response(request, dict(markers, **{key: items}),
+                                     validator)
+    items = (_select_fields(item, fields) for item in items)
+    return _StreamingResult(StreamingJSONResponse(key, items, **markers))
+
+
+def _is_true(value):
+    return str(value).lower() in ('true', '1', 'yes')
+
+
+def _get_filters(request, names):
+    """Extract the filters among names from the request GET args."""
+    filters, _kwargs = rest_utils.parse_filters_kwargs(request,
+                                                       PAGINATION_KEYWORDS)
+    return {name: value for name, value in filters.items()
+            if name in names and value not in (None, '')}
+
+
+def _match_filters(items, filters):
+    """Filters items the way Designate filters its listings."""
+    patterns = {
+        name: re.compile('.*'.join(re.escape(part)
+                                   for part in str(value).split('*')),
+                         re.IGNORECASE)
+        for name, value in filters.items()}
+    return (item for item in items
+            if all(pattern.fullmatch(str(item.get(name) or ''))
+                   for name, pattern in patterns.items()))
+
+
+def _list_pages(request, conn, path, key, cache=True, **params):
+    """Lists resources from Designate one page at a time."""
+    def fetch():
+        response = conn.dns.get(path, params=params)
+        sdk_exceptions.raise_from_response(response)
+        return response.json()
+
+    while True:
+        if cache:
+            body = result_cache.get_or_call(request, path, ['page', params],
+                                            fetch, conn.config.region_name)
+        else:
+            body = fetch()
+        yield body.get(key, [])
+        next_link = (body.get('links') or {}).get('next')
+        if not next_link:
+            return
+        params = dict(parse.parse_qsl(parse.urlparse(next_link).query))
+
+
+def _dns_regions(request):
+    """Returns the regions of the DNS endpoints in the service catalog."""
+    regions = []
+    for service in request.user.service_catalog or []:
+        if service.get('type') != 'dns':
+            continue
+        for endpoint in service.get('endpoints', []):
+            region = auth_utils.get_endpoint_region(endpoint)
+            if region not in regions:
+                regions.append(region)
+    return regions
+
+
+def _list_all_regions(request, list_region, extra_calls=None, join=None):
+    """Lists resources in every region with a DNS endpoint, in parallel."""
+    regions = _dns_regions(request)
+
+    def lister(region):
+        def run():
+            return list(list_region(get_sdk_connection(request, region)))
+        return run
+
+    # The calls of all the regions go in a single gather, so that they all
+    # run at once under REGION_TIMEOUT rather than waiting on each other
+    calls = []
+    spans = []
+    for region in regions:
+        region_calls = [lister(region)]
+        if extra_calls:
+            region_calls.extend(extra_calls(region))
+        calls.extend(region_calls)
+        spans.append(len(region_calls))
+    results = aio.gather(calls, timeout=REGION_TIMEOUT, pool=aio.REGION_POOL)
+
+    items = []
+    failed_regions = []
+    offset = 0
+    for region, span in zip(regions, spans):
+        result = results[offset]
+        extra_results = results[offset + 1:offset + span]
+        offset += span
+        if isinstance(result, Exception):
+            LOG.warning('Unable to list DNS resources of region %s: %r',
+                        region, result)
+            failed_regions.append(region)
+            continue
+        if join:
+            result = join(region, result, extra_results)
+        for item in result:
+            item['region'] = region
+            items.append(item)
+
+    _filters, kwargs = rest_utils.parse_filters_kwargs(request,
+                                                       PAGINATION_KEYWORDS)
+    sort_key = kwargs.get('sort_key')
+    if sort_key:
+        items.sort(key=lambda item: str(item.get(sort_key) or ''),
+                   reverse=kwargs.get('sort_dir') == 'desc')
+    return items, {'next': None, 'prev': None,
+                   'current_region': request.user.services_region,
+                   'failed_regions': failed_regions}
+
+
+def _prefetch(pages):
+    """Fetches the first page, so its errors are raised before streaming."""
+    first = next(pages, [])
+    return itertools.chain([first], pages)
+
+
+def _iter_resources(conn, resource_type, pages, uri_attrs=None):
+    """Converts the pages of a listing to resource dictionaries."""
+    for page in pages:
+        for item in page:
+            result = resource_type.existing(connection=conn, **item).to_dict()
+            if uri_attrs:
+                result.update(uri_attrs)
+            yield result
+
+
+def _list_resources(request, conn, resource_type, path, key, uri_attrs=None,
+                    **query):
+    """Lists resources, optionally a single page at a time."""
+    timestamp = _now().isoformat()
+    _filters, kwargs = rest_utils.parse_filters_kwargs(request,
+                                                       PAGINATION_KEYWORDS)
+    for param in ('sort_key', 'sort_dir'):
+        if kwargs.get(param):
+            query[param] = kwargs[param]
+
+    limit = kwargs.get('limit')
+    if not limit and not _is_true(kwargs.get('paginate')):
+        pages = _prefetch(_list_pages(request, conn, path, key, **query))
+        items = _iter_resources(conn, resource_type, pages, uri_attrs)
+        return items, {'next': None, 'prev': None, 'timestamp': timestamp}
+
+    limit = int(limit) if limit else utils.get_page_size(request)
+    marker = kwargs.get('marker')
+    reversed_order = _is_true(kwargs.get('reversed_order'))
+    # Designate only pages forward, so the previous page is listed backwards
+    # from the first item of the current one
+    if reversed_order:
+        sort_dir = query.get('sort_dir', 'asc')
+        query['sort_dir'] = 'desc' if sort_dir == 'asc' else 'asc'
+    if marker:
+        query['marker'] = marker
+    # Ask for one more item than needed to know whether there is a next page
+    query['limit'] = limit + 1
+    pages = _list_pages(request, conn, path, key, **query)
+    items = list(itertools.islice(
+        _iter_resources(conn, resource_type, pages, uri_attrs), limit + 1))
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    markers = {'next': None, 'prev': None, 'timestamp': timestamp}
+    if reversed_order:
+        items.reverse()
+        if items and has_more:
+            markers['prev'] = items[0]['id']
+        if items and marker:
+            markers['next'] = items[-1]['id']
+    else:
+        if items and has_more:
+            markers['next'] = items[-1]['id']
+        if items and marker:
+            markers['prev'] = items[0]['id']
+    return items, markers
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _parse_time(value):
+    """Parses an ISO 8601 time as a naive UTC datetime, like Designate's."""
+    parsed = datetime.datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _changed_at(item):
+    try:
+        return max(_parse_time(item[key])
+                   for key in ('created_at', 'updated_at') if item.get(key))
+    except ValueError:
+        # Without a time to go by, the resource counts as changed
+        return datetime.datetime.max
+
+
+def _list_changes(request, scope, items, markers):
+    """Narrows a listing down to its changes since ``changed_since``."""
+    value = request.GET.get(CHANGED_SINCE_KEYWORD)
+    if not value:
+        return items, markers
+    try:
+        since = _parse_time(value)
+    except ValueError:
+        raise rest_utils.AjaxError(400, 'invalid %s %s' %
+                                   (CHANGED_SINCE_KEYWORD, value))
+    since -= datetime.timedelta(
+        seconds=CHANGES_MARGIN + max(result_cache.TIMEOUT or 0, 0))
+
+    # Clients drop the resources left out of the ids, which covers the
+    # deletions the journal misses
+    ids = []
+    changed = []
+    for item in items:
+        ids.append(item['id'])
+        if _changed_at(item) >= since:
+            changed.append(item)
+    deleted = result_cache.deleted_since(
+        request, scope,
+        since.replace(tzinfo=datetime.timezone.utc).timestamp())
+    markers = dict(markers, delta=True, ids=ids, deleted=deleted)
+    return changed, markers
+
+
+def _error_result(error):
+    if isinstance(error, rest_utils.AjaxError):
+        return {'status': 'error', 'error': str(error),
+                'code': error.http_status}
+    LOG.info('batch operation failed: %s', error)
+    return {'status': 'error', 'error': str(error),
+            'code': getattr(error, 'status_code', None) or 500}
+
+
+def _run_batch(items, function):
+    """Calls function on every item, BATCH_CONCURRENCY items at a time."""
+    results = aio.gather([functools.partial(function, item) for item in items],
+                         concurrency=BATCH_CONCURRENCY)
+    return [_error_result(result) if isinstance(result, Exception)
+            else {'status': 'success', 'result': result}
+            for result in results]
 
 
 def create_zone(request):
@@ -54,9 +520,36 @@ def create_zone(request):
         build_kwargs['masters'] = data['masters']
 
     zone = conn.dns.create_zone(**build_kwargs)
+    result_cache.invalidate(request, ZONES_PATH)
     return zone.to_dict()
 
 
+def _as_attribute(resource, key, value):
+    """Converts a value to the type of an attribute of an SDK resource."""
+    if not isinstance(resource, sdk_resource.Resource):
+        return value
+    try:
+        return getattr(type(resource).existing(**{key: value}), key)
+    except (TypeError, ValueError):
+        # Designate rejects the value, which is then not left out
+        return value
+
+
+def _changed_fields(resource, fields):
+    """Keep the fields whose value differs from the one of a resource."""
+    changed = {}
+    for key, value in fields.items():
+        current = getattr(resource, key, None)
+        compared = _as_attribute(resource, key, value)
+        if key == 'records':
+            if sorted(compared or []) == sorted(current or []):
+                continue
+        elif compared == current:
+            continue
+        changed[key] = value
+    return changed
+
+
 def update_zone(request, **kwargs):
     """Update zone."""
     data = request.DATA
@@ -69,29 +562,74 @@ def update_zone(request, **kwargs):
     )
     if data.get('description', None):
         build_kwargs['description'] = data['description']
+    zone = conn.dns.get_zone(zone_id)
+    build_kwargs = _changed_fields(zone, build_kwargs)
+    if not build_kwargs:
+        return zone.to_dict()
     zone = conn.dns.update_zone(
         zone_id, **build_kwargs)
+    result_cache.invalidate(request, ZONES_PATH)
     return zone.to_dict()
 
 
+def delete_zones(request):
+    """Delete the zones whose ids are listed in ``request.DATA``."""
+    zone_ids = request.DATA
+    if not isinstance(zone_ids, list):
+        raise rest_utils.AjaxError(400, 'the zone ids must be a list')
+
+    conn = get_sdk_connection(request)
+
+    def run(zone_id):
+        conn.dns.delete_zone(zone_id, ignore_missing=True)
+
+    results = _run_batch(zone_ids, run)
+    result_cache.invalidate(
+        request, ZONES_PATH,
+        *[RECORDSETS_PATH % zone_id for zone_id in zone_ids])
+    for zone_id, result in zip(zone_ids, results):
+        result['id'] = zone_id
+    result_cache.record_deleted(
+        request, ZONES_PATH,
+        [result['id'] for result in results if result['status'] == 'success'])
+    return {'results': results}
+
+
 @urls.register
 class Zones(generic.View):
     """API for zones."""
 
     url_regex = r'dns/v2/zones/$'
 
+    @streaming
     @rest_utils.ajax()
     def get(self, request):
         """List zones for current project."""
+        filters = _get_filters(request, ZONE_FILTERS)
+        if _is_true(request.GET.get(ALL_REGIONS_KEYWORD)):
+            zones, markers = _list_all_regions(
+                request, lambda conn: _iter_resources(
+                    conn, _zone.Zone,
+                    _list_pages(request, conn, ZONES_PATH, 'zones',
+                                **filters)))
+            return _list_response(request, 'zones', zones, markers)
+
         conn = get_sdk_connection(request)
-        zones = _sdk_object_to_list(conn.dns.zones())
-        return {'zones': zones}
+        zones, markers = _list_resources(
+            request, conn, _zone.Zone, ZONES_PATH, 'zones', **filters)
+        zones, markers = _list_changes(request, ZONES_PATH, zones, markers)
+        return _list_response(request, 'zones', zones, markers)
 
     @rest_utils.ajax(data_required=True)
     def post(self, request):
         """Create zone."""
         return create_zone(request)
 
+    @rest_utils.ajax(data_required=True)
+    def delete(self, request):
+        """Delete multiple zones by id."""
+        return delete_zones(request)
+
 
 @urls.register
 class Zone(generic.View):
@@ -102,28 +640,27 @@ class Zone(generic.View):
     def get(self, request, zone_id):
         """Get zone."""
         conn = get_sdk_connection(request)
-        zone = conn.dns.find_zone(zone_id)
-        return zone.to_dict()
+        zone = result_cache.get_or_call(
+            request, ZONES_PATH, ['zone', zone_id],
+            lambda: conn.dns.find_zone(zone_id).to_dict())
+        return _resource_response(request, zone)
 
     @rest_utils.ajax(data_required=True)
     def patch(self, request, zone_id):
         """Edit zone."""
         kwargs = {'zone_id': zone_id}
-        update_zone(request, **kwargs)
+        return update_zone(request, **kwargs)
 
     @rest_utils.ajax()
     def delete(self, request, zone_id):
         """Delete zone."""
         conn = get_sdk_connection(request)
         conn.dns.delete_zone(zone_id, ignore_missing=True)
+        result_cache.invalidate(request, ZONES_PATH, RECORDSETS_PATH % zone_id)
+        result_cache.record_deleted(request, ZONES_PATH, [zone_id])
 
 
-def create_recordset(request, **kwargs):
-    """Create recordset."""
-    data = request.DATA
-    zone_id = kwargs.get('zone_id')
-
-    conn = get_sdk_connection(request)
+def _create_recordset(conn, zone_id, data):
     build_kwargs = dict(
         name=data['name'],
         type=data['type'],
@@ -138,14 +675,19 @@ def create_recordset(request, **kwargs):
     return rs.to_dict()
 
 
-def update_recordset(request, **kwargs):
-    """Update recordset."""
-    data = request.DATA
+def create_recordset(request, **kwargs):
+    """Create recordset."""
     zone_id = kwargs.get('zone_id')
-    rs_id = kwargs.get('rs_id')
 
     conn = get_sdk_connection(request)
+    rs = _create_recordset(conn, zone_id, request.DATA)
+    # The zone serial and status change along with its recordsets
+    result_cache.invalidate(request, ZONES_PATH, RECORDSETS_PATH % zone_id)
+    return rs
+
 
+def _update_recordset(conn, zone_id, rs_id, data, current=None):
+    """Update the fields of a recordset that differ from its current ones."""
     build_kwargs = dict()
     if data.get('description', None):
         build_kwargs['description'] = data['description']
@@ -154,16 +696,200 @@ def update_recordset(request, **kwargs):
     if data.get('records', None):
         build_kwargs['records'] = data['records']
 
+    if current is None:
+        current = conn.dns.get_recordset(rs_id, zone_id)
+    build_kwargs = _changed_fields(current, build_kwargs)
+    if not build_kwargs:
+        return current.to_dict()
+
     build_kwargs['zone_id'] = zone_id
     rs = conn.dns.update_recordset(
         rs_id, **build_kwargs)
     return rs.to_dict()
 
 
-def _populate_zone_id(items, zone_id):
-    for item in items:
-        item['zone_id'] = zone_id
-    return items
+def update_recordset(request, **kwargs):
+    """Update recordset."""
+    zone_id = kwargs.get('zone_id')
+    rs_id = kwargs.get('rs_id')
+
+    conn = get_sdk_connection(request)
+    rs = _update_recordset(conn, zone_id, rs_id, request.DATA)
+    result_cache.invalidate(request, ZONES_PATH, RECORDSETS_PATH % zone_id)
+    return rs
+
+
+def batch_recordsets(request, **kwargs):
+    """Create, update and delete recordsets of a zone in one request."""
+    zone_id = kwargs.get('zone_id')
+    data = request.DATA
+    operations = data.get('operations') if isinstance(data, dict) else None
+    if not isinstance(operations, list):
+        raise rest_utils.AjaxError(400, 'operations must be a list')
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            raise rest_utils.AjaxError(
+                400, 'operation %d must be an object' % index)
+        action = operation.get('action')
+        if action not in BATCH_ACTIONS:
+            raise rest_utils.AjaxError(
+                400, 'unknown action %s of operation %d' % (action, index))
+        if action != 'create' and not operation.get('id'):
+            raise rest_utils.AjaxError(
+                400, 'missing id of operation %d' % index)
+
+    conn = get_sdk_connection(request)
+
+    def run(operation):
+        action = operation['action']
+        try:
+            if action == 'create':
+                return _create_recordset(conn, zone_id, operation)
+            if action == 'update':
+                return _update_recordset(conn, zone_id, operation['id'],
+                                         operation)
+        except KeyError as e:
+            raise rest_utils.AjaxError(400, 'missing %s' % e)
+        conn.dns.delete_recordset(operation['id'], zone_id,
+                                  ignore_missing=True)
+
+    results = _run_batch(operations, run)
+    result_cache.invalidate(request, ZONES_PATH, RECORDSETS_PATH % zone_id)
+    for operation, result in zip(operations, results):
+        result['action'] = operation['action']
+        result['id'] = operation.get('id')
+        if result['action'] == 'create' and result['status'] == 'success':
+            result['id'] = result['result']['id']
+    result_cache.record_deleted(
+        request, RECORDSETS_PATH % zone_id,
+        [result['id'] for result in results
+         if result['action'] == 'delete' and result['status'] == 'success'])
+    return {'results': results}
+
+
+def _zonefile_chunks(lines):
+    chunk = []
+    size = 0
+    try:
+        for line in lines:
+            chunk.append(line)
+            size += len(line)
+            if size >= STREAM_CHUNK_SIZE:
+                yield ''.join(chunk)
+                chunk, size = [], 0
+    except Exception:
+        # Say so in the file rather than leave a valid looking zone file
+        # that lacks recordsets.
+        LOG.exception('error streaming zone file')
+        chunk.append('; ERROR: export failed, this zone file is incomplete\n')
+    yield ''.join(chunk)
+
+
+def export_zonefile(request, zone_id):
+    """Streams the recordsets of a zone as a BIND zone file."""
+    conn = get_sdk_connection(request)
+    zone = conn.dns.get_zone(zone_id)
+    pages = _prefetch(_list_pages(request, conn, RECORDSETS_PATH % zone_id,
+                                  'recordsets', limit=EXPORT_PAGE_SIZE))
+    lines = zonefile.write(zone.name, zone.ttl,
+                           itertools.chain.from_iterable(pages))
+    response = http.StreamingHttpResponse(_zonefile_chunks(lines),
+                                          content_type='text/dns')
+    response['Content-Disposition'] = (
+        'attachment; filename="%szone"' % zone.name)
+    return response
+
+
+def import_zonefile(request, zone_id):
+    """Creates or replaces recordsets of a zone from a BIND zone file."""
+    upload = request.FILES.get('file')
+    if upload is None:
+        raise rest_utils.AjaxError(400, 'file is required')
+
+    conn = get_sdk_connection(request)
+    zone = conn.dns.get_zone(zone_id)
+    summary = {'created': 0, 'updated': 0, 'skipped': 0, 'failed': 0,
+               'errors': []}
+    written = set()
+
+    def batches():
+        batch = []
+        keys = set()
+        recordsets = zonefile.group_recordsets(
+            zonefile.read(upload, zone.name))
+        try:
+            for recordset in recordsets:
+                key = (recordset['name'].lower(), recordset['type'])
+                if key[1] == 'SOA' or key == (zone.name.lower(), 'NS'):
+                    summary['skipped'] += 1
+                    continue
+                # The same name and type must not be written concurrently
+                if len(batch) >= IMPORT_BATCH_SIZE or key in keys:
+                    yield batch
+                    batch, keys = [], set()
+                batch.append(recordset)
+                keys.add(key)
+        except zonefile.ZoneFileError as e:
+            # Still write what was read before the error
+            summary['error'] = str(e)
+        if batch:
+            yield batch
+
+    def write(recordset):
+        try:
+            _create_recordset(conn, zone_id, recordset)
+            return 'created'
+        except sdk_exceptions.ConflictException:
+            # Designate takes '*' in the name filter as a wildcard, so a
+            # wildcard name may match other recordsets too
+            name = recordset['name'].lower()
+            existing = next((
+                candidate for candidate in conn.dns.recordsets(
+                    zone_id, name=recordset['name'], type=recordset['type'])
+                if candidate.name.lower() == name), None)
+            if existing is None:
+                raise
+        data = dict(recordset)
+        if (recordset['name'].lower(), recordset['type']) in written:
+            # Keep the records in order, without the ones already written
+            data['records'] = list(dict.fromkeys(
+                (existing.records or []) + recordset['records']))
+        _update_recordset(conn, zone_id, existing.id, data, current=existing)
+        return 'updated'
+
+    try:
+        for batch in batches():
+            for recordset, result in zip(batch, _run_batch(batch, write)):
+                written.add((recordset['name'].lower(), recordset['type']))
+                if result['status'] == 'success':
+                    summary[result['result']] += 1
+                    continue
+                summary['failed'] += 1
+                if len(summary['errors']) < IMPORT_MAX_ERRORS:
+                    summary['errors'].append({
+                        'name': recordset['name'],
+                        'type': recordset['type'],
+                        'error': result['error'],
+                        'code': result['code']})
+    finally:
+        result_cache.invalidate(request, ZONES_PATH, RECORDSETS_PATH % zone_id)
+    return summary
+
+
+@urls.register
+class ZoneFile(generic.View):
+    """API for BIND zone files of a zone."""
+    url_regex = r'dns/v2/zones/(?P<zone_id>[^/]+)/zonefile/$'
+
+    @file_view
+    def get(self, request, zone_id):
+        """Export zone file."""
+        return export_zonefile(request, zone_id)
+
+    @file_view
+    def post(self, request, zone_id):
+        """Import zone file."""
+        return import_zonefile(request, zone_id)
 
 
 @urls.register
@@ -171,12 +897,18 @@ class RecordSets(generic.View):
     """API for recordsets."""
     url_regex = r'dns/v2/zones/(?P<zone_id>[^/]+)/recordsets/$'
 
+    @streaming
     @rest_utils.ajax()
     def get(self, request, zone_id):
         """Get recordsets."""
+        path = RECORDSETS_PATH % zone_id
         conn = get_sdk_connection(request)
-        rsets = _sdk_object_to_list(conn.dns.recordsets(zone_id))
-        return {'recordsets': _populate_zone_id(rsets, zone_id)}
+        rsets, markers = _list_resources(
+            request, conn, _rs.Recordset, path, 'recordsets',
+            uri_attrs={'zone_id': zone_id},
+            **_get_filters(request, RECORDSET_FILTERS))
+        rsets, markers = _list_changes(request, path, rsets, markers)
+        return _list_response(request, 'recordsets', rsets, markers)
 
     @rest_utils.ajax(data_required=True)
     def post(self, request, zone_id):
@@ -184,6 +916,12 @@ class RecordSets(generic.View):
         kwargs = {'zone_id': zone_id}
         return create_recordset(request, **kwargs)
 
+    @rest_utils.ajax(data_required=True)
+    def patch(self, request, zone_id):
+        """Create, update and delete several recordsets."""
+        kwargs = {'zone_id': zone_id}
+        return batch_recordsets(request, **kwargs)
+
 
 @urls.register
 class RecordSet(generic.View):
@@ -194,22 +932,149 @@ class RecordSet(generic.View):
     def get(self, request, zone_id, rs_id):
         """Get recordset."""
         conn = get_sdk_connection(request)
-        rs = conn.dns.get_recordset(rs_id, zone_id)
-        rs_dict = rs.to_dict()
+        rs_dict = result_cache.get_or_call(
+            request, RECORDSETS_PATH % zone_id, ['recordset', rs_id],
+            lambda: conn.dns.get_recordset(rs_id, zone_id).to_dict())
         rs_dict['zone_id'] = zone_id
-        return rs_dict
+        return _resource_response(request, rs_dict)
 
     @rest_utils.ajax(data_required=True)
     def put(self, request, zone_id, rs_id):
         """Edit recordset."""
         kwargs = {'zone_id': zone_id, 'rs_id': rs_id}
-        update_recordset(request, **kwargs)
+        rs_dict = update_recordset(request, **kwargs)
+        rs_dict['zone_id'] = zone_id
+        return rs_dict
 
     @rest_utils.ajax()
     def delete(self, request, zone_id, rs_id):
         """Delete recordset."""
         conn = get_sdk_connection(request)
         conn.dns.delete_recordset(rs_id, zone_id, ignore_missing=True)
+        result_cache.invalidate(request, ZONES_PATH, RECORDSETS_PATH % zone_id)
+        result_cache.record_deleted(request, RECORDSETS_PATH % zone_id,
+                                    [rs_id])
+
+
+@contextlib.contextmanager
+def _status_wait(request):
+    """Yields whether the session may hold one more waiting status request."""
+    cache = django_cache.caches[result_cache.CACHE_ALIAS]
+    key = 'designatedashboard:status:%s' % hashlib.sha1(
+        str(request.session.session_key).encode('utf-8')).hexdigest()
+    # The count expires in case a worker dies while waiting
+    cache.add(key, 0, STATUS_WAIT + 60)
+    try:
+        count = cache.incr(key)
+    except ValueError:
+        # The count expired in the meantime
+        yield False
+        return
+    try:
+        yield count <= STATUS_MAX_WAITS
+    finally:
+        try:
+            cache.decr(key)
+        except ValueError:
+            pass
+
+
+def watch_status(request):
+    """Waits for pending zones and recordsets to change status."""
+    data = request.DATA
+    watched = collections.defaultdict(set)
+    try:
+        watched[None].update(data.get('zones') or [])
+        for recordset in data.get('recordsets') or []:
+            watched[recordset['zone_id']].add(recordset['id'])
+        timeout = max(min(float(data.get('timeout', STATUS_WAIT)),
+                          STATUS_WAIT), 0)
+    except (KeyError, TypeError, ValueError) as e:
+        raise rest_utils.AjaxError(400, 'invalid request: %s' % e)
+    # The zones are watched under None, the recordsets under their zone id
+    scopes = [scope for scope in watched if watched[scope]]
+
+    conn = get_sdk_connection(request)
+
+    def pending(scope):
+        if scope is None:
+            path, key = ZONES_PATH, 'zones'
+        else:
+            path, key = RECORDSETS_PATH % scope, 'recordsets'
+        try:
+            return {item['id']
+                    for page in _list_pages(request, conn, path, key,
+                                            cache=False, status='PENDING')
+                    for item in page}
+        except sdk_exceptions.NotFoundException:
+            # The zone is gone, and its recordsets with it
+            return set()
+
+    with _status_wait(request) as may_wait:
+        deadline = time.monotonic() + (timeout if may_wait else 0)
+        while scopes:
+            results = aio.gather([functools.partial(pending, scope)
+                                  for scope in scopes])
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+            changed = {scope: watched[scope] - result
+                       for scope, result in zip(scopes, results)}
+            if (any(changed.values()) or
+                    time.monotonic() + STATUS_POLL_INTERVAL > deadline):
+                break
+            time.sleep(STATUS_POLL_INTERVAL)
+        else:
+            changed = {}
+
+    def get(scope, resource_id):
+        try:
+            if scope is None:
+                return conn.dns.get_zone(resource_id).to_dict()
+            recordset = conn.dns.get_recordset(resource_id, scope).to_dict()
+            recordset['zone_id'] = scope
+            return recordset
+        except sdk_exceptions.NotFoundException:
+            return None
+
+    calls = [(scope, resource_id) for scope, ids in changed.items()
+             for resource_id in ids]
+    results = aio.gather([functools.partial(get, scope, resource_id)
+                          for scope, resource_id in calls],
+                         concurrency=BATCH_CONCURRENCY)
+    status = {'zones': [], 'recordsets': [],
+              'deleted': {'zones': [], 'recordsets': []}}
+    for (scope, resource_id), result in zip(calls, results):
+        if isinstance(result, Exception):
+            raise result
+        if scope is None:
+            if result is None:
+                status['deleted']['zones'].append(resource_id)
+            else:
+                status['zones'].append(result)
+        elif result is None:
+            status['deleted']['recordsets'].append(
+                {'zone_id': scope, 'id': resource_id})
+        else:
+            status['recordsets'].append(result)
+
+    # Cached listings still show the resources as pending
+    if calls:
+        result_cache.invalidate(request, ZONES_PATH, *[
+            RECORDSETS_PATH % scope for scope in changed
+            if scope is not None and changed[scope]])
+    return status
+
+
+@urls.register
+class Status(generic.View):
+    """API for status changes of pending resources."""
+    url_regex = r'dns/v2/status/$'
+
+    @rest_utils.ajax(data_required=True)
+    def post(self, request):
+        """Wait for pending zones and recordsets to change status."""
+        return watch_status(request)
 
 
 @urls.register
@@ -217,12 +1082,102 @@ class DnsFloatingIps(generic.View):
     """API for floatingips."""
     url_regex = r'dns/v2/reverse/floatingips/$'
 
+    @streaming
     @rest_utils.ajax()
     def get(self, request):
         """Get floatingips."""
+        filters = _get_filters(request, FLOATINGIP_FILTERS)
+        owners = _is_true(request.GET.get(OWNERS_KEYWORD))
+
+        def list_region(conn, pages=None):
+            pages = pages or _list_pages(request, conn, FLOATINGIPS_PATH,
+                                         'floatingips')
+            return _match_filters(
+                _iter_resources(conn, _fip.FloatingIP, pages), filters)
+
+        if _is_true(request.GET.get(ALL_REGIONS_KEYWORD)):
+            if owners:
+                fips, markers = _list_all_regions(
+                    request, list_region,
+                    functools.partial(_neutron_calls, request), _join_owners)
+            else:
+                fips, markers = _list_all_regions(request, list_region)
+            return _list_response(request, 'floatingips', fips, markers)
+        if owners:
+            conn = get_sdk_connection(request)
+            fips = _add_owners(request, lambda: list(list_region(conn)))
+            return _list_response(request, 'floatingips', fips)
+
         conn = get_sdk_connection(request)
-        fips = _sdk_object_to_list(conn.dns.floating_ips())
-        return {'floatingips': fips}
+        pages = _prefetch(_list_pages(request, conn, FLOATINGIPS_PATH,
+                                      'floatingips'))
+        return _list_response(request, 'floatingips',
+                              list_region(conn, pages))
+
+    @rest_utils.ajax(data_required=True)
+    def patch(self, request):
+        """Set or unset the PTR records of several floating IPs."""
+        return batch_dns_floatingips(request)
+
+
+def _neutron_owners(neutron_fips, ports):
+    """Indexes the owners of Neutron floating IPs by floating IP id."""
+    ports_by_id = {port['id']: port for port in ports}
+    owners = {}
+    for fip in neutron_fips:
+        port = ports_by_id.get(fip.get('port_id')) or {}
+        owners[fip['id']] = {
+            'floating_network_id': fip.get('floating_network_id'),
+            'fixed_ip_address': fip.get('fixed_ip_address'),
+            'port_id': fip.get('port_id'),
+            'port_name': port.get('name'),
+            'device_id': port.get('device_id'),
+            'device_owner': port.get('device_owner'),
+        }
+    return owners
+
+
+def _neutron_calls(request, region=None):
+    """Returns the call getting the owners of the Neutron floating IPs."""
+    project_id = request.user.project_id
+
+    def list_owners():
+        conn = get_sdk_connection(request, region)
+        fips = [fip.to_dict()
+                for fip in conn.network.ips(project_id=project_id)]
+        port_ids = sorted({fip['port_id'] for fip in fips
+                           if fip.get('port_id')})
+        ports = []
+        for start in range(0, len(port_ids), PORT_FILTER_SIZE):
+            ports.extend(port.to_dict() for port in conn.network.ports(
+                id=port_ids[start:start + PORT_FILTER_SIZE]))
+        return _neutron_owners(fips, ports)
+
+    return [list_owners]
+
+
+def _join_owners(region, fips, neutron_results):
+    """Adds the Neutron port owning each floating IP of a listing."""
+    owners = neutron_results[0]
+    if isinstance(owners, Exception):
+        LOG.warning('Unable to list the floating IP owners of region %s: %r',
+                    region, owners)
+        owners = {}
+
+    for fip in fips:
+        owner = owners.get(fip['id'].split(':', 1)[-1], {})
+        for field in OWNER_FIELDS:
+            fip[field] = owner.get(field)
+    return fips
+
+
+def _add_owners(request, list_fips):
+    """Lists the floating IPs of the current region with their owners."""
+    results = aio.gather([list_fips] + _neutron_calls(request))
+    if isinstance(results[0], Exception):
+        raise results[0]
+    return _join_owners(request.user.services_region, results[0],
+                        results[1:])
 
 
 def update_dns_floatingip(request, **kwargs):
@@ -242,9 +1197,89 @@ def update_dns_floatingip(request, **kwargs):
 
     fip = conn.dns.update_floating_ip(
         fip_id, **build_kwargs)
+    result_cache.invalidate(request, FLOATINGIPS_PATH)
     return fip.to_dict()
 
 
+def _ptr_placeholders(address):
+    """Returns the values of the placeholders of PTR name templates."""
+    ip = ipaddress.ip_address(address)
+    full = ip.exploded if ip.version == 6 else str(ip)
+    return {
+        'ip': str(ip),
+        'ip_dashed': full.replace('.', '-').replace(':', '-'),
+        'ip_reversed': ip.reverse_pointer.rsplit('.', 2)[0],
+    }
+
+
+def _expand_ptr_template(template, address):
+    """Makes the PTR domain name of an address from a template."""
+    placeholders = _ptr_placeholders(address)
+    parts = []
+    try:
+        for literal, name, spec, conversion in string.Formatter().parse(
+                template):
+            parts.append(literal)
+            if name is None:
+                continue
+            if name not in placeholders or spec or conversion:
+                raise ValueError('unknown placeholder {%s}' % name)
+            parts.append(placeholders[name])
+    except ValueError as e:
+        raise ValueError('invalid template: %s' % e)
+    ptrdname = ''.join(parts)
+    if not ptrdname.endswith('.'):
+        raise ValueError('domain name %s does not end with "."' % ptrdname)
+    if len(ptrdname) - 1 > MAX_NAME_LENGTH:
+        raise ValueError('domain name %s is too long' % ptrdname)
+    for label in ptrdname[:-1].split('.'):
+        if not label or len(label) > MAX_LABEL_LENGTH:
+            raise ValueError('domain name %s has an invalid label "%s"' %
+                             (ptrdname, label))
+    return ptrdname
+
+
+def batch_dns_floatingips(request):
+    """Set or unset the PTR records of several floating IPs."""
+    data = request.DATA
+    fip_ids = data.get('ids')
+    if not isinstance(fip_ids, list):
+        raise rest_utils.AjaxError(400, 'ids must be a list')
+    template = data.get('template')
+    if template:
+        if not isinstance(template, str):
+            raise rest_utils.AjaxError(400, 'template must be a string')
+        try:
+            _expand_ptr_template(template, PTR_TEMPLATE_EXAMPLE)
+        except ValueError as e:
+            raise rest_utils.AjaxError(400, str(e))
+
+    conn = get_sdk_connection(request)
+
+    def run(fip_id):
+        fip = conn.dns.get_floating_ip(fip_id)
+        build_kwargs = dict(ptrdname=None)
+        if template:
+            try:
+                build_kwargs['ptrdname'] = _expand_ptr_template(template,
+                                                                fip.address)
+            except ValueError as e:
+                raise rest_utils.AjaxError(400, str(e))
+            if data.get('description', None):
+                build_kwargs['description'] = data['description']
+            if data.get('ttl', None):
+                build_kwargs['ttl'] = data['ttl']
+        if not _changed_fields(fip, build_kwargs):
+            return fip.to_dict()
+        return conn.dns.update_floating_ip(fip_id, **build_kwargs).to_dict()
+
+    results = _run_batch(fip_ids, run)
+    result_cache.invalidate(request, FLOATINGIPS_PATH)
+    for fip_id, result in zip(fip_ids, results):
+        result['id'] = fip_id
+    return {'results': results}
+
+
 @urls.register
 class DnsFloatingIp(generic.View):
     """API for dns floatingip."""
@@ -254,11 +1289,13 @@ class DnsFloatingIp(generic.View):
     def get(self, request, fip_id):
         """Get floatingip."""
         conn = get_sdk_connection(request)
-        fip = conn.dns.get_floating_ip(fip_id)
-        return fip.to_dict()
+        fip = result_cache.get_or_call(
+            request, FLOATINGIPS_PATH, ['floatingip', fip_id],
+            lambda: conn.dns.get_floating_ip(fip_id).to_dict())
+        return _resource_response(request, fip)
 
     @rest_utils.ajax(data_required=True)
     def patch(self, request, fip_id):
         """Edit floatingip."""
         kwargs = {'fip_id': fip_id}
-        update_dns_floatingip(request, **kwargs)
+        return update_dns_floatingip(request, **kwargs)
@@ -0,0 +1,229 @@
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+"""Short lived cache of Designate read results, shared between workers.
+
+Concurrent identical reads in a process are coalesced: the first one calls
+Designate and the others wait for its result instead of making the same
+call. This can be turned off with ``DESIGNATE_COALESCE_READS = False``.
+
+Results are cached with Django's cache framework per project, region and
+scope. A scope is the Designate collection path the result comes from, for
+example ``/zones`` or ``/zones/<zone_id>/recordsets``. Every scope has a
+generation token that is part of the cache keys of its results, so a scope
+is invalidated by replacing its token.
+
+The cache is disabled unless ``DESIGNATE_RESULT_CACHE_TIMEOUT`` is set to a
+number of seconds. ``DESIGNATE_RESULT_CACHE`` names the Django cache to use.
+
+The same cache holds a journal of the resources deleted through the
+dashboard in each scope, kept for ``DESIGNATE_DELETE_JOURNAL_TTL`` seconds,
+which lets listings report the deletions since a point in time.
+"""
+import hashlib
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core import cache as django_cache
+from oslo_serialization import jsonutils
+
+
+TIMEOUT = getattr(settings, 'DESIGNATE_RESULT_CACHE_TIMEOUT', 0)
+CACHE_ALIAS = getattr(settings, 'DESIGNATE_RESULT_CACHE', 'default')
+COALESCE_READS = getattr(settings, 'DESIGNATE_COALESCE_READS', True)
+JOURNAL_TTL = getattr(settings, 'DESIGNATE_DELETE_JOURNAL_TTL', 3600)
+# Number of deletions kept in the journal of a scope
+JOURNAL_SIZE = 1000
+
+_MISSING = object()
+
+
+class _Flight(object):
+    """A call in progress and, once done, its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Lets concurrent calls with the same key share a single call.
+
+    Keys are tuples whose first item is the scope key, so that all the calls
+    of a scope can be forgotten when it is invalidated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, function):
+        """Returns the result of function, or of the same call in progress.
+
+        Errors raised by the call are raised in every caller sharing it.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = function()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def forget(self, scope_key):
+        """Makes later calls of a scope start over.
+
+        Calls in progress may return data from before a change, so later
+        calls do not share them.
+        """
+        with self._lock:
+            for key in [key for key in self._flights if key[0] == scope_key]:
+                del self._flights[key]
+
+
+_flights = SingleFlight()
+
+
+def is_enabled():
+    return bool(TIMEOUT) and TIMEOUT > 0
+
+
+def _get_cache():
+    return django_cache.caches[CACHE_ALIAS]
+
+
+def _scope_key(request, scope, region_name=None):
+    return _make_key('scope', request.user.project_id,
+                     region_name or request.user.services_region, scope)
+
+
+def _make_key(*parts):
+    # Hash the parts to keep the keys short and free of characters that
+    # memcached does not accept.
+    digest = hashlib.sha1(jsonutils.dumps(
+        parts, sort_keys=True).encode('utf-8')).hexdigest()
+    return 'designatedashboard:%s' % digest
+
+
+def _generation(cache, scope_key):
+    generation = cache.get(scope_key)
+    if generation is None:
+        # The first worker to get here sets the token, add() does not
+        # overwrite one set in the meantime by another worker.
+        cache.add(scope_key, uuid.uuid4().hex, None)
+        generation = cache.get(scope_key)
+    return generation
+
+
+def _call(scope_key, key, function):
+    if not COALESCE_READS:
+        return function()
+    return _flights.do((scope_key, key), function)
+
+
+def get_or_call(request, scope, key, function, region_name=None):
+    """Returns the cached result for key, calling function on a miss.
+
+    Concurrent calls for the same key share a single call of function.
+
+    :param request: Django request object
+    :param scope: Collection path the result belongs to
+    :param key: JSON serializable data identifying the result in its scope,
+        such as the query parameters of a listing
+    :param function: Called without arguments to compute the result, which
+        must be picklable
+    :param region_name: Region the result comes from, defaults to the
+        region selected by the user
+    :returns: The result
+    """
+    scope_key = _scope_key(request, scope, region_name)
+    if not is_enabled():
+        return _call(scope_key, _make_key('result', key), function)
+    cache = _get_cache()
+    cache_key = _make_key('result', _generation(cache, scope_key), key)
+    result = cache.get(cache_key, _MISSING)
+    if result is _MISSING:
+        def call_and_set():
+            value = function()
+            cache.set(cache_key, value, TIMEOUT)
+            return value
+        result = _call(scope_key, cache_key, call_and_set)
+    return result
+
+
+def invalidate(request, *scopes):
+    """Drops the cached results of the given scopes for the request project.
+
+    :param request: Django request object
+    :param scopes: Collection paths to invalidate
+    """
+    for scope in scopes:
+        scope_key = _scope_key(request, scope)
+        _flights.forget(scope_key)
+        if is_enabled():
+            _get_cache().set(scope_key, uuid.uuid4().hex, None)
+
+
+def _journal_key(request, scope):
+    return _make_key('journal', request.user.project_id,
+                     request.user.services_region, scope)
+
+
+def record_deleted(request, scope, ids):
+    """Notes in the journal of a scope that resources were deleted.
+
+    Workers update the journal without locking, so concurrent deletions may
+    drop each other's entries. The journal is only a hint: listings remain
+    the authority on which resources exist.
+
+    :param request: Django request object
+    :param scope: Collection path the resources belonged to
+    :param ids: Ids of the deleted resources
+    """
+    if not ids:
+        return
+    cache = _get_cache()
+    key = _journal_key(request, scope)
+    now = time.time()
+    entries = [entry for entry in cache.get(key, [])
+               if entry[0] > now - JOURNAL_TTL]
+    entries.extend([now, resource_id] for resource_id in ids)
+    cache.set(key, entries[-JOURNAL_SIZE:], JOURNAL_TTL)
+
+
+def deleted_since(request, scope, since):
+    """Returns the ids of the resources of a scope deleted since a time.
+
+    :param request: Django request object
+    :param scope: Collection path of the resources
+    :param since: Seconds since the epoch
+    :returns: List of the ids found in the journal
+    """
+    return [resource_id for deleted_at, resource_id
+            in _get_cache().get(_journal_key(request, scope), [])
+            if deleted_at >= since]
@@ -11,22 +11,151 @@
 #     WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #     License for the specific language governing permissions and limitations
 #     under the License.
+import collections
+import functools
+import threading
+import time
+
 from django.conf import settings
 
 import designatedashboard
+from keystoneauth1 import session as ks_session
 from openstack import config as occ
 from openstack import connection
+from openstack_auth import utils as auth_utils
+
+
+class ConnectionCache(object):
+    """Bounded, thread-safe LRU cache of SDK connections.
+
+    Each entry remembers the keystone token it was built from so that it is
+    dropped once that token is no longer valid.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+
+    def get(self, key):
+        """Return the cached connection for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            conn, token = entry
+            if not auth_utils.is_token_valid(token):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return conn
+
+    def set(self, key, conn, token):
+        """Store conn under key, evicting the least recently used entries."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            expired = [k for k, (c, t) in self._entries.items()
+                       if not auth_utils.is_token_valid(t)]
+            for k in expired:
+                del self._entries[k]
+            self._entries[key] = (conn, token)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                # NOTE: evicted connections are not closed here as another
+                # thread may still be in the middle of a call with them.
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
 
 
-def get_sdk_connection(request):
-    """Creates an SDK connection based on the request.
+_connection_cache = ConnectionCache(
+    getattr(settings, 'DESIGNATE_SDK_CONNECTION_CACHE_SIZE', 128))
+
+
+def _connection_key(request, region_name, interface):
+    return (request.user.token.unscoped_token,
+            request.user.project_id,
+            region_name,
+            interface)
+
+
+def get_sdk_connection(request, region_name=None):
+    """Returns an SDK connection based on the request.
+
+    Connections are cached per token, project, region and interface so that
+    the keystone session, and with it the HTTP connection pool, is reused
+    between calls. The token independent parts of the cloud config are only
+    computed once per process.
 
     :param request: Django request object
+    :param region_name: Region to connect to, defaults to the region
+        selected by the user
     :returns: SDK connection object
     """
+    region_name = region_name or request.user.services_region
+    _config, template = _get_cloud_config_template()
+    key = _connection_key(request, region_name, template['interface'])
+    conn = _connection_cache.get(key)
+    if conn is None:
+        conn = _create_sdk_connection(request, region_name)
+        _connection_cache.set(key, conn, request.user.token)
+    return conn
+
+
+class DiscoveryCache(dict):
+    """Process-wide keystoneauth version discovery cache with a TTL.
+
+    keystoneauth only uses ``get`` and item assignment on discovery caches,
+    and it stores every hit back into the cache, so re-storing the same
+    document must not extend its lifetime.
+    """
+
+    def __init__(self, ttl):
+        super(DiscoveryCache, self).__init__()
+        self.ttl = ttl
+
+    def __setitem__(self, url, disc):
+        entry = super(DiscoveryCache, self).get(url)
+        if entry is not None and entry[1] is disc:
+            return
+        super(DiscoveryCache, self).__setitem__(
+            url, (time.monotonic() + self.ttl, disc))
+
+    def get(self, url, default=None):
+        entry = super(DiscoveryCache, self).get(url)
+        if entry is None:
+            return default
+        expires, disc = entry
+        if expires < time.monotonic():
+            self.pop(url, None)
+            return default
+        return disc
+
+
+_discovery_cache = DiscoveryCache(
+    getattr(settings, 'DESIGNATE_DISCOVERY_CACHE_TTL', 600))
+
+
+def _session_constructor(**kwargs):
+    # Share version discovery results for the DNS endpoint of each region
+    # between all the sessions of this process.
+    kwargs['discovery_cache'] = _discovery_cache
+    return ks_session.Session(**kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cloud_config_template():
+    """Returns the parts of the cloud config that are the same per process.
+
+    :returns: tuple of the OpenStackConfig loader and the keyword arguments
+        shared by every cloud config built from it
+    """
     # NOTE(mordred) Nothing says love like two inverted booleans
     # The config setting is NO_VERIFY which is, in fact, insecure.
-    # get_one_cloud wants verify, so we pass 'not insecure' to verify.
+    # get_one wants verify, so we pass 'not insecure' to verify.
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
     # Pass interface to honor 'OPENSTACK_ENDPOINT_TYPE'
@@ -34,17 +163,26 @@ def get_sdk_connection(request):
     # Pass load_yaml_config as this is a Django service with its own config
     # and we don't want to accidentally pick up a clouds.yaml file. We want to
     # use the settings we're passing in.
-    cloud_config = occ.OpenStackConfig(load_yaml_config=False).get_one_cloud(
+    config = occ.OpenStackConfig(load_yaml_config=False,
+                                 session_constructor=_session_constructor)
+    template = dict(
         verify=not insecure,
         cacert=cacert,
         interface=interface,
-        region_name=request.user.services_region,
         auth_type='token',
+        app_name='designate-dashboard',
+        app_version=designatedashboard.__version__)
+    return config, template
+
+
+def _create_sdk_connection(request, region_name):
+    config, template = _get_cloud_config_template()
+    cloud_config = config.get_one(
+        region_name=region_name,
         auth=dict(
             project_id=request.user.project_id,
             project_domain_id=request.user.domain_id,
             auth_token=request.user.token.unscoped_token,
             auth_url=request.user.endpoint),
-        app_name='designate-dashboard',
-        app_version=designatedashboard.__version__)
+        **template)
     return connection.from_config(cloud_config=cloud_config)
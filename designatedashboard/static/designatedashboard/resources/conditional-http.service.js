@@ -0,0 +1,112 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .factory('designatedashboard.resources.conditionalHttp', conditionalHttpService);
+
+  conditionalHttpService.$inject = [
+    '$httpParamSerializer',
+    '$q',
+    'horizon.framework.util.http.service'
+  ];
+
+  /*
+   * @ngdoc service
+   * @name designatedashboard.resources.conditionalHttp
+   * @description
+   * Sends GET requests with the ETag of the last response to the same URL in
+   * an If-None-Match header. When the API answers 304 Not Modified, the body
+   * of that last response is used again, so unchanged listings are neither
+   * sent nor parsed again.
+   * @returns {Object} The service
+   */
+  function conditionalHttpService($httpParamSerializer, $q, httpService) {
+    // Number of responses kept, the oldest ones are dropped first
+    var maxEntries = 50;
+    var entries = {};
+    var keys = [];
+
+    var service = {
+      get: get,
+      clear: clear
+    };
+
+    return service;
+
+    ///////////////
+
+    /*
+     * @param url {string}
+     * @param config {Object} The $http config. Optional.
+     * @returns {Promise} Resolved with the response, as with httpService.get
+     */
+    function get(url, config) {
+      var key = url + '?' + $httpParamSerializer((config || {}).params);
+      var entry = entries[key];
+      var requestConfig = angular.extend({}, config);
+      if (entry) {
+        requestConfig.headers = angular.extend(
+          {}, requestConfig.headers, {'If-None-Match': entry.etag});
+      }
+      return httpService.get(url, requestConfig).then(onSuccess, onError);
+
+      function onSuccess(response) {
+        var etag = response.headers('ETag');
+        if (etag) {
+          store(key, {etag: etag, data: angular.copy(response.data)});
+        } else {
+          remove(key);
+        }
+        return response;
+      }
+
+      function onError(response) {
+        if (response.status === 304 && entry) {
+          // Answer as if the stored body was sent again
+          response.status = 200;
+          response.data = angular.copy(entry.data);
+          return response;
+        }
+        return $q.reject(response);
+      }
+    }
+
+    /*
+     * Forget all the stored responses
+     */
+    function clear() {
+      entries = {};
+      keys = [];
+    }
+
+    function store(key, entry) {
+      remove(key);
+      entries[key] = entry;
+      keys.push(key);
+      if (keys.length > maxEntries) {
+        delete entries[keys.shift()];
+      }
+    }
+
+    function remove(key) {
+      if (entries.hasOwnProperty(key)) {
+        delete entries[key];
+        keys.splice(keys.indexOf(key), 1);
+      }
+    }
+  }
+}());
@@ -0,0 +1,102 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .factory('designatedashboard.resources.deltaList', deltaListService);
+
+  /*
+   * @ngdoc service
+   * @name designatedashboard.resources.deltaList
+   * @description
+   * Lists resources again by asking the API only for the changes since the last
+   * listing with the same params, with 'changed_since', and merging them into the
+   * items of that listing. Unchanged items keep their objects, so their table rows
+   * are kept as they are.
+   * @returns {Object} The service
+   */
+  function deltaListService() {
+    // The last listing of each key, with its params, timestamp and items
+    var listings = {};
+
+    var service = {
+      list: list
+    };
+
+    return service;
+
+    ///////////////
+
+    /*
+     * @param key {string} - Identifies the listing, such as the resource type name
+     * @param params {Object} - The API query parameters
+     * @param listCall {function} - Called with the API query parameters, returns the
+     * promise of the list API response
+     * @param itemsKey {string} - Key of the items in the list API response
+     * @returns {Promise} Resolved with the response, holding all the items as usual
+     */
+    function list(key, params, listCall, itemsKey) {
+      var last = listings[key];
+      var apiParams = params;
+      if (last && last.timestamp && angular.equals(last.params, params)) {
+        apiParams = angular.extend({changed_since: last.timestamp}, params);
+      }
+      delete listings[key];
+
+      return listCall(apiParams).then(function onList(response) {
+        var data = response.data;
+        if (data.delta) {
+          var items = merge(last.items, data, itemsKey);
+          if (!items) {
+            // Items came into the page that were not listed before
+            return list(key, params, listCall, itemsKey);
+          }
+          data[itemsKey] = items;
+        }
+        listings[key] = {
+          params: angular.copy(params),
+          timestamp: data.timestamp,
+          items: data[itemsKey]
+        };
+        return response;
+      });
+    }
+
+    /*
+     * @returns {Array} The merged items, or null when the former listing lacks some
+     */
+    function merge(items, data, itemsKey) {
+      var byId = {};
+      items.forEach(function addItem(item) {
+        byId[item.id] = item;
+      });
+      data[itemsKey].forEach(function addChange(item) {
+        byId[item.id] = item;
+      });
+
+      // The ids give the items of the listing and their order, which drops the
+      // items deleted since, wherever they were deleted from
+      var merged = [];
+      for (var index = 0; index < data.ids.length; index++) {
+        if (!byId.hasOwnProperty(data.ids[index])) {
+          return null;
+        }
+        merged.push(byId[data.ids[index]]);
+      }
+      return merged;
+    }
+  }
+}());
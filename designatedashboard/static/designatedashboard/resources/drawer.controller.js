@@ -0,0 +1,58 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .controller('designatedashboard.resources.drawerController', controller);
+
+  controller.$inject = [
+    '$attrs',
+    '$scope',
+    'horizon.framework.conf.resource-type-registry.service',
+    'horizon.framework.widgets.table.events'
+  ];
+
+  /*
+   * @ngdoc controller
+   * @name designatedashboard.resources.drawerController
+   * @description
+   * Loads the whole resource of a table row, whose listed item only holds the fields
+   * of the table, the first time its drawer is expanded. Rows are tracked by the
+   * content of their item, so a changed item gets a new drawer. The drawer element
+   * sets the "resource-type-name".
+   */
+  function controller($attrs, $scope, registry, tableEvents) {
+    var ctrl = this;
+    var resourceType = registry.getResourceType($attrs.resourceTypeName);
+
+    // The loaded resource, undefined until the drawer is expanded
+    ctrl.item = undefined;
+
+    $scope.$on(tableEvents.ROW_EXPANDED, onExpanded);
+
+    function onExpanded(event, item) {
+      if (item !== $scope.item || ctrl.item) {
+        return;
+      }
+      resourceType.load(resourceType.parsePath(resourceType.path(item)))
+        .then(function onLoad(response) {
+          if (response && response.data) {
+            ctrl.item = response.data;
+          }
+        });
+    }
+  }
+})();
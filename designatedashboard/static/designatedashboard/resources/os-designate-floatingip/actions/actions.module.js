@@ -34,10 +34,11 @@
     'horizon.framework.conf.resource-type-registry.service',
     'designatedashboard.resources.os-designate-floatingip.resourceType',
     'designatedashboard.resources.os-designate-floatingip.actions.set',
-    'designatedashboard.resources.os-designate-floatingip.actions.unset'
+    'designatedashboard.resources.os-designate-floatingip.actions.unset',
+    'designatedashboard.resources.os-designate-floatingip.actions.batch-set'
   ];
 
-  function run(registry, resourceTypeString, setAction, unsetAction) {
+  function run(registry, resourceTypeString, setAction, unsetAction, batchSetAction) {
     var resourceType = registry.getResourceType(resourceTypeString);
 
     resourceType
@@ -56,6 +57,23 @@
           text: gettext('Unset')
         }
       });
+
+    resourceType
+      .batchActions
+      .append({
+        id: 'batchSetFloatingIps',
+        service: batchSetAction,
+        template: {
+          text: gettext('Set Domain Name PTRs')
+        }
+      })
+      .append({
+        id: 'batchUnsetFloatingIps',
+        service: unsetAction,
+        template: {
+          text: gettext('Unset Domain Name PTRs')
+        }
+      });
   }
 
 })();
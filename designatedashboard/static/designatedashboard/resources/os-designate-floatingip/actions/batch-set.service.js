@@ -0,0 +1,173 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources.os-designate-floatingip.actions')
+    .factory('designatedashboard.resources.os-designate-floatingip.actions.batch-set', action);
+
+  action.$inject = [
+    '$q',
+    'designatedashboard.resources.os-designate-floatingip.api',
+    'designatedashboard.resources.os-designate-floatingip.resourceType',
+    'designatedashboard.resources.util',
+    'horizon.app.core.openstack-service-api.serviceCatalog',
+    'horizon.framework.widgets.form.ModalFormService',
+    'horizon.framework.widgets.toast.service',
+    'horizon.framework.widgets.modal-wait-spinner.service'
+  ];
+
+  /*
+   * @ngDoc factory
+   * @name designatedashboard.resources.os-designate-floatingip.actions.batch-set
+   *
+   * @Description
+   * Brings up the Set Domain Name PTRs modal, which sets the PTR records of the
+   * selected floating IPs from a domain name template in one request. The floating IPs
+   * returned by the API are shown in their table rows right away.
+   */
+  function action($q,
+                  api,
+                  resourceType,
+                  util,
+                  serviceCatalog,
+                  schemaFormModalService,
+                  toast,
+                  waitSpinner) {
+    var dnsServiceEnabled;
+    var title = gettext("Set Domain Name PTRs");
+    var formConfig = {
+      title: title,
+      schema: {
+        type: "object",
+        properties: {
+          template: {
+            type: "string",
+            pattern: /^.+\.$/
+          },
+          description: {
+            type: "string"
+          },
+          ttl: {
+            type: "integer",
+            minimum: 0,
+            maximum: 2147483647
+          }
+        }
+      },
+      form: [
+        {
+          key: "template",
+          title: gettext("Domain Name Template"),
+          description: gettext("Domain name ending in '.', where {ip} is replaced by the " +
+                               "address, {ip_dashed} by the address with dashes instead " +
+                               "of dots and {ip_reversed} by the labels of its reverse name."),
+          validationMessage: gettext("Domain must end with '.'"),
+          placeholder: "{ip_dashed}.hosts.example.com.",
+          type: "text",
+          required: true
+        },
+        {
+          key: "description",
+          type: "textarea",
+          title: gettext("Description"),
+          description: gettext("Details about the PTR records.")
+        },
+        {
+          key: "ttl",
+          title: gettext("TTL"),
+          description: gettext("Time To Live in seconds."),
+          type: "number"
+        }
+      ]
+    };
+
+    var message = {
+      success: gettext('Domain name PTRs set for %s floating IPs.'),
+      failed: gettext('Unable to set the domain name PTR of %(count)s floating IPs, ' +
+                      'the first one failed with: %(error)s')
+    };
+
+    var service = {
+      initAction: initAction,
+      allowed: allowed,
+      perform: perform
+    };
+
+    return service;
+
+    /////////////////
+
+    function initAction() {
+      dnsServiceEnabled = serviceCatalog.ifTypeEnabled('dns');
+    }
+
+    function allowed(item) {
+      // only batch actions, with no item
+      if (item) {
+        return false;
+      }
+      return dnsServiceEnabled;
+    }
+
+    function perform(items) {
+      var floatingIps = angular.isArray(items) ? items : [items];
+      floatingIps = floatingIps.filter(function isEditable(item) {
+        return item.status !== 'PENDING' && !item._otherRegion;
+      });
+      formConfig.model = {ttl: 3600};
+      return schemaFormModalService.open(formConfig)
+        .then(onSubmit.bind(null, floatingIps), onCancel);
+    }
+
+    function onSubmit(floatingIps, context) {
+      var ids = floatingIps.map(function getId(item) {
+        return item.id;
+      });
+
+      waitSpinner.showModalSpinner(title);
+      return api.batch(ids, angular.copy(context.model))
+        .then(onSuccess.bind(null, floatingIps), onFailure);
+    }
+
+    function onCancel() {
+      waitSpinner.hideModalSpinner();
+    }
+
+    function onSuccess(floatingIps, response) {
+      waitSpinner.hideModalSpinner();
+      if (!response) {
+        return $q.reject();
+      }
+
+      var results = response.data.results;
+      var failed = util.updateBatchItems(floatingIps, results);
+      if (results.length > failed.length) {
+        toast.add('success', interpolate(message.success, [results.length - failed.length]));
+      }
+      if (failed.length > 0) {
+        toast.add('error', interpolate(
+          message.failed, {count: failed.length, error: failed[0].error}, true));
+      }
+
+      return util.inPlaceResult(resourceType, failed);
+    }
+
+    function onFailure() {
+      waitSpinner.hideModalSpinner();
+    }
+  }
+})();
@@ -25,7 +25,6 @@
   action.$inject = [
     '$q',
     'designatedashboard.resources.os-designate-floatingip.api',
-    'designatedashboard.resources.os-designate-floatingip.resourceType',
     'designatedashboard.resources.util',
     'horizon.app.core.openstack-service-api.serviceCatalog',
     'horizon.framework.widgets.form.ModalFormService',
@@ -38,11 +37,11 @@
    * @name designatedashboard.resources.os-designate-floatingip.actions.set
    *
    * @Description
-   * Brings up the Set Floating IP modal.
+   * Brings up the Set Floating IP modal. The floating IP returned by the API is shown
+   * in its table row right away, without listing the floating IPs again.
    */
   function action($q,
                   api,
-                  resourceTypeName,
                   util,
                   serviceCatalog,
                   schemaFormModalService,
@@ -115,7 +114,8 @@
       return $q.all([
         // TODO (tyr) designate currently has no floating ips policy rules
         dnsServiceEnabled,
-        util.notPending(item)
+        util.notPending(item),
+        util.inCurrentRegion(item)
       ]);
     }
 
@@ -133,34 +133,28 @@
       // Remember the ID for use during submit
       formConfig.model.floatingIpId = item.id;
 
-      return schemaFormModalService.open(formConfig).then(onSubmit, onCancel);
+      return schemaFormModalService.open(formConfig).then(onSubmit.bind(null, item), onCancel);
     }
 
-    function onSubmit(context) {
+    function onSubmit(item, context) {
       var model = angular.copy(context.model);
       var floatingIpId = formConfig.model.floatingIpId;
 
       waitSpinner.showModalSpinner(title);
-      return api.set(floatingIpId, model).then(onSuccess, onFailure);
+      return api.set(floatingIpId, model).then(onSuccess.bind(null, item), onFailure);
     }
 
     function onCancel() {
       waitSpinner.hideModalSpinner();
     }
 
-    function onSuccess(response) {
+    function onSuccess(item, response) {
       waitSpinner.hideModalSpinner();
-      var floatingIp = response.data;
       toast.add('success', message.success);
 
-      // To make the result of this action generically useful, reformat the return
-      // from the deleteModal into a standard form
-      return {
-        created: [],
-        updated: [{type: resourceTypeName, id: floatingIp.id}],
-        deleted: [],
-        failed: []
-      };
+      util.updateItem(item, response.data);
+
+      return util.inPlaceResult();
     }
 
     function onFailure() {
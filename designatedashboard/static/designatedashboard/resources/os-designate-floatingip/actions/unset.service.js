@@ -39,11 +39,14 @@
    * @name designatedashboard.resources.os-designate-floatingip.actions.unset
    *
    * @Description
-   * Brings up the Unset Floating IP modal.
+   * Brings up the Unset Floating IP modal, for one floating IP or, as a batch action,
+   * all the selected ones that have a PTR record. The PTR records are unset with the
+   * batch API, and the floating IPs it returns are shown in their table rows right away,
+   * without listing the floating IPs again.
    */
   function action($q,
                   api,
-                  resourceTypeName,
+                  resourceType,
                   util,
                   serviceCatalog,
                   $qExtensions,
@@ -51,9 +54,7 @@
                   toast,
                   waitSpinner) {
     var title = null; // Set on perform
-    // currentFloatingIpId is used to remember the ID we are modifying since
-    // it isn't returned by the unset API call
-    var dnsServiceEnabled, currentFloatingIpId;
+    var dnsServiceEnabled;
 
     // Unset it just a simple case of "set", but with ptrdname of 'null'
     var formConfig = {
@@ -69,7 +70,10 @@
     };
 
     var message = {
-      success: gettext('Domain name PTR successfully unset.')
+      success: gettext('Domain name PTR successfully unset.'),
+      successMany: gettext('Domain name PTRs unset for %s floating IPs.'),
+      failed: gettext('Unable to unset the domain name PTR of %(count)s floating IPs, ' +
+                      'the first one failed with: %(error)s')
     };
 
     var service = {
@@ -87,11 +91,16 @@
     }
 
     function allowed(item) {
+      // batch actions pass no item
+      if (!item) {
+        return dnsServiceEnabled;
+      }
       return $q.all([
         // TODO (tyr) designate currently has no floating ip policy rules
         dnsServiceEnabled,
         domainNameSet(item),
-        util.notPending(item)
+        util.notPending(item),
+        util.inCurrentRegion(item)
       ]);
     }
 
@@ -101,36 +110,56 @@
       );
     }
 
-    function perform(item) {
-      title = gettext("Unset Domain Name PTR for ") + item.address;
-      // Store the zone ID so it can be used on submit
-      formConfig.model.floatingIpId = item.id;
+    function perform(items) {
+      var floatingIps = angular.isArray(items) ? items : [items];
+      floatingIps = floatingIps.filter(function isUnsettable(item) {
+        return angular.isString(item.ptrdname) && item.status !== 'PENDING' &&
+          !item._otherRegion;
+      });
+      if (angular.isArray(items)) {
+        title = gettext("Unset Domain Name PTRs");
+      } else {
+        title = gettext("Unset Domain Name PTR for ") + items.address;
+      }
       formConfig.title = title;
-      return schemaFormModalService.open(formConfig).then(onSubmit, onCancel);
+      return schemaFormModalService.open(formConfig)
+        .then(onSubmit.bind(null, floatingIps), onCancel);
     }
 
-    function onSubmit(context) {
+    function onSubmit(floatingIps) {
+      var ids = floatingIps.map(function getId(item) {
+        return item.id;
+      });
+
       waitSpinner.showModalSpinner(title);
-      currentFloatingIpId = context.model.floatingIpId;
-      return api.unset(currentFloatingIpId).then(onSuccess, onFailure);
+      return api.batch(ids, {template: null})
+        .then(onSuccess.bind(null, floatingIps), onFailure);
     }
 
     function onCancel() {
       waitSpinner.hideModalSpinner();
     }
 
-    function onSuccess() {
+    function onSuccess(floatingIps, response) {
       waitSpinner.hideModalSpinner();
-      toast.add('success', message.success);
-
-      // To make the result of this action generically useful, reformat the return
-      // from the deleteModal into a standard form
-      return {
-        created: [],
-        updated: [{type: resourceTypeName, id: currentFloatingIpId}],
-        deleted: [],
-        failed: []
-      };
+      if (!response) {
+        return $q.reject();
+      }
+
+      var results = response.data.results;
+      var failed = util.updateBatchItems(floatingIps, results);
+      var unset = results.length - failed.length;
+      if (unset === 1 && results.length === 1) {
+        toast.add('success', message.success);
+      } else if (unset > 0) {
+        toast.add('success', interpolate(message.successMany, [unset]));
+      }
+      if (failed.length > 0) {
+        toast.add('error', interpolate(
+          message.failed, {count: failed.length, error: failed[0].error}, true));
+      }
+
+      return util.inPlaceResult(resourceType, failed);
     }
 
     function onFailure() {
@@ -22,24 +22,35 @@
 
   apiService.$inject = [
     'designatedashboard.apiPassthroughUrl',
+    'designatedashboard.resources.conditionalHttp',
+    'designatedashboard.resources.responseCache',
     'horizon.framework.util.http.service',
     'horizon.framework.widgets.toast.service'
   ];
 
   /*
    * @ngdoc service
+   * @param {Object} conditionalHttp
+   * @param {Object} responseCache
    * @param {Object} httpService
    * @param {Object} toastService
    * @name apiService
    * @description Provides direct access to Designate Floating IP APIs.
    * @returns {Object} The service
    */
-  function apiService(apiPassthroughUrl, httpService, toastService) {
+  function apiService(apiPassthroughUrl,
+                      conditionalHttp,
+                      responseCache,
+                      httpService,
+                      toastService) {
+    var floatingIpsUrl = apiPassthroughUrl + 'v2/reverse/floatingips/';
+
     var service = {
       list: list,
       get: get,
       set: set,
-      unset: unset
+      unset: unset,
+      batch: batch
     };
 
     return service;
@@ -61,15 +72,28 @@
      */
     function list(params) {
       var config = params ? {params: params} : {};
-      return httpService.get(apiPassthroughUrl + 'v2/reverse/floatingips/', config)
+      return responseCache.get(floatingIpsUrl, config, conditionalHttp.get)
         .catch(function () {
           toastService.add('error', gettext('Unable to retrieve the floating ip PTRs.'));
         });
     }
 
+    /**
+     * @name get
+     * @description
+     * Get a single DNS floating ip by ID. A floating ip listed a moment ago is not
+     * requested again, unless query parameters are given.
+     *
+     * @param {string} id
+     * @param {Object} params
+     * Query parameters. Optional.
+     *
+     * @returns {Object} The result of the API call
+     */
     function get(id, params) {
       var config = params ? {params: params} : {};
-      return httpService.get(apiPassthroughUrl + 'v2/reverse/floatingips/' + id + '/', config)
+      var listed = params ? undefined : responseCache.findItem(floatingIpsUrl, 'floatingips', id);
+      return (listed || responseCache.get(floatingIpsUrl + id + '/', config, conditionalHttp.get))
         .catch(function () {
           toastService.add('error', gettext('Unable to get the floating ip PTR ' + id));
         });
@@ -94,8 +118,8 @@
         description: data.description,
         ttl: data.ttl
       };
-      return httpService.patch(
-          apiPassthroughUrl + 'v2/reverse/floatingips/' + floatingIpID + '/', apiData)
+      responseCache.invalidate(floatingIpsUrl);
+      return httpService.patch(floatingIpsUrl + floatingIpID + '/', apiData)
         .catch(function () {
           toastService.add('error', gettext('Unable to set the floating IP PTR record.'));
         });
@@ -118,5 +142,34 @@
         ttl: null
       });
     }
+
+    /**
+     * @name batch
+     * @description
+     * Set or unset the PTR records of several floating ips in one request. The
+     * domain name of each one is made from a template such as
+     * '{ip_dashed}.hosts.example.com.', with the {ip}, {ip_dashed} and
+     * {ip_reversed} placeholders. Without a template the PTR records are unset.
+     *
+     * @param {Array} ids - IDs of the floating ips
+     * @param {Object} data
+     * The template, and the description and ttl of the PTR records. Optional.
+     *
+     * @returns {Object} The result of the API call, with the outcome for each
+     * floating ip in 'results'
+     */
+    function batch(ids, data) {
+      var apiData = {
+        ids: ids,
+        template: data.template || null,
+        description: data.description,
+        ttl: data.ttl
+      };
+      responseCache.invalidate(floatingIpsUrl);
+      return httpService.patch(floatingIpsUrl, apiData)
+        .catch(function () {
+          toastService.add('error', gettext('Unable to update the floating IP PTR records.'));
+        });
+    }
   }
 }());
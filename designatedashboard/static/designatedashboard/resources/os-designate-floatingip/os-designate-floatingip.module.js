@@ -87,6 +87,34 @@
         label: gettext('Action'),
         filters: ['lowercase', 'noName'],
         values: util.actionMap()
+      })
+      .setProperty('region', {
+        label: gettext('Region'),
+        filters: ['noValue']
+      })
+      .setProperty('fixed_ip_address', {
+        label: gettext('Fixed IP Address'),
+        filters: ['noValue']
+      })
+      .setProperty('port_id', {
+        label: gettext('Port ID'),
+        filters: ['noValue']
+      })
+      .setProperty('port_name', {
+        label: gettext('Port Name'),
+        filters: ['noName']
+      })
+      .setProperty('device_id', {
+        label: gettext('Attached Device ID'),
+        filters: ['noValue']
+      })
+      .setProperty('device_owner', {
+        label: gettext('Attached To'),
+        filters: ['noValue']
+      })
+      .setProperty('floating_network_id', {
+        label: gettext('Floating Network ID'),
+        filters: ['noValue']
       });
 
     resourceType
@@ -103,11 +131,26 @@
         filters: ['noValue'],
         priority: 1
       })
+      .append({
+        id: 'fixed_ip_address',
+        filters: ['noValue'],
+        priority: 2
+      })
+      .append({
+        id: 'device_owner',
+        filters: ['noValue'],
+        priority: 3
+      })
       .append({
         id: 'status',
         filters: ['lowercase'],
         values: util.statusMap(),
         priority: 2
+      })
+      .append({
+        id: 'region',
+        filters: ['noValue'],
+        priority: 2
       });
 
     resourceType
@@ -115,38 +158,75 @@
       .append({
         label: gettext('Address'),
         name: 'address',
-        isServer: false,
+        isServer: true,
         singleton: true,
         persistent: false
       })
       .append({
         label: gettext('PTR Domain Name'),
         name: 'ptrdname',
-        isServer: false,
+        isServer: true,
         singleton: true,
         persistent: false
       })
       .append({
         label: gettext('Status'),
         name: 'status',
-        isServer: false,
+        isServer: true,
         singleton: true,
         persistent: false,
         options: [
-          {label: gettext('Active'), key: 'active'},
-          {label: gettext('Pending'), key: 'pending'}
+          {label: gettext('Active'), key: 'ACTIVE'},
+          {label: gettext('Pending'), key: 'PENDING'}
+        ]
+      })
+      .append({
+        label: gettext('Region'),
+        name: 'all_regions',
+        isServer: true,
+        singleton: true,
+        persistent: false,
+        options: [
+          {label: gettext('All Regions'), key: 'true'}
         ]
       });
 
-    function listFloatingIps() {
-      return api.list().then(function onList(response) {
-        // listFunctions are expected to return data in "items"
-        response.data.items = response.data.floatingips;
-
-        util.addTimestampIds(response.data.items);
+    // Keys of the floating IPs used by the table, the drawer and the set action,
+    // which are few enough to be listed rather than requested one by one
+    var listFields = [
+      'id', 'address', 'ptrdname', 'status', 'action', 'description', 'ttl', 'region'
+    ];
+    // Keys of the Neutron port each floating IP is associated with
+    var ownerFields = [
+      'fixed_ip_address', 'port_id', 'port_name', 'device_id', 'device_owner',
+      'floating_network_id'
+    ];
 
-        return response;
+    /*
+     * list the floating IP PTRs, along with the Neutron port each floating IP is
+     * associated with, which the API adds when asked for the "owners". They are only
+     * asked for when the table has a column showing them.
+     */
+    function listFloatingIps(params) {
+      var owners = resourceType.tableColumns.some(function isOwnerColumn(column) {
+        return ownerFields.indexOf(column.id) !== -1;
       });
+      var apiParams = angular.extend(
+        {fields: (owners ? listFields.concat(ownerFields) : listFields).join(',')},
+        util.wildcardFilters(params, ['address', 'ptrdname']));
+      if (owners) {
+        apiParams.owners = true;
+      }
+      return api.list(apiParams)
+        .then(function onList(response) {
+          // listFunctions are expected to return data in "items"
+          response.data.items = response.data.floatingips;
+          util.markRegions(response.data.items, response.data);
+
+          util.addTimestampIds(response.data.items);
+
+          return response;
+        });
     }
   }
 
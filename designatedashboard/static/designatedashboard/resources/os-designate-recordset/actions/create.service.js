@@ -27,6 +27,7 @@
     'designatedashboard.resources.os-designate-recordset.actions.common-forms',
     'designatedashboard.resources.os-designate-recordset.api',
     'designatedashboard.resources.os-designate-recordset.resourceType',
+    'designatedashboard.resources.util',
     'horizon.app.core.openstack-service-api.policy',
     'horizon.app.core.openstack-service-api.serviceCatalog',
     'horizon.framework.conf.resource-type-registry.service',
@@ -46,6 +47,7 @@
                   forms,
                   api,
                   resourceTypeName,
+                  util,
                   policy,
                   serviceCatalog,
                   registry,
@@ -73,10 +75,12 @@
       dnsServiceEnabled = serviceCatalog.ifTypeEnabled('dns');
     }
 
-    function allowed() {
+    function allowed(zone) {
+      // the row action on zones passes in the zone
       return $q.all([
         createRecordSetPolicy,
-        dnsServiceEnabled
+        dnsServiceEnabled,
+        util.inCurrentRegion(zone || {})
       ]);
     }
 
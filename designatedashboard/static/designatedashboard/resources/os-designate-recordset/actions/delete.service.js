@@ -56,7 +56,7 @@
     deleteModal,
     toast
   ) {
-    var context, deletePromise;
+    var context, deletePromise, batchPromise;
     var notAllowedMessage = gettext("You are not allowed to delete record sets: %s");
     var allowedRecordsets = [];
 
@@ -112,6 +112,7 @@
         // we can map the recordset ID back to the full recordset. Then we can fetch the
         // corresponding zone ID
         allowedRecordsets = result.pass.map(getEntity);
+        batchPromise = null;
         outcome = deleteModal.open(scope, allowedRecordsets, context).then(createResult);
       }
       return outcome;
@@ -162,11 +163,43 @@
       );
     }
 
+    /*
+     * The delete modal calls this once per record set. The first call deletes all the
+     * allowed record sets with one batch request per zone, and every call then looks up
+     * the outcome for its own record set.
+     */
     function deleteRecordSet(recordSetId) {
-      var recordSet = allowedRecordsets.find(function(element) {
-        return element.id === recordSetId;
+      return deleteAllowedRecordSets().then(function onBatch(results) {
+        var result = results[recordSetId];
+        if (!result || result.status !== 'success') {
+          return $q.reject(result);
+        }
+        return result;
       });
-      return recordsetApi.deleteRecordSet(recordSet.zone_id, recordSet.id);
+    }
+
+    function deleteAllowedRecordSets() {
+      if (!batchPromise) {
+        var zones = {};
+        allowedRecordsets.forEach(function groupByZone(recordSet) {
+          zones[recordSet.zone_id] = zones[recordSet.zone_id] || [];
+          zones[recordSet.zone_id].push({action: 'delete', id: recordSet.id});
+        });
+        batchPromise = $q.all(Object.keys(zones).map(function deleteInZone(zoneId) {
+          return recordsetApi.batch(zoneId, zones[zoneId]);
+        })).then(function collectResults(responses) {
+          var results = {};
+          responses.forEach(function addResults(response) {
+            if (response) {
+              response.data.results.forEach(function addResult(result) {
+                results[result.id] = result;
+              });
+            }
+          });
+          return results;
+        });
+      }
+      return batchPromise;
     }
 
     function getMessage(message, entities) {
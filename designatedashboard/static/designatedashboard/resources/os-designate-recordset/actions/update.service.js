@@ -28,7 +28,7 @@
     'designatedashboard.resources.os-designate-recordset.actions.common-forms',
     'designatedashboard.resources.os-designate-recordset.api',
     'designatedashboard.resources.os-designate-recordset.editableTypes',
-    'designatedashboard.resources.os-designate-recordset.resourceType',
+    'designatedashboard.resources.statusWatcher',
     'horizon.app.core.openstack-service-api.policy',
     'horizon.app.core.openstack-service-api.serviceCatalog',
     'horizon.framework.util.q.extensions',
@@ -42,14 +42,15 @@
    * @name designatedashboard.resources.os-designate-recordset.actions.update
    *
    * @Description
-   * Brings up the Update modal.
+   * Brings up the Update modal. The updated record set returned by the API is shown
+   * in its table row right away, without listing the record sets again.
    */
   function action($q,
                   util,
                   forms,
                   api,
                   editableTypes,
-                  resourceTypeName,
+                  statusWatcher,
                   policy,
                   serviceCatalog,
                   $qExtensions,
@@ -98,26 +99,36 @@
     }
 
     function perform(item) {
+      // Listed record sets only hold the fields of the table
+      return api.get(item.zone_id, item.id).then(function onGet(response) {
+        if (!response.data) {
+          return $q.reject();
+        }
+        return openForm(item, response.data);
+      });
+    }
+
+    function openForm(item, recordset) {
       var formConfig = forms.getUpdateFormConfig();
       formConfig.title = title;
-      formConfig.model = util.getModel(formConfig.form, item);
+      formConfig.model = util.getModel(formConfig.form, recordset);
 
       // Append the id and zoneId so it can be used on submit
-      formConfig.model.id = item.id;
-      formConfig.model.zoneId = item.zone_id;
+      formConfig.model.id = recordset.id;
+      formConfig.model.zoneId = recordset.zone_id;
 
       // schema form doesn't appear to support populating the records array directly
       // Map the records objects to record objects
-      if (item.hasOwnProperty("records")) {
-        var records = item.records.map(function (item) {
+      if (recordset.hasOwnProperty("records")) {
+        var records = recordset.records.map(function (item) {
           return {record: item};
         });
         formConfig.model.records = records;
       }
-      return schemaFormModalService.open(formConfig).then(onSubmit, onCancel);
+      return schemaFormModalService.open(formConfig).then(onSubmit.bind(null, item), onCancel);
     }
 
-    function onSubmit(context) {
+    function onSubmit(item, context) {
       var model = angular.copy(context.model);
       // schema form doesn't appear to support populating the records array directly
       // Map the records objects to simple array of records
@@ -130,26 +141,24 @@
 
       waitSpinner.showModalSpinner(gettext('Updating Record Set'));
 
-      return api.update(model.zoneId, model.id, model).then(onSuccess, onFailure);
+      return api.update(model.zoneId, model.id, model)
+        .then(onSuccess.bind(null, item), onFailure);
     }
 
     function onCancel() {
       waitSpinner.hideModalSpinner();
     }
 
-    function onSuccess(response) {
+    function onSuccess(item, response) {
       waitSpinner.hideModalSpinner();
-      var recordset = response.data;
       toast.add('success', message.success);
 
-      // To make the result of this action generically useful, reformat the return
-      // from the deleteModal into a standard form
-      return {
-        created: [],
-        updated: [{type: resourceTypeName, id: recordset.id}],
-        deleted: [],
-        failed: []
-      };
+      // Update the record set of the table in place, it is pending until Designate
+      // applied the change
+      util.updateItem(item, response.data);
+      statusWatcher.resume('recordsets');
+
+      return util.inPlaceResult();
     }
 
     function onFailure() {
@@ -23,25 +23,39 @@
   apiService.$inject = [
     '$q',
     'designatedashboard.apiPassthroughUrl',
+    'designatedashboard.resources.conditionalHttp',
+    'designatedashboard.resources.responseCache',
     'horizon.framework.util.http.service',
     'horizon.framework.widgets.toast.service'
   ];
 
   /*
    * @ngdoc service
+   * @param {Object} conditionalHttp
+   * @param {Object} responseCache
    * @param {Object} httpService
    * @param {Object} toastService
    * @name apiService
    * @description Provides direct access to Designate Record Set APIs.
    * @returns {Object} The service
    */
-  function apiService($q, apiPassthroughUrl, httpService, toastService) {
+  function apiService($q,
+                      apiPassthroughUrl,
+                      conditionalHttp,
+                      responseCache,
+                      httpService,
+                      toastService) {
+    // Record set changes also change the serial and status of their zone, so
+    // they invalidate the kept zone responses too
+    var zonesUrl = apiPassthroughUrl + 'v2/zones/';
+
     var service = {
       get: get,
       list: list,
       deleteRecordSet: deleteRecordSet,
       create: create,
-      update: update
+      update: update,
+      batch: batch
     };
 
     return service;
@@ -56,13 +70,17 @@
      * The listing result is an object with property "items." Each item is
      * a record set.
      *
+     * @param {string} zoneId
+     * Specifies the id of the zone containing the record sets.
+     *
      * @param {Object} params
      * Query parameters. Optional.
      *
      * @returns {Object} The result of the API call
      */
     function list(zoneId, params) {
-      return httpService.get(apiPassthroughUrl + 'v2/zones/' + zoneId + '/recordsets/', params)
+      var config = params ? {params: params} : {};
+      return responseCache.get(recordSetsUrl(zoneId), config, conditionalHttp.get)
         .catch(function () {
           toastService.add('error', gettext('Unable to retrieve the record sets.'));
         });
@@ -71,7 +89,8 @@
     /*
      * @name get
      * @description
-     * Get a single record set by ID.
+     * Get a single record set by ID, with all its fields. A record set requested a
+     * moment ago is not requested again.
      *
      * @param {string} zoneId
      * Specifies the id of the zone containing the record set to request.
@@ -86,8 +105,7 @@
       // common when then delete action removes a record set. Mask this failure by
       // always returning a successful promise instead of terminating the $http promise
       // in the .error handler.
-      return httpService.get(
-          apiPassthroughUrl + 'v2/zones/' + zoneId + '/recordsets/' + recordSetId + '/')
+      return responseCache.get(recordSetsUrl(zoneId) + recordSetId + '/', {}, conditionalHttp.get)
         .then(undefined, function onError() {
           toastService.add('error', gettext('Unable to retrieve the record set.'));
           return $q.when({});
@@ -107,15 +125,16 @@
      * @returns {*}
      */
     function deleteRecordSet(zoneId, recordSetId) {
-      return httpService.delete(
-          apiPassthroughUrl + 'v2/zones/' + zoneId + '/recordsets/' + recordSetId + '/')
+      responseCache.invalidate(zonesUrl);
+      return httpService.delete(recordSetsUrl(zoneId) + recordSetId + '/')
         .catch(function () {
           toastService.add('error', gettext('Unable to delete the record set.'));
         });
     }
 
     function create(zoneId, data) {
-      return httpService.post(apiPassthroughUrl + 'v2/zones/' + zoneId + '/recordsets/', data)
+      responseCache.invalidate(zonesUrl);
+      return httpService.post(recordSetsUrl(zoneId), data)
         .catch(function () {
           toastService.add('error', gettext('Unable to create the record set.'));
         });
@@ -129,11 +148,38 @@
         description: data.description,
         records: data.records
       };
-      return httpService.put(
-          apiPassthroughUrl + 'v2/zones/' + zoneId + '/recordsets/' + recordSetId + '/', apiData)
+      responseCache.invalidate(zonesUrl);
+      return httpService.put(recordSetsUrl(zoneId) + recordSetId + '/', apiData)
         .catch(function () {
           toastService.add('error', gettext('Unable to update the record set.'));
         });
     }
+
+    /*
+     * @name batch
+     * @description
+     * Create, update and delete several record sets of a zone in one request.
+     *
+     * @param {string} zoneId
+     * The id of the zone containing the record sets
+     *
+     * @param {Array} operations
+     * The operations, each with an 'action' of 'create', 'update' or 'delete'.
+     * Updates and deletes give the record set 'id'.
+     *
+     * @returns {Object} The result of the API call, with the result of each
+     * operation in 'results', along with the 'id' of its record set
+     */
+    function batch(zoneId, operations) {
+      responseCache.invalidate(zonesUrl);
+      return httpService.patch(recordSetsUrl(zoneId), {operations: operations})
+        .catch(function () {
+          toastService.add('error', gettext('Unable to update the record sets.'));
+        });
+    }
+
+    function recordSetsUrl(zoneId) {
+      return zonesUrl + zoneId + '/recordsets/';
+    }
   }
 }());
@@ -82,6 +82,9 @@
     'designatedashboard.resources.os-designate-recordset.api',
     'designatedashboard.resources.os-designate-recordset.resourceType',
     'designatedashboard.resources.os-designate-recordset.typeMap',
+    'designatedashboard.resources.deltaList',
+    'designatedashboard.resources.pager',
+    'designatedashboard.resources.statusWatcher',
     'designatedashboard.resources.util'
   ];
 
@@ -90,6 +93,9 @@
                recordSetApi,
                resourceTypeString,
                typeMap,
+               deltaList,
+               pager,
+               statusWatcher,
                util) {
     var resourceType = registry.getResourceType(resourceTypeString);
     resourceType
@@ -194,7 +200,7 @@
       .append({
         label: gettext('Type'),
         name: 'type',
-        isServer: false,
+        isServer: true,
         singleton: true,
         persistent: false,
         options: Object.keys(typeMap).map(function toOptionLabel(key) {
@@ -207,25 +213,44 @@
       .append({
         label: gettext('Name'),
         name: 'name',
-        isServer: false,
+        isServer: true,
+        singleton: true,
+        persistent: false
+      })
+      .append({
+        label: gettext('Records'),
+        name: 'data',
+        isServer: true,
         singleton: true,
         persistent: false
       })
       .append({
         label: gettext('Status'),
         name: 'status',
-        isServer: false,
+        isServer: true,
         singleton: true,
         persistent: false,
         options: [
-          {label: gettext('Active'), key: 'active'},
-          {label: gettext('Pending'), key: 'pending'}
+          {label: gettext('Active'), key: 'ACTIVE'},
+          {label: gettext('Pending'), key: 'PENDING'},
+          {label: gettext('Error'), key: 'ERROR'}
         ]
       });
 
+    // Keys of the record sets used by the table columns, the details path and the
+    // row actions allowed, plus the version as for zones. The drawer, the details
+    // views and the update form get the whole record set.
+    var listFields = [
+      'id', 'zone_id', 'zone_name', 'name', 'type', 'records', 'status', 'action',
+      'version', 'updated_at'
+    ].join(',');
+
     /*
      * list all recordsets within a zone. Requires "zoneId" in the params. All other
-     * params will be passed unmodified as URL params to the API.
+     * params, such as the search facets, will be passed as URL params to the API.
+     * When "paginate" is set in the params, only the current page of the
+     * designatedashboard.resources.pager service is listed, in name order. Listing
+     * the same page again only fetches its changes, see designatedashboard.resources.deltaList.
      *
      *  @param params
      * zoneId (required) list recordsets within the zone
@@ -233,14 +258,26 @@
      * @returns {*|Object}
      */
     function list(params) {
-      return recordSetApi.list(params.zoneId, params).then(function onList(response) {
-        // listFunctions are expected to return data in "items"
-        response.data.items = response.data.recordsets;
+      var apiParams = angular.extend(
+        {sort_key: 'name', sort_dir: 'asc', fields: listFields},
+        pager.getListParams(resourceTypeString, util.wildcardFilters(params, ['name', 'data'])));
+      delete apiParams.zoneId;
+      var listKey = resourceTypeString + ':' + params.zoneId;
+      return deltaList.list(listKey, apiParams, listRecordSets, 'recordsets')
+        .then(function onList(response) {
+          // listFunctions are expected to return data in "items"
+          response.data.items = response.data.recordsets;
+          pager.update(resourceTypeString, response.data);
 
-        util.addTimestampIds(response.data.items);
+          util.addTimestampIds(response.data.items);
+          statusWatcher.watchRecordSets(response.data.items);
 
-        return response;
-      });
+          return response;
+        });
+
+      function listRecordSets(listParams) {
+        return recordSetApi.list(params.zoneId, listParams);
+      }
     }
   }
 
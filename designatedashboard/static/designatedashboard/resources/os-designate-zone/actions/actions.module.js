@@ -35,6 +35,8 @@
     'designatedashboard.resources.os-designate-zone.resourceType',
     'designatedashboard.resources.os-designate-zone.actions.create',
     'designatedashboard.resources.os-designate-zone.actions.delete',
+    'designatedashboard.resources.os-designate-zone.actions.export',
+    'designatedashboard.resources.os-designate-zone.actions.import',
     'designatedashboard.resources.os-designate-zone.actions.update'
   ];
 
@@ -42,6 +44,8 @@
                resourceTypeString,
                createAction,
                deleteAction,
+               exportAction,
+               importAction,
                updateAction) {
     var resourceType = registry.getResourceType(resourceTypeString);
     resourceType
@@ -63,6 +67,20 @@
           text: gettext('Update')
         }
       })
+      .append({
+        id: 'import',
+        service: importAction,
+        template: {
+          text: gettext('Import Zone File')
+        }
+      })
+      .append({
+        id: 'export',
+        service: exportAction,
+        template: {
+          text: gettext('Export Zone File')
+        }
+      })
       .append({
         id: 'delete',
         service: deleteAction,
@@ -34,6 +34,16 @@
       expect(actionHasId(actions, 'update')).toBe(true);
     });
 
+    it('registers Import Zone File as a item action', function() {
+      var actions = registry.getResourceType('OS::Designate::Zone').itemActions;
+      expect(actionHasId(actions, 'import')).toBe(true);
+    });
+
+    it('registers Export Zone File as a item action', function() {
+      var actions = registry.getResourceType('OS::Designate::Zone').itemActions;
+      expect(actionHasId(actions, 'export')).toBe(true);
+    });
+
     function actionHasId(list, value) {
       return list.filter(matchesId).length === 1;
 
@@ -56,7 +56,8 @@
     toast,
     resourceType
   ) {
-    var context, deleteZonePromise;
+    var context, deleteZonePromise, batchPromise;
+    var allowedZoneIds = [];
     var notAllowedMessage = gettext("You are not allowed to delete zones: %s");
 
     var service = {
@@ -92,7 +93,8 @@
         return $q.all([
           deleteZonePromise,
           util.notDeleted(zone),
-          util.notPending(zone)
+          util.notPending(zone),
+          util.inCurrentRegion(zone)
         ]);
       } else {
         return policy.ifAllowed({ rules: [['dns', 'delete_zone']] });
@@ -110,6 +112,10 @@
         outcome = $q.reject(result.fail).catch(angular.noop);
       }
       if (result.pass.length > 0) {
+        allowedZoneIds = result.pass.map(getEntity).map(function getId(zone) {
+          return zone.id;
+        });
+        batchPromise = null;
         outcome = deleteModal.open(scope, result.pass.map(getEntity), context).then(createResult);
       }
       return outcome;
@@ -153,8 +159,30 @@
       };
     }
 
-    function deleteZone(zone) {
-      return zoneApi.deleteZone(zone, true);
+    /*
+     * The delete modal calls this once per zone. The first call deletes all the allowed
+     * zones with one batch request, and every call then looks up the outcome for its
+     * own zone.
+     */
+    function deleteZone(zoneId) {
+      if (!batchPromise) {
+        batchPromise = zoneApi.deleteZones(allowedZoneIds).then(function collectResults(response) {
+          var results = {};
+          if (response) {
+            response.data.results.forEach(function addResult(result) {
+              results[result.id] = result;
+            });
+          }
+          return results;
+        });
+      }
+      return batchPromise.then(function onBatch(results) {
+        var result = results[zoneId];
+        if (!result || result.status !== 'success') {
+          return $q.reject(result);
+        }
+        return result;
+      });
     }
 
     function getMessage(message, entities) {
@@ -0,0 +1,79 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources.os-designate-zone.actions')
+    .factory('designatedashboard.resources.os-designate-zone.actions.export', action);
+
+  action.$inject = [
+    '$q',
+    '$window',
+    'designatedashboard.resources.os-designate-zone.api',
+    'designatedashboard.resources.util',
+    'horizon.app.core.openstack-service-api.serviceCatalog'
+  ];
+
+  /*
+   * @ngDoc factory
+   * @name designatedashboard.resources.os-designate-zone.actions.export
+   *
+   * @Description
+   * Downloads the record sets of a zone as a BIND zone file. The browser downloads the
+   * file itself, so that it is streamed to disk however large the zone is.
+   */
+  function action($q, $window, api, util, serviceCatalog) {
+    var dnsServiceEnabled;
+
+    var service = {
+      initAction: initAction,
+      allowed: allowed,
+      perform: perform
+    };
+
+    return service;
+
+    /////////////////
+
+    function initAction() {
+      dnsServiceEnabled = serviceCatalog.ifTypeEnabled('dns');
+    }
+
+    function allowed(zone) {
+      // only supports row action (exactly 1 zone)
+      if (zone) {
+        return $q.all([
+          dnsServiceEnabled,
+          util.notDeleted(zone),
+          util.inCurrentRegion(zone)
+        ]);
+      } else {
+        return false;
+      }
+    }
+
+    function perform(item) {
+      $window.location.href = api.zoneFileUrl(item.id);
+      // Nothing changed
+      return $q.when({
+        created: [],
+        updated: [],
+        deleted: [],
+        failed: []
+      });
+    }
+  }
+})();
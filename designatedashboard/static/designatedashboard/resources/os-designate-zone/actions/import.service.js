@@ -0,0 +1,160 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources.os-designate-zone.actions')
+    .factory('designatedashboard.resources.os-designate-zone.actions.import', action);
+
+  action.$inject = [
+    '$q',
+    'designatedashboard.resources.os-designate-zone.api',
+    'designatedashboard.resources.os-designate-zone.resourceType',
+    'designatedashboard.resources.util',
+    'horizon.app.core.openstack-service-api.policy',
+    'horizon.framework.util.q.extensions',
+    'horizon.framework.widgets.form.ModalFormService',
+    'horizon.framework.widgets.toast.service',
+    'horizon.framework.widgets.modal-wait-spinner.service'
+  ];
+
+  /*
+   * @ngDoc factory
+   * @name designatedashboard.resources.os-designate-zone.actions.import
+   *
+   * @Description
+   * Brings up the Import Zone File modal, which creates or replaces the record sets
+   * of a primary zone from a BIND zone file.
+   */
+  function action($q,
+                  api,
+                  resourceTypeName,
+                  util,
+                  policy,
+                  $qExtensions,
+                  schemaFormModalService,
+                  toast,
+                  waitSpinner) {
+    var createRecordSetPolicy;
+    var title = gettext("Import Zone File");
+    var message = {
+      success: gettext('Zone file imported: %(created)s record sets created, ' +
+                       '%(updated)s updated and %(skipped)s skipped.'),
+      failed: gettext('%(failed)s record sets of the zone file could not be imported, ' +
+                      'the first one is %(name)s %(type)s: %(error)s'),
+      error: gettext('The zone file was imported up to an error: %s'),
+      noFile: gettext('Select a zone file to import.')
+    };
+
+    var service = {
+      initAction: initAction,
+      allowed: allowed,
+      perform: perform
+    };
+
+    return service;
+
+    /////////////////
+
+    function initAction() {
+      createRecordSetPolicy = policy.ifAllowed({rules: [['dns', 'create_recordset']]});
+    }
+
+    function allowed(zone) {
+      // only supports row action (exactly 1 zone)
+      if (zone) {
+        return $q.all([
+          createRecordSetPolicy,
+          $qExtensions.booleanAsPromise(zone.type === 'PRIMARY'),
+          util.notDeleted(zone),
+          util.notPending(zone),
+          util.inCurrentRegion(zone)
+        ]);
+      } else {
+        return false;
+      }
+    }
+
+    function perform(item) {
+      var formConfig = {
+        title: title,
+        schema: {
+          type: 'object',
+          properties: {}
+        },
+        form: [
+          {
+            type: 'template',
+            template: '<div class="form-group">' +
+                      '<label class="control-label" for="zone-file">' +
+                      gettext('Zone File') + '</label>' +
+                      '<input id="zone-file" type="file" ngf-select ng-model="model.file">' +
+                      '<p class="help-block">' +
+                      gettext('Record sets of the file that already exist in the zone ' +
+                              'have their records replaced. The SOA and NS records of ' +
+                              'the zone itself are managed by Designate and skipped.') +
+                      '</p></div>'
+          }
+        ],
+        model: {
+          zoneId: item.id
+        }
+      };
+      return schemaFormModalService.open(formConfig).then(onSubmit, onCancel);
+    }
+
+    function onSubmit(context) {
+      if (!context.model.file) {
+        toast.add('error', message.noFile);
+        return $q.reject();
+      }
+
+      waitSpinner.showModalSpinner(gettext('Importing Zone File'));
+
+      return api.importZoneFile(context.model.zoneId, context.model.file)
+        .then(onSuccess.bind(null, context.model.zoneId), onFailure);
+    }
+
+    function onCancel() {
+      waitSpinner.hideModalSpinner();
+    }
+
+    function onSuccess(zoneId, response) {
+      waitSpinner.hideModalSpinner();
+      var summary = response.data;
+      toast.add('success', interpolate(message.success, summary, true));
+      if (summary.errors.length > 0) {
+        toast.add('error', interpolate(
+          message.failed, angular.extend({failed: summary.failed}, summary.errors[0]), true));
+      }
+      if (summary.error) {
+        toast.add('error', interpolate(message.error, [summary.error]));
+      }
+
+      // The record sets and the serial of the zone changed
+      return {
+        created: [],
+        updated: [{type: resourceTypeName, id: zoneId}],
+        deleted: [],
+        failed: []
+      };
+    }
+
+    function onFailure() {
+      waitSpinner.hideModalSpinner();
+    }
+  }
+})();
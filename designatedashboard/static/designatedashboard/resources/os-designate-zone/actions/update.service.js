@@ -26,7 +26,7 @@
     '$q',
     'designatedashboard.resources.os-designate-zone.actions.common-forms',
     'designatedashboard.resources.os-designate-zone.api',
-    'designatedashboard.resources.os-designate-zone.resourceType',
+    'designatedashboard.resources.statusWatcher',
     'designatedashboard.resources.util',
     'horizon.app.core.openstack-service-api.policy',
     'horizon.app.core.openstack-service-api.serviceCatalog',
@@ -40,12 +40,13 @@
    * @name designatedashboard.resources.os-designate-zone.actions.update
    *
    * @Description
-   * Brings up the Update Zone modal.
+   * Brings up the Update Zone modal. The updated zone returned by the API is shown
+   * in its table row right away, without listing the zones again.
    */
   function action($q,
                   forms,
                   api,
-                  resourceTypeName,
+                  statusWatcher,
                   util,
                   policy,
                   serviceCatalog,
@@ -78,7 +79,8 @@
         return $q.all([
           updateZonePolicy,
           util.notDeleted(zone),
-          util.notPending(zone)
+          util.notPending(zone),
+          util.inCurrentRegion(zone)
         ]);
       } else {
         return false;
@@ -86,25 +88,35 @@
     }
 
     function perform(item) {
+      // Listed zones only hold the fields of the table
+      return api.get(item.id).then(function onGet(response) {
+        if (!response) {
+          return $q.reject();
+        }
+        return openForm(item, response.data);
+      });
+    }
+
+    function openForm(item, zone) {
       var formConfig = forms.getUpdateFormConfig();
       formConfig.title = title;
-      formConfig.model = util.getModel(formConfig.form, item);
+      formConfig.model = util.getModel(formConfig.form, zone);
 
       // Append the id so it can be used on submit
-      formConfig.model.id = item.id;
+      formConfig.model.id = zone.id;
 
       // schema form doesn't appear to support populating the masters array directly
       // Map the masters objects to address objects
-      if (item.hasOwnProperty("masters")) {
-        var masters = item.masters.map(function (item) {
+      if (zone.hasOwnProperty("masters")) {
+        var masters = zone.masters.map(function (item) {
           return { address: item };
         });
         formConfig.model.masters = masters;
       }
-      return schemaFormModalService.open(formConfig).then(onSubmit, onCancel);
+      return schemaFormModalService.open(formConfig).then(onSubmit.bind(null, item), onCancel);
     }
 
-    function onSubmit(context) {
+    function onSubmit(item, context) {
       var zoneModel = angular.copy(context.model);
       // schema form doesn't appear to support populating the masters array directly
       // Map the masters objects to simple array of addresses
@@ -117,26 +129,23 @@
 
       waitSpinner.showModalSpinner(gettext('Updating Zone'));
 
-      return api.update(zoneModel.id, zoneModel).then(onSuccess, onFailure);
+      return api.update(zoneModel.id, zoneModel).then(onSuccess.bind(null, item), onFailure);
     }
 
     function onCancel() {
       waitSpinner.hideModalSpinner();
     }
 
-    function onSuccess(response) {
+    function onSuccess(item, response) {
       waitSpinner.hideModalSpinner();
-      var zone = response.data;
       toast.add('success', message.success);
 
-      // To make the result of this action generically useful, reformat the return
-      // from the deleteModal into a standard form
-      return {
-        created: [],
-        updated: [{type: resourceTypeName, id: zone.id}],
-        deleted: [],
-        failed: []
-      };
+      // Update the zone of the table in place, it is pending until Designate
+      // applied the change
+      util.updateItem(item, response.data);
+      statusWatcher.resume('zones');
+
+      return util.inPlaceResult();
     }
 
     function onFailure() {
@@ -21,26 +21,41 @@
     .factory('designatedashboard.resources.os-designate-zone.api', apiService);
 
   apiService.$inject = [
+    '$window',
     'designatedashboard.apiPassthroughUrl',
+    'designatedashboard.resources.conditionalHttp',
+    'designatedashboard.resources.responseCache',
     'horizon.framework.util.http.service',
     'horizon.framework.widgets.toast.service'
   ];
 
   /*
    * @ngdoc service
+   * @param {Object} conditionalHttp
+   * @param {Object} responseCache
    * @param {Object} httpService
    * @param {Object} toastService
    * @name apiService
    * @description Provides direct access to Designate Zone APIs.
    * @returns {Object} The service
    */
-  function apiService(apiPassthroughUrl, httpService, toastService) {
+  function apiService($window,
+                      apiPassthroughUrl,
+                      conditionalHttp,
+                      responseCache,
+                      httpService,
+                      toastService) {
+    var zonesUrl = apiPassthroughUrl + 'v2/zones/';
+
     var service = {
       get: get,
       list: list,
       deleteZone: deleteZone,
+      deleteZones: deleteZones,
       create: create,
-      update: update
+      update: update,
+      importZoneFile: importZoneFile,
+      zoneFileUrl: zoneFileUrl
     };
 
     return service;
@@ -70,7 +85,7 @@
     }*/
     function list(params) {
       var config = params ? {params: params} : {};
-      return httpService.get(apiPassthroughUrl + 'v2/zones/', config)
+      return responseCache.get(zonesUrl, config, conditionalHttp.get)
         .catch(function () {
           toastService.add('error', gettext('Unable to retrieve the zone.'));
         });
@@ -79,7 +94,8 @@
     /**
      * @name get
      * @description
-     * Get a single zone by ID.
+     * Get a single zone by ID, with all its fields. A zone requested a moment ago
+     * is not requested again.
      *
      * @param {string} id
      * Specifies the id of the zone to request.
@@ -87,7 +103,7 @@
      * @returns {Object} The result of the API call
      */
     function get(id) {
-      return httpService.get(apiPassthroughUrl + 'v2/zones/' + id + '/')
+      return responseCache.get(zonesUrl + id + '/', {}, conditionalHttp.get)
         .catch(function () {
           toastService.add('error', gettext('Unable to retrieve the zone.'));
         });
@@ -101,12 +117,28 @@
      * @returns {*}
      */
     function deleteZone(id) {
-      return httpService.delete(apiPassthroughUrl + 'v2/zones/' + id + '/')
+      responseCache.invalidate(zonesUrl);
+      return httpService.delete(zonesUrl + id + '/')
         .catch(function () {
           toastService.add('error', gettext('Unable to delete the zone.'));
         });
     }
 
+    /*
+     * @name deleteZones
+     * @description
+     * Delete several zones by ID in one request
+     * @param ids {Array}
+     * @returns {*} The result of the API call, with the outcome for each zone in 'results'
+     */
+    function deleteZones(ids) {
+      responseCache.invalidate(zonesUrl);
+      return httpService.delete(zonesUrl, ids)
+        .catch(function () {
+          toastService.add('error', gettext('Unable to delete the zones.'));
+        });
+    }
+
     /**
      * @name create
      * @description
@@ -118,7 +150,8 @@
      * @returns {Object} The created zone object
      */
     function create(data) {
-      return httpService.post(apiPassthroughUrl + 'v2/zones/', data)
+      responseCache.invalidate(zonesUrl);
+      return httpService.post(zonesUrl, data)
         .catch(function() {
           toastService.add('error', gettext('Unable to create the zone.'));
         });
@@ -143,10 +176,45 @@
         ttl: data.ttl,
         description: data.description
       };
-      return httpService.patch(apiPassthroughUrl + 'v2/zones/' + id + '/', apiData)
+      responseCache.invalidate(zonesUrl);
+      return httpService.patch(zonesUrl + id + '/', apiData)
         .catch(function() {
           toastService.add('error', gettext('Unable to update the zone.'));
         });
     }
+
+    /**
+     * @name importZoneFile
+     * @description
+     * Create or replace the record sets of a zone from a BIND zone file
+     *
+     * @param {string} id - zone id
+     * @param {File} file - the zone file, uploaded as multipart/form-data
+     *
+     * @returns {Object} The result of the API call, with the number of record sets
+     * 'created', 'updated', 'skipped' and 'failed', and their 'errors'
+     */
+    function importZoneFile(id, file) {
+      responseCache.invalidate(zonesUrl);
+      return httpService.post(zonesUrl + id + '/zonefile/', {file: file})
+        .catch(function() {
+          toastService.add('error', gettext('Unable to import the zone file.'));
+        });
+    }
+
+    /**
+     * @name zoneFileUrl
+     * @description
+     * Get the URL the BIND zone file of a zone is downloaded from. The browser opens it
+     * directly, so that the file is streamed to disk.
+     *
+     * @param {string} id - zone id
+     *
+     * @returns {string} The URL
+     */
+    function zoneFileUrl(id) {
+      var url = $window.WEBROOT + zonesUrl + id + '/zonefile/';
+      return url.replace(/\/+/g, '/');
+    }
   }
 }());
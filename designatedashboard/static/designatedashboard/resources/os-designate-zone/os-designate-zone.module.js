@@ -50,6 +50,9 @@
     'horizon.framework.conf.resource-type-registry.service',
     'designatedashboard.resources.os-designate-zone.api',
     'designatedashboard.resources.os-designate-zone.resourceType',
+    'designatedashboard.resources.deltaList',
+    'designatedashboard.resources.pager',
+    'designatedashboard.resources.statusWatcher',
     'designatedashboard.resources.util'
   ];
 
@@ -57,6 +60,9 @@
                registry,
                zoneApi,
                resourceTypeString,
+               deltaList,
+               pager,
+               statusWatcher,
                util) {
     var resourceType = registry.getResourceType(resourceTypeString);
     resourceType
@@ -100,6 +106,10 @@
       .setProperty('project_id', {
         label: gettext('Project ID')
       })
+      .setProperty('region', {
+        label: gettext('Region'),
+        filters: ['noValue']
+      })
       .setProperty('serial', {
         label: gettext('Serial'),
         filters: ['noValue']
@@ -151,6 +161,11 @@
         filters: ['lowercase'],
         values: util.statusMap(),
         priority: 2
+      })
+      .append({
+        id: 'region',
+        filters: ['noValue'],
+        priority: 2
       });
 
     resourceType
@@ -158,30 +173,41 @@
       .append({
         label: gettext('Name'),
         name: 'name',
-        isServer: false,
+        isServer: true,
         singleton: true,
         persistent: false
       })
       .append({
         label: gettext('Type'),
         name: 'type',
-        isServer: false,
+        isServer: true,
         singleton: true,
         persistent: false,
         options: [
-          {label: gettext('Primary'), key: 'primary'},
-          {label: gettext('Secondary'), key: 'secondary'}
+          {label: gettext('Primary'), key: 'PRIMARY'},
+          {label: gettext('Secondary'), key: 'SECONDARY'}
         ]
       })
       .append({
         label: gettext('Status'),
         name: 'status',
-        isServer: false,
+        isServer: true,
         singleton: true,
         persistent: false,
         options: [
-          {label: gettext('Active'), key: 'active'},
-          {label: gettext('Pending'), key: 'pending'}
+          {label: gettext('Active'), key: 'ACTIVE'},
+          {label: gettext('Pending'), key: 'PENDING'},
+          {label: gettext('Error'), key: 'ERROR'}
+        ]
+      })
+      .append({
+        label: gettext('Region'),
+        name: 'all_regions',
+        isServer: true,
+        singleton: true,
+        persistent: false,
+        options: [
+          {label: gettext('All Regions'), key: 'true'}
         ]
       });
 
@@ -192,15 +218,38 @@
       };
     }
 
-    function listZones() {
-      return zoneApi.list().then(function onList(response) {
-        // listFunctions are expected to return data in "items"
-        response.data.items = response.data.zones;
+    // Keys of the zones used by the table columns and the row actions allowed. The
+    // version changes the content of a zone, and its track-by key, on every update.
+    // The drawer, the details views and the update form get the whole zone.
+    var listFields = [
+      'id', 'name', 'type', 'status', 'action', 'region', 'version', 'updated_at'
+    ].join(',');
 
-        util.addTimestampIds(response.data.items, 'id', 'updated_at');
+    /*
+     * list zones. When "paginate" is set in the params, only the current page
+     * of the designatedashboard.resources.pager service is listed, in name order.
+     * When "all_regions" is set, the zones of every region are listed at once. Listing
+     * the same page again only fetches its changes, see designatedashboard.resources.deltaList.
+     *
+     * @param params
+     * Query parameters passed to the API, including the search facets. Optional.
+     */
+    function listZones(params) {
+      var apiParams = angular.extend(
+        {sort_key: 'name', sort_dir: 'asc', fields: listFields},
+        pager.getListParams(resourceTypeString, util.wildcardFilters(params, ['name'])));
+      return deltaList.list(resourceTypeString, apiParams, zoneApi.list, 'zones')
+        .then(function onList(response) {
+          // listFunctions are expected to return data in "items"
+          response.data.items = response.data.zones;
+          pager.update(resourceTypeString, response.data);
+          util.markRegions(response.data.items, response.data);
 
-        return response;
-      });
+          util.addTimestampIds(response.data.items);
+          statusWatcher.watchZones(response.data.items);
+
+          return response;
+        });
     }
   }
 
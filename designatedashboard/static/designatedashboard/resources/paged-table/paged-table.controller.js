@@ -0,0 +1,70 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+(function() {
+  "use strict";
+
+  angular
+    .module('designatedashboard.resources')
+    .controller('designatedashboard.resources.pagedTableController', controller);
+
+  controller.$inject = [
+    '$scope',
+    'designatedashboard.resources.pager'
+  ];
+
+  function controller($scope, pager) {
+    // Number of resources of the pages of virtually scrolled tables, which render
+    // only the rows in view and so can show longer pages than the user setting
+    var virtualPageSize = 500;
+    var ctrl = this;
+
+    ctrl.$onInit = onInit;
+    ctrl.nextPage = nextPage;
+    ctrl.previousPage = previousPage;
+
+    function onInit() {
+      // Always start from the first page when the table is shown
+      pager.reset(ctrl.resourceTypeName);
+      ctrl.state = pager.getState(ctrl.resourceTypeName);
+      $scope.$watch('ctrl.listFunctionExtraParams', refresh);
+    }
+
+    function nextPage() {
+      if (ctrl.state.next) {
+        pager.nextPage(ctrl.resourceTypeName);
+        refresh();
+      }
+    }
+
+    function previousPage() {
+      if (ctrl.state.prev) {
+        pager.previousPage(ctrl.resourceTypeName);
+        refresh();
+      }
+    }
+
+    /*
+     * hz-resource-table lists the resources again whenever its extra params
+     * object is replaced, so hand it a new one.
+     */
+    function refresh() {
+      var pageParams = {paginate: true};
+      if (ctrl.virtualScroll) {
+        pageParams.limit = virtualPageSize;
+      }
+      ctrl.listParams = angular.extend(pageParams, ctrl.listFunctionExtraParams);
+    }
+  }
+
+})();
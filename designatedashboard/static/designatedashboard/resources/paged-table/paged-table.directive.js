@@ -0,0 +1,72 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+(function() {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .directive('dnsPagedResourceTable', directive);
+
+  directive.$inject = ['designatedashboard.basePath'];
+
+  /**
+   * @ngdoc directive
+   * @scope
+   * @name dnsPagedResourceTable
+   * @description
+   * Wraps hz-resource-table so that the resources are listed one page at a
+   * time, with controls to move to the next and previous pages. The list
+   * function of the resource type must use the
+   * designatedashboard.resources.pager service.
+   *
+   * In virtual scroll mode, the pages are longer, and only the rows of the
+   * page scrolled into view are rendered, with dns-virtual-resource-table.
+   *
+   * @property resource-type-name {string}
+   * The resource name in the registry
+   *
+   * @property track-by {string} (optional)
+   * The track-by string to pass to the hz-resource-table
+   *
+   * @property list-function-extra-params {object} (optional)
+   * Extra parameters required by this resource type's list function.
+   *
+   * @property virtual-scroll {boolean} (optional)
+   * Show longer pages in a virtually scrolled table.
+   *
+   * @example
+   ```
+   <dns-paged-resource-table
+      resource-type-name="OS::Designate::Zone"
+      track-by="_timestampId">
+   </dns-paged-resource-table>
+   ```
+   */
+  function directive(basePath) {
+    var directive = {
+      restrict: 'E',
+      scope: {
+        resourceTypeName: '@',
+        trackBy: '@?',
+        listFunctionExtraParams: '=?',
+        virtualScroll: '=?'
+      },
+      bindToController: true,
+      templateUrl: basePath + 'resources/paged-table/paged-table.html',
+      controller: 'designatedashboard.resources.pagedTableController as ctrl'
+    };
+
+    return directive;
+  }
+})();
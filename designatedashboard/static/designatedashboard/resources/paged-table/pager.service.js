@@ -0,0 +1,122 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .factory('designatedashboard.resources.pager', pagerService);
+
+  /*
+   * @ngdoc service
+   * @name designatedashboard.resources.pager
+   * @description
+   * Keeps track of the current page of each paginated resource type. List
+   * functions use it to add the page marker to their API query and to record
+   * the markers of the adjacent pages returned by the API.
+   * @returns {Object} The service
+   */
+  function pagerService() {
+    var states = {};
+
+    var service = {
+      getState: getState,
+      reset: reset,
+      getListParams: getListParams,
+      update: update,
+      nextPage: nextPage,
+      previousPage: previousPage
+    };
+
+    return service;
+
+    ///////////////
+
+    /*
+     * @param resourceTypeName {string}
+     * @returns {Object} The paging state of the resource type
+     */
+    function getState(resourceTypeName) {
+      if (!states.hasOwnProperty(resourceTypeName)) {
+        states[resourceTypeName] = {};
+        reset(resourceTypeName);
+      }
+      return states[resourceTypeName];
+    }
+
+    /*
+     * Go back to the first page of the resource type
+     */
+    function reset(resourceTypeName) {
+      angular.extend(getState(resourceTypeName), {
+        filters: null,
+        marker: null,
+        reversed: false,
+        next: null,
+        prev: null
+      });
+    }
+
+    /*
+     * Build the API query parameters for the current page. Pagination only
+     * applies when the list function params ask for it with 'paginate'. Any
+     * change to the other params, such as a new search, starts over from the
+     * first page.
+     *
+     * @param resourceTypeName {string}
+     * @param params {Object} The params passed to the list function
+     * @returns {Object} The API query parameters
+     */
+    function getListParams(resourceTypeName, params) {
+      var apiParams = angular.extend({}, params);
+      if (!apiParams.paginate) {
+        return apiParams;
+      }
+
+      var state = getState(resourceTypeName);
+      if (!angular.equals(params, state.filters)) {
+        reset(resourceTypeName);
+        state.filters = angular.copy(params);
+      }
+      if (state.marker) {
+        apiParams.marker = state.marker;
+        if (state.reversed) {
+          apiParams.reversed_order = true;
+        }
+      }
+      return apiParams;
+    }
+
+    /*
+     * Record the next and previous page markers of a list API response
+     */
+    function update(resourceTypeName, data) {
+      var state = getState(resourceTypeName);
+      state.next = data.next || null;
+      state.prev = data.prev || null;
+    }
+
+    function nextPage(resourceTypeName) {
+      var state = getState(resourceTypeName);
+      state.marker = state.next;
+      state.reversed = false;
+    }
+
+    function previousPage(resourceTypeName) {
+      var state = getState(resourceTypeName);
+      state.marker = state.prev;
+      state.reversed = true;
+    }
+  }
+}());
@@ -0,0 +1,165 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .factory('designatedashboard.resources.responseCache', responseCacheService);
+
+  responseCacheService.$inject = [
+    '$httpParamSerializer',
+    '$q'
+  ];
+
+  /*
+   * @ngdoc service
+   * @name designatedashboard.resources.responseCache
+   * @description
+   * Keeps the responses of GET requests for a short while, so that going back
+   * and forth between a table and the details of its items does not ask the API
+   * again. Listed items also stand in for a GET of the item itself.
+   *
+   * The api services forget the responses under the URL of a collection
+   * whenever they change its resources.
+   * @returns {Object} The service
+   */
+  function responseCacheService($httpParamSerializer, $q) {
+    // Number of milliseconds a response is used for
+    var ttl = 30000;
+    // Number of responses kept, the least recently used ones are dropped first
+    var maxEntries = 50;
+    var entries = {};
+    var keys = [];
+
+    var service = {
+      get: get,
+      findItem: findItem,
+      invalidate: invalidate
+    };
+
+    return service;
+
+    ///////////////
+
+    /*
+     * @param url {string}
+     * @param config {Object} The $http config. Optional.
+     * @param fetch {function} Called with the url and config when no response is
+     * kept, returns the promise of the response
+     * @returns {Promise} Resolved with the response
+     */
+    function get(url, config, fetch) {
+      var key = url + '?' + $httpParamSerializer((config || {}).params);
+      var entry = getEntry(key);
+      if (entry) {
+        return $q.when(copyResponse(entry.response));
+      }
+      return fetch(url, config).then(function onResponse(response) {
+        if (response && response.status === 200) {
+          store(key, {
+            url: url,
+            time: Date.now(),
+            response: copyResponse(response)
+          });
+        }
+        return response;
+      });
+    }
+
+    /*
+     * Look for an item in the kept responses of a listing, in their latest
+     * version.
+     *
+     * @param url {string} The URL of the listing
+     * @param itemsKey {string} Key of the items in the listing responses
+     * @param id {string}
+     * @returns {Promise} Resolved with a response holding the item, or undefined
+     * when no listing has it
+     */
+    function findItem(url, itemsKey, id) {
+      var found;
+      // The most recently used listings come last
+      keys.slice().forEach(function lookIn(key) {
+        var entry = getEntry(key, true);
+        if (entry && entry.url === url) {
+          (entry.response.data[itemsKey] || []).forEach(function check(item) {
+            if (item.id === id) {
+              found = item;
+            }
+          });
+        }
+      });
+      if (found) {
+        return $q.when({status: 200, data: angular.copy(found)});
+      }
+      return undefined;
+    }
+
+    /*
+     * Forget the responses of the URLs starting with a prefix
+     */
+    function invalidate(urlPrefix) {
+      keys.filter(function isUnder(key) {
+        return key.indexOf(urlPrefix) === 0;
+      }).forEach(remove);
+    }
+
+    /*
+     * @returns {Object} The entry of a key if still in use, after marking it as
+     * the most recently used one unless peeking
+     */
+    function getEntry(key, peek) {
+      var entry = entries[key];
+      if (!entry) {
+        return undefined;
+      }
+      if (Date.now() - entry.time > ttl) {
+        remove(key);
+        return undefined;
+      }
+      if (!peek) {
+        keys.splice(keys.indexOf(key), 1);
+        keys.push(key);
+      }
+      return entry;
+    }
+
+    function store(key, entry) {
+      remove(key);
+      entries[key] = entry;
+      keys.push(key);
+      if (keys.length > maxEntries) {
+        delete entries[keys.shift()];
+      }
+    }
+
+    function remove(key) {
+      if (entries.hasOwnProperty(key)) {
+        delete entries[key];
+        keys.splice(keys.indexOf(key), 1);
+      }
+    }
+
+    // Callers modify the data they get, so always hand out a copy
+    function copyResponse(response) {
+      return {
+        status: response.status,
+        data: angular.copy(response.data),
+        headers: response.headers,
+        config: response.config
+      };
+    }
+  }
+}());
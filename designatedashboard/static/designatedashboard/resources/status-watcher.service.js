@@ -0,0 +1,201 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+(function () {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .factory('designatedashboard.resources.statusWatcher', statusWatcherService);
+
+  statusWatcherService.$inject = [
+    '$rootScope',
+    '$timeout',
+    'designatedashboard.apiPassthroughUrl',
+    'designatedashboard.resources.util',
+    'horizon.framework.util.http.service'
+  ];
+
+  /*
+   * @ngdoc service
+   * @name designatedashboard.resources.statusWatcher
+   * @description
+   * Watches the PENDING items of a listing with the long polling status API, which
+   * answers once some of them changed. Changed items are updated in place, and
+   * deleted ones removed from the listing, so that the table shows them without
+   * listing everything again. Watching goes on until no item is pending.
+   *
+   * Each status request holds a web server worker while it waits. After a request
+   * answered with no change, or failed, the next one waits for a delay that doubles
+   * every time, and watching stops after several of them in a row, so that items
+   * stuck in PENDING do not hold a worker for as long as the page is open.
+   *
+   * Only the last listing of each resource type is watched, and none once the user
+   * leaves the page. Row actions that make a listed item pending resume the watch
+   * of its listing.
+   * @returns {Object} The service
+   */
+  function statusWatcherService($rootScope, $timeout, apiPassthroughUrl, util, httpService) {
+    // Milliseconds before the request following one with no change or an error,
+    // doubled every time up to the maximum
+    var firstDelay = 5000;
+    var maxDelay = 60000;
+    // Number of requests in a row with no change or an error that stops watching
+    var maxIdleRounds = 6;
+    // Each watch has a generation, it stops once another watch of its resource type starts
+    var lastGeneration = 0;
+    var generations = {};
+    // The resume function of the watch of each resource type
+    var polls = {};
+
+    var service = {
+      watchZones: watchZones,
+      watchRecordSets: watchRecordSets,
+      resume: resume
+    };
+
+    $rootScope.$on('$locationChangeSuccess', function stopAll() {
+      generations = {};
+      polls = {};
+    });
+
+    return service;
+
+    ///////////////
+
+    /*
+     * @param zones {Array} - The listed zones, which are updated in place
+     */
+    function watchZones(zones) {
+      watch('zones', zones, function makeRequest(pending) {
+        return {zones: pending.map(getId)};
+      }, function getChanges(data) {
+        return {updated: data.zones, deleted: data.deleted.zones};
+      });
+    }
+
+    /*
+     * @param recordSets {Array} - The listed record sets, which are updated in place
+     */
+    function watchRecordSets(recordSets) {
+      watch('recordsets', recordSets, function makeRequest(pending) {
+        return {
+          recordsets: pending.map(function toRef(recordSet) {
+            return {zone_id: recordSet.zone_id, id: recordSet.id};
+          })
+        };
+      }, function getChanges(data) {
+        return {updated: data.recordsets, deleted: data.deleted.recordsets.map(getId)};
+      });
+    }
+
+    /*
+     * Watch the last listing of a resource type again, after some of its items
+     * became pending, even when watching it had stopped after requests with no
+     * change. Nothing is done while a status request of the listing is already
+     * waiting.
+     *
+     * @param type {string} - 'zones' or 'recordsets'
+     */
+    function resume(type) {
+      if (polls[type]) {
+        polls[type]();
+      }
+    }
+
+    function watch(type, items, makeRequest, getChanges) {
+      var generation = ++lastGeneration;
+      var waiting = false;
+      var idleRounds = 0;
+      var timer = null;
+      generations[type] = generation;
+      polls[type] = restart;
+      poll();
+
+      function restart() {
+        idleRounds = 0;
+        poll();
+      }
+
+      function poll() {
+        if (timer) {
+          $timeout.cancel(timer);
+          timer = null;
+        }
+        if (generations[type] !== generation || waiting) {
+          return;
+        }
+        var pending = items.filter(function isPending(item) {
+          return item.status === 'PENDING' && !item._otherRegion;
+        });
+        if (pending.length > 0) {
+          waiting = true;
+          httpService.post(apiPassthroughUrl + 'v2/status/', makeRequest(pending))
+            .then(onStatus, onError);
+        }
+      }
+
+      function pollLater() {
+        idleRounds++;
+        if (idleRounds >= maxIdleRounds || generations[type] !== generation) {
+          return;
+        }
+        var delay = Math.min(firstDelay * Math.pow(2, idleRounds - 1), maxDelay);
+        timer = $timeout(poll, delay, false);
+      }
+
+      function onError() {
+        waiting = false;
+        pollLater();
+      }
+
+      function onStatus(response) {
+        waiting = false;
+        if (generations[type] !== generation) {
+          return;
+        }
+        var changes = getChanges(response.data);
+        if (changes.updated.length === 0 && changes.deleted.length === 0) {
+          pollLater();
+          return;
+        }
+        idleRounds = 0;
+        changes.updated.forEach(function updateItem(resource) {
+          var item = findItem(items, resource.id);
+          if (item) {
+            util.updateItem(item, resource);
+          }
+        });
+        for (var index = items.length - 1; index >= 0; index--) {
+          if (changes.deleted.indexOf(items[index].id) !== -1) {
+            items.splice(index, 1);
+          }
+        }
+        poll();
+      }
+    }
+
+    function findItem(items, id) {
+      for (var index = 0; index < items.length; index++) {
+        if (items[index].id === id) {
+          return items[index];
+        }
+      }
+      return undefined;
+    }
+
+    function getId(item) {
+      return item.id;
+    }
+  }
+}());
@@ -21,17 +21,27 @@
     .factory('designatedashboard.resources.util', utilService);
 
   utilService.$inject = [
+    'horizon.framework.util.actions.action-result.service',
     'horizon.framework.util.q.extensions'
   ];
 
-  function utilService($qExtensions) {
+  function utilService(actionResultService, $qExtensions) {
+    // Number of items updated in place so far
+    var updates = 0;
     var service = {
       notDeleted: notDeleted,
       notPending: notPending,
+      inCurrentRegion: inCurrentRegion,
       getModel: getModel,
       actionMap: actionMap,
       statusMap: statusMap,
-      addTimestampIds: addTimestampIds
+      addTimestampIds: addTimestampIds,
+      updateItem: updateItem,
+      updateBatchItems: updateBatchItems,
+      updateCount: updateCount,
+      inPlaceResult: inPlaceResult,
+      wildcardFilters: wildcardFilters,
+      markRegions: markRegions
     };
 
     return service;
@@ -46,6 +56,10 @@
       return $qExtensions.booleanAsPromise(resource.status !== 'PENDING');
     }
 
+    function inCurrentRegion(resource) {
+      return $qExtensions.booleanAsPromise(!resource._otherRegion);
+    }
+
     /*
      * Build a model object based on the given item, using only the fields
      * present in the form config 'key's. Only 'truthy' values are copied.
@@ -85,21 +99,142 @@
      * When this field is used as a track-by in hz-resource-table, items in the table to update
      * after row actions.
      *
-     * If a timestamp field is not specified, the current time is used.
+     * If a timestamp field is not specified, a hash of the content of the item is used. Either
+     * way, the key stays the same as long as the item does, so refreshing the table only
+     * re-renders the rows of the items that changed.
      *
      * @param items {object} - The items to add a _timestampId.
      * @param idField {string} - (Optional) A field on the item to use as the id. Defaults to 'id'
      * @param timestampField {string} - (Optional) A field on item to use as a timestamp. Defaults
-     * to current time.
+     * to a hash of the item content.
      */
     function addTimestampIds(items, idField, timestampField) {
       var _idField = idField || 'id';
-      var timestamp = Date.now();
-      items.map(function annotateFloatingIp(item) {
-        if (angular.isDefined(timestampField)) {
-          timestamp = item[timestampField];
+      items.forEach(function annotateItem(item) {
+        var version = angular.isDefined(timestampField) ? item[timestampField] : contentHash(item);
+        item._timestampId = item[_idField] + version;
+      });
+    }
+
+    /*
+     * Update a listed item in place with a newer version of its resource, such as the one
+     * returned by an update API. Only the fields of the item are updated, so that it keeps
+     * the content, and track-by key, a new listing would give it.
+     *
+     * @param item {object} - The listed item
+     * @param resource {object} - The newer version of the resource
+     */
+    function updateItem(item, resource) {
+      Object.keys(item).forEach(function updateField(key) {
+        if (resource.hasOwnProperty(key)) {
+          item[key] = resource[key];
+        }
+      });
+      addTimestampIds([item]);
+      updates++;
+    }
+
+    /*
+     * The number of items updated in place by updateItem so far, which views can watch
+     * instead of the versions of all their items.
+     */
+    function updateCount() {
+      return updates;
+    }
+
+    /*
+     * Update listed items in place with the successful results of a batch API, which
+     * hold the 'id' of their item.
+     *
+     * @param items {Array} - The listed items
+     * @param results {Array} - The 'results' of the batch API response
+     * @returns {Array} The failed results
+     */
+    function updateBatchItems(items, results) {
+      var byId = {};
+      items.forEach(function addItem(item) {
+        byId[item.id] = item;
+      });
+      return results.filter(function apply(result) {
+        if (result.status !== 'success') {
+          return true;
+        }
+        if (byId.hasOwnProperty(result.id)) {
+          updateItem(byId[result.id], result.result);
         }
-        item._timestampId = item[_idField] + timestamp;
+        return false;
+      });
+    }
+
+    /*
+     * The result of an action that updated its items in place with updateItem or
+     * updateBatchItems. The table already shows the changes, so the result has no
+     * updated items, which would make the table list them again, only the failed ones.
+     *
+     * @param resourceType {string} - (Optional) The resource type of the failed items
+     * @param failed {Array} - (Optional) The failed results of a batch API
+     */
+    function inPlaceResult(resourceType, failed) {
+      var actionResult = actionResultService.getActionResult();
+      (failed || []).forEach(function markFailed(result) {
+        actionResult.failed(resourceType, result.id);
+      });
+      return actionResult.result;
+    }
+
+    /*
+     * FNV-1a hash of the fields of an item, leaving out the synthetic ones starting
+     * with '_' or '$', in key order.
+     */
+    function contentHash(item) {
+      var content = {};
+      Object.keys(item).sort().forEach(function addField(key) {
+        if (key.charAt(0) !== '_' && key.charAt(0) !== '$') {
+          content[key] = item[key];
+        }
+      });
+      var text = JSON.stringify(content);
+      var hash = 0x811c9dc5;
+      for (var index = 0; index < text.length; index++) {
+        hash ^= text.charCodeAt(index);
+        hash = Math.imul(hash, 0x01000193);
+      }
+      return ':' + (hash >>> 0).toString(36);
+    }
+
+    /*
+     * Designate only does exact matches on filters without a '*' wildcard. Turn free text
+     * search facets into 'contains' searches, which is how they behaved when filtering
+     * in the browser.
+     *
+     * @param params {object} - The list function params
+     * @param keys {Array} - The names of the free text filters in params
+     * @returns {object} A copy of params with wildcards added to the free text filters
+     */
+    function wildcardFilters(params, keys) {
+      var result = angular.extend({}, params);
+      keys.forEach(function addWildcards(key) {
+        if (angular.isString(result[key]) && result[key].indexOf('*') === -1) {
+          result[key] = '*' + result[key] + '*';
+        }
+      });
+      return result;
+    }
+
+    /*
+     * All regions listings tag every item with its 'region', and give the region selected by
+     * the user as 'current_region'. The API calls of the row actions go to that region, so
+     * flag the items of the other regions with '_otherRegion' to disable their actions.
+     *
+     * @param items {Array} - The listed items
+     * @param data {object} - The data of the list response
+     */
+    function markRegions(items, data) {
+      if (!data.current_region) {
+        return;
+      }
+      items.forEach(function markRegion(item) {
+        item._otherRegion = item.region !== data.current_region;
       });
     }
   }
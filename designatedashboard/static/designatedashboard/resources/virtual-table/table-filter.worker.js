@@ -0,0 +1,201 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+
+/*
+ * Web Worker filtering and sorting the rows of dns-virtual-resource-table, see
+ * the dnsWorkerPipe directive.
+ *
+ * An 'index' message hands it the rows, as flat objects of their fields, and
+ * an 'update' message the rows that changed since, by index. A
+ * 'query' message asks for the rows matching a smart-table search predicate
+ * object, in the order of a sort predicate. It is answered with the indexes of
+ * these rows, along with the generation of the query.
+ *
+ * The rows are indexed once per 'index' message, by the distinct lower case
+ * text of each field, and the index is patched by 'update' messages. A search
+ * looks through the distinct texts of its field rather than through the rows,
+ * which answers searches of fields with few values, such as the type or status,
+ * without going through the rows, and the row indexes found for each field
+ * are intersected. Typing more of a search only looks through the texts
+ * matching what was typed before. The sort orders are prepared once asked for.
+ */
+(function () {
+  'use strict';
+
+  // The static file discovery of Horizon also loads this file in the page
+  if (typeof WorkerGlobalScope === 'undefined' || !(self instanceof WorkerGlobalScope)) {
+    return;
+  }
+
+  // Rows with their lower case text, by field and as a whole under '$'
+  var rows = [];
+  // Indexes of the rows, by field and by lower case text
+  var texts = {};
+  // Sorted row indexes, by field
+  var orders = {};
+  // Last search of each field, with its matching row indexes
+  var searches = {};
+
+  self.onmessage = function onMessage(event) {
+    var message = event.data;
+    if (message.type === 'index') {
+      index(message.rows);
+    } else if (message.type === 'update') {
+      update(message.rows);
+    } else if (message.type === 'query') {
+      self.postMessage({
+        generation: message.generation,
+        indexes: query(message.search || {}, message.sort || {})
+      });
+    }
+  };
+
+  function index(newRows) {
+    rows = newRows.map(prepare);
+    texts = {};
+    rows.forEach(addRow);
+    orders = {};
+    searches = {};
+  }
+
+  function update(changedRows) {
+    Object.keys(changedRows).forEach(function replace(rowIndex) {
+      rowIndex = Number(rowIndex);
+      removeRow(rows[rowIndex], rowIndex);
+      rows[rowIndex] = prepare(changedRows[rowIndex]);
+      addRow(rows[rowIndex], rowIndex);
+    });
+    orders = {};
+    searches = {};
+  }
+
+  function addRow(row, rowIndex) {
+    Object.keys(row.text).forEach(function addText(key) {
+      var byText = texts[key] = texts[key] || Object.create(null);
+      var text = row.text[key];
+      (byText[text] = byText[text] || []).push(rowIndex);
+    });
+  }
+
+  function removeRow(row, rowIndex) {
+    if (!row) {
+      return;
+    }
+    Object.keys(row.text).forEach(function removeText(key) {
+      var byText = texts[key];
+      var text = row.text[key];
+      var indexes = byText[text];
+      indexes.splice(indexes.indexOf(rowIndex), 1);
+      if (indexes.length === 0) {
+        delete byText[text];
+      }
+    });
+  }
+
+  function prepare(row) {
+    var text = {};
+    var all = [];
+    Object.keys(row).forEach(function addField(key) {
+      text[key] = String(row[key]).toLowerCase();
+      all.push(text[key]);
+    });
+    text.$ = all.join('\n');
+    return {values: row, text: text};
+  }
+
+  function query(search, sort) {
+    var matches = null;
+    Object.keys(search).forEach(function applySearch(key) {
+      var found = find(key, String(search[key]).toLowerCase());
+      matches = matches ? intersect(matches, found) : found;
+    });
+
+    var order = sort.predicate ? getOrder(sort.predicate) : allIndexes();
+    if (sort.reverse) {
+      order = order.slice().reverse();
+    }
+    if (!matches) {
+      return order;
+    }
+    var matching = {};
+    matches.forEach(function mark(rowIndex) {
+      matching[rowIndex] = true;
+    });
+    return order.filter(function isMatching(rowIndex) {
+      return matching[rowIndex];
+    });
+  }
+
+  /*
+   * @returns {Array} The indexes of the rows whose field holds the text
+   */
+  function find(key, text) {
+    var byText = texts[key] || {};
+    var last = searches[key];
+    var candidates = last && text.indexOf(last.text) === 0 ? last.texts : Object.keys(byText);
+    var found = candidates.filter(function contains(fieldText) {
+      return fieldText.indexOf(text) !== -1;
+    });
+    searches[key] = {text: text, texts: found};
+    var matches = [];
+    found.forEach(function addIndexes(fieldText) {
+      Array.prototype.push.apply(matches, byText[fieldText]);
+    });
+    return matches;
+  }
+
+  function getOrder(key) {
+    if (!orders.hasOwnProperty(key)) {
+      orders[key] = allIndexes().sort(function compare(first, second) {
+        var firstValue = sortValue(rows[first], key);
+        var secondValue = sortValue(rows[second], key);
+        if (firstValue === secondValue) {
+          return first - second;
+        }
+        // Rows without the field go last
+        if (firstValue === undefined) {
+          return 1;
+        }
+        if (secondValue === undefined) {
+          return -1;
+        }
+        return firstValue < secondValue ? -1 : 1;
+      });
+    }
+    return orders[key];
+  }
+
+  function sortValue(row, key) {
+    var value = row.values[key];
+    return typeof value === 'number' ? value : row.text[key];
+  }
+
+  function allIndexes() {
+    var indexes = new Array(rows.length);
+    for (var rowIndex = 0; rowIndex < rows.length; rowIndex++) {
+      indexes[rowIndex] = rowIndex;
+    }
+    return indexes;
+  }
+
+  function intersect(first, second) {
+    var inSecond = {};
+    second.forEach(function mark(rowIndex) {
+      inSecond[rowIndex] = true;
+    });
+    return first.filter(function isInSecond(rowIndex) {
+      return inSecond[rowIndex];
+    });
+  }
+}());
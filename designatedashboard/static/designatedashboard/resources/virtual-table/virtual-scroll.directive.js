@@ -0,0 +1,121 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+(function() {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .directive('dnsVirtualScroll', directive);
+
+  directive.$inject = ['$window'];
+
+  // Rows rendered above and below the visible ones, so that scrolling a little
+  // does not show blank space
+  var OVERSCAN = 10;
+  // Row height assumed until a row has been rendered and measured
+  var DEFAULT_ROW_HEIGHT = 37;
+  var NO_ROWS = [];
+
+  /**
+   * @ngdoc directive
+   * @name dnsVirtualScroll
+   * @description
+   * Computes the window of rows to render in a scrolling table, as `vs` on
+   * the scope: `begin` and `limit` for a limitTo filter on the rows, and the
+   * `before` and `after` heights in pixels of the spacer rows that stand in
+   * for the rows outside the window. The element is the scroll container of
+   * the table and the attribute value is the expression of the rows.
+   *
+   * Rows are assumed to have about the same height, which is measured on the
+   * rendered rows carrying the dns-virtual-row class.
+   *
+   * @example
+   ```
+   <div dns-virtual-scroll="items">
+     <table>
+       <tbody>
+         <tr ng-style="{height: vs.before + 'px'}"></tr>
+         <tr class="dns-virtual-row"
+             ng-repeat="item in items | limitTo:vs.limit:vs.begin">...</tr>
+         <tr ng-style="{height: vs.after + 'px'}"></tr>
+       </tbody>
+     </table>
+   </div>
+   ```
+   */
+  function directive($window) {
+    var directive = {
+      restrict: 'A',
+      link: link
+    };
+
+    return directive;
+
+    function link(scope, element, attrs) {
+      var container = element[0];
+      var rowHeight = DEFAULT_ROW_HEIGHT;
+      var vs = scope.vs = {begin: 0, limit: 0, before: 0, after: 0};
+
+      element.on('scroll', onScroll);
+      angular.element($window).on('resize', onScroll);
+      scope.$on('$destroy', function() {
+        angular.element($window).off('resize', onScroll);
+      });
+      // Sorting and filtering replace the rows, updates in place change their count
+      scope.$watch(getRows, update);
+      scope.$watch(function() {
+        return getRows().length;
+      }, update);
+
+      function getRows() {
+        return scope.$eval(attrs.dnsVirtualScroll) || NO_ROWS;
+      }
+
+      function onScroll() {
+        var begin = vs.begin;
+        var limit = vs.limit;
+        update();
+        if (vs.begin !== begin || vs.limit !== limit) {
+          scope.$applyAsync();
+        }
+      }
+
+      function update() {
+        measureRows();
+        var count = getRows().length;
+        var tbody = container.querySelector('tbody');
+        var offset = tbody ? tbody.offsetTop : 0;
+        var top = Math.max(0, container.scrollTop - offset);
+        var visible = Math.ceil(container.clientHeight / rowHeight);
+
+        vs.limit = visible + 2 * OVERSCAN;
+        vs.begin = Math.max(0, Math.min(Math.floor(top / rowHeight) - OVERSCAN,
+                                        count - vs.limit));
+        vs.before = vs.begin * rowHeight;
+        vs.after = Math.max(0, count - vs.begin - vs.limit) * rowHeight;
+      }
+
+      function measureRows() {
+        var rows = container.querySelectorAll('tr.dns-virtual-row');
+        var height = 0;
+        for (var index = 0; index < rows.length; index++) {
+          height += rows[index].offsetHeight;
+        }
+        if (height > 0) {
+          rowHeight = height / rows.length;
+        }
+      }
+    }
+  }
+})();
@@ -0,0 +1,94 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+(function() {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .directive('dnsVirtualResourceTable', resourceTableDirective)
+    .directive('dnsVirtualDynamicTable', dynamicTableDirective);
+
+  resourceTableDirective.$inject = ['designatedashboard.basePath'];
+  dynamicTableDirective.$inject = ['designatedashboard.basePath'];
+
+  /**
+   * @ngdoc directive
+   * @scope
+   * @name dnsVirtualResourceTable
+   * @description
+   * A hz-resource-table that only renders the rows scrolled into view, so that
+   * tables of many thousands of resources stay responsive. Sorting, filtering
+   * and selecting all rows still apply to every listed resource.
+   *
+   * @property resource-type-name {string}
+   * The resource name in the registry
+   *
+   * @property track-by {string} (optional)
+   * The track-by string to pass to the table
+   *
+   * @property list-function-extra-params {object} (optional)
+   * Extra parameters required by this resource type's list function.
+   *
+   * @example
+   ```
+   <dns-virtual-resource-table
+      resource-type-name="OS::Designate::FloatingIp"
+      track-by="_timestampId">
+   </dns-virtual-resource-table>
+   ```
+   */
+  function resourceTableDirective(basePath) {
+    var directive = {
+      restrict: 'E',
+      scope: {
+        resourceTypeName: '@',
+        trackBy: '@?',
+        listFunctionExtraParams: '=?'
+      },
+      bindToController: true,
+      templateUrl: basePath + 'resources/virtual-table/virtual-resource-table.html',
+      controller: 'horizon.framework.widgets.table.ResourceTableController as ctrl'
+    };
+
+    return directive;
+  }
+
+  /**
+   * @ngdoc directive
+   * @scope
+   * @name dnsVirtualDynamicTable
+   * @description
+   * The hz-dynamic-table of dnsVirtualResourceTable, which takes the same
+   * attributes, but renders its rows through dnsVirtualScroll.
+   */
+  function dynamicTableDirective(basePath) {
+    var directive = {
+      restrict: 'E',
+      scope: {
+        config: '=',
+        safeSrcItems: '=items',
+        table: '=',
+        batchActions: '=?',
+        itemActions: '=?',
+        filterFacets: '=?',
+        resultHandler: '=?',
+        itemInTransitionFunction: '=?'
+      },
+      controller: 'horizon.framework.widgets.table.HzDynamicTableController',
+      templateUrl: basePath + 'resources/virtual-table/virtual-dynamic-table.html'
+    };
+
+    return directive;
+  }
+})();
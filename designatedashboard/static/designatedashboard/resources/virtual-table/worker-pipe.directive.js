@@ -0,0 +1,177 @@
+/**
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may
+ * not use this file except in compliance with the License. You may obtain
+ * a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+ * License for the specific language governing permissions and limitations
+ * under the License.
+ */
+(function() {
+  'use strict';
+
+  angular
+    .module('designatedashboard.resources')
+    .directive('dnsWorkerPipe', directive);
+
+  directive.$inject = [
+    '$parse',
+    '$window',
+    'designatedashboard.basePath',
+    'designatedashboard.resources.util'
+  ];
+
+  /**
+   * @ngdoc directive
+   * @name dnsWorkerPipe
+   * @description
+   * Replaces the pipe of a smart-table, which searches and sorts its rows, by
+   * one running in a Web Worker, so that the page stays responsive while large
+   * tables are searched as the user types. The rows are handed to the worker
+   * whenever the st-safe-src items change, and the table shows the rows it
+   * answers with. Items updated in place by util.updateItem, which gives them a
+   * new _timestampId and bumps util.updateCount, are handed to the worker again
+   * on their own.
+   *
+   * Browsers without Web Workers, and sorting by function, keep the smart-table
+   * pipe.
+   *
+   * @example
+   ```
+   <div st-table="items" st-safe-src="safeSrcItems" dns-worker-pipe>
+   ```
+   */
+  function directive($parse, $window, basePath, util) {
+    var directive = {
+      restrict: 'A',
+      require: 'stTable',
+      link: {
+        pre: preLink
+      }
+    };
+
+    return directive;
+
+    function preLink(scope, element, attrs, stTable) {
+      if (!$window.Worker) {
+        return;
+      }
+
+      var worker = new $window.Worker(
+        basePath + 'resources/virtual-table/table-filter.worker.js');
+      var getItems = $parse(attrs.stSafeSrc);
+      var setDisplayed = $parse(attrs.stTable).assign;
+      var smartTablePipe = stTable.pipe;
+      // The items handed to the worker, which answers with their indexes, and
+      // their versions
+      var indexed = [];
+      var versions = [];
+      // Answers to former queries, or about former items, are dropped
+      var generation = 0;
+
+      stTable.preventPipeOnWatch();
+      stTable.pipe = pipe;
+      worker.onmessage = onAnswer;
+      scope.$on('$destroy', function() {
+        worker.terminate();
+      });
+      scope.$watchGroup([
+        function() {
+          return getItems(scope);
+        },
+        function() {
+          var items = getItems(scope);
+          return items ? items.length : 0;
+        },
+        util.updateCount
+      ], onChange);
+
+      function onChange(newValues, oldValues) {
+        if (newValues === oldValues || newValues[0] !== oldValues[0] ||
+            newValues[1] !== oldValues[1]) {
+          reindex();
+        } else {
+          update();
+        }
+      }
+
+      function reindex() {
+        indexed = [].concat(getItems(scope) || []);
+        versions = indexed.map(getVersion);
+        worker.postMessage({type: 'index', rows: indexed.map(toRow)});
+        stTable.pipe();
+      }
+
+      /*
+       * Hand the worker the items updated in place since they were indexed
+       */
+      function update() {
+        var rows = {};
+        indexed.forEach(function checkItem(item, index) {
+          var version = getVersion(item);
+          if (version !== versions[index]) {
+            versions[index] = version;
+            rows[index] = toRow(item);
+          }
+        });
+        worker.postMessage({type: 'update', rows: rows});
+        stTable.pipe();
+      }
+
+      function pipe() {
+        var state = stTable.tableState();
+        if (angular.isFunction(state.sort.predicate)) {
+          generation++;
+          return smartTablePipe.call(stTable);
+        }
+        worker.postMessage({
+          type: 'query',
+          generation: ++generation,
+          search: state.search.predicateObject,
+          sort: {predicate: state.sort.predicate, reverse: state.sort.reverse}
+        });
+      }
+
+      function onAnswer(event) {
+        if (event.data.generation !== generation) {
+          return;
+        }
+        var rows = event.data.indexes.map(function getItem(index) {
+          return indexed[index];
+        });
+        scope.$applyAsync(function() {
+          setDisplayed(scope, rows);
+        });
+      }
+    }
+
+    function getVersion(item) {
+      return String(item._timestampId);
+    }
+
+    /*
+     * The fields of an item that can be searched and sorted, as the worker
+     * gets a copy of them. Lists are searched as the text of their values.
+     */
+    function toRow(item) {
+      var row = {};
+      Object.keys(item).forEach(function addField(key) {
+        var value = item[key];
+        if (key.charAt(0) === '_' || key.charAt(0) === '$') {
+          return;
+        }
+        if (angular.isArray(value)) {
+          value = value.join(' ');
+        }
+        if (value !== null && value !== undefined && !angular.isObject(value)) {
+          row[key] = value;
+        }
+      });
+      return row;
+    }
+  }
+})();
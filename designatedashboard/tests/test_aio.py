@@ -0,0 +1,96 @@
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+import threading
+import time
+
+from designatedashboard import aio
+from designatedashboard.tests import base
+
+
+class GatherTests(base.TestCase):
+
+    def test_empty(self):
+        self.assertEqual([], aio.gather([]))
+
+    def test_results_in_order(self):
+        def call(value, delay):
+            def run():
+                time.sleep(delay)
+                return value
+            return run
+
+        results = aio.gather([call(1, 0.2), call(2, 0), call(3, 0.1)])
+        self.assertEqual([1, 2, 3], results)
+
+    def test_exceptions_returned(self):
+        def fail():
+            raise ValueError('boom')
+
+        results = aio.gather([fail, lambda: 'ok'])
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual('ok', results[1])
+
+    def test_timeout(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        start = time.monotonic()
+        results = aio.gather([event.wait, lambda: 'ok'], timeout=0.2)
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertIsInstance(results[0], TimeoutError)
+        self.assertEqual('ok', results[1])
+
+    def test_concurrency(self):
+        lock = threading.Lock()
+        running = [0]
+        highest = [0]
+
+        def call():
+            with lock:
+                running[0] += 1
+                highest[0] = max(highest[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        aio.gather([call] * 10, concurrency=3)
+        self.assertEqual(3, highest[0])
+
+    def test_nested_runs_inline(self):
+        def inner():
+            return threading.current_thread().name
+
+        def outer():
+            return threading.current_thread().name, aio.gather([inner])[0]
+
+        outer_thread, inner_thread = aio.gather([outer])[0]
+        self.assertEqual(outer_thread, inner_thread)
+
+    def test_region_pool_runs_default_calls(self):
+        def inner():
+            return threading.current_thread().name
+
+        def outer():
+            return aio.gather([inner])[0]
+
+        result = aio.gather([outer], pool=aio.REGION_POOL)[0]
+        self.assertIn('-%s_' % aio.DEFAULT_POOL, result)
+
+    def test_region_timeouts_leave_default_pool(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        blocked = aio.gather([event.wait] * aio.REGION_WORKERS, timeout=0.1,
+                             pool=aio.REGION_POOL)
+        self.assertTrue(all(isinstance(result, TimeoutError)
+                            for result in blocked))
+        self.assertEqual(['ok'], aio.gather([lambda: 'ok'], timeout=2))
@@ -0,0 +1,755 @@
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+import datetime
+from unittest import mock
+
+from django.core.files import uploadedfile
+from django.test import client
+import fixtures
+from openstack.dns.v2 import floating_ip as _fip
+from openstack.dns.v2 import recordset as _rs
+from openstack.dns.v2 import zone as _zone
+from openstack import exceptions as sdk_exceptions
+from openstack_dashboard.api.rest import utils as rest_utils
+from oslo_serialization import jsonutils
+
+from designatedashboard.api.rest import designate
+from designatedashboard.tests import base
+
+
+def make_request(data=None, headers=None, **params):
+    request = client.RequestFactory().get(
+        '/', params, HTTP_X_REQUESTED_WITH='XMLHttpRequest', **(headers or {}))
+    request.user = mock.Mock(project_id='project', services_region='region',
+                             service_catalog=[])
+    request.DATA = data
+    return request
+
+
+def make_data_request(method, data):
+    request = client.RequestFactory().generic(
+        method, '/', jsonutils.dumps(data), content_type='application/json',
+        HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+    request.user = mock.Mock(project_id='project', services_region='region',
+                             service_catalog=[])
+    return request
+
+
+def json_body(response):
+    if response.streaming:
+        content = b''.join(response.streaming_content)
+    else:
+        content = response.content
+    return jsonutils.loads(content)
+
+
+class APITestCase(base.TestCase):
+
+    def setUp(self):
+        super(APITestCase, self).setUp()
+        self.conn = mock.Mock()
+        self.useFixture(fixtures.MockPatchObject(
+            designate, 'get_sdk_connection', return_value=self.conn))
+
+
+class ListResourcesTests(APITestCase):
+
+    def setUp(self):
+        super(ListResourcesTests, self).setUp()
+        self.zones = [{'id': 'zone%d' % index, 'name': 'z%d.example.com.' %
+                       index} for index in range(5)]
+        self.queries = []
+
+        def list_pages(request, conn, path, key, cache=True, **params):
+            self.queries.append(params)
+            zones = self.zones
+            if params.get('sort_dir') == 'desc':
+                zones = zones[::-1]
+            if 'marker' in params:
+                ids = [zone['id'] for zone in zones]
+                zones = zones[ids.index(params['marker']) + 1:]
+            limit = params.get('limit', len(zones))
+            # Pages of at most two zones, as Designate would cap them
+            for start in range(0, min(limit, len(zones)), 2):
+                yield zones[start:min(start + 2, limit)]
+
+        self.useFixture(fixtures.MockPatchObject(
+            designate, '_list_pages', side_effect=list_pages))
+
+    def list(self, **params):
+        items, markers = designate._list_resources(
+            make_request(**params), self.conn, _zone.Zone,
+            designate.ZONES_PATH, 'zones')
+        return [item['id'] for item in items], markers
+
+    def test_all(self):
+        ids, markers = self.list()
+        self.assertEqual(['zone%d' % index for index in range(5)], ids)
+        self.assertIsNone(markers['next'])
+        self.assertIsNone(markers['prev'])
+        self.assertIn('timestamp', markers)
+        self.assertEqual([{}], self.queries)
+
+    def test_first_page(self):
+        ids, markers = self.list(limit=2, sort_key='name')
+        self.assertEqual(['zone0', 'zone1'], ids)
+        self.assertEqual('zone1', markers['next'])
+        self.assertIsNone(markers['prev'])
+        # One more zone than the page is asked for, to find the next page
+        self.assertEqual([{'limit': 3, 'sort_key': 'name'}], self.queries)
+
+    def test_next_page(self):
+        ids, markers = self.list(limit=2, marker='zone1')
+        self.assertEqual(['zone2', 'zone3'], ids)
+        self.assertEqual('zone3', markers['next'])
+        self.assertEqual('zone2', markers['prev'])
+
+    def test_last_page(self):
+        ids, markers = self.list(limit=2, marker='zone3')
+        self.assertEqual(['zone4'], ids)
+        self.assertIsNone(markers['next'])
+        self.assertEqual('zone4', markers['prev'])
+
+    def test_previous_page(self):
+        ids, markers = self.list(limit=2, marker='zone3',
+                                 reversed_order='true')
+        self.assertEqual(['zone1', 'zone2'], ids)
+        self.assertEqual('zone2', markers['next'])
+        self.assertEqual('zone1', markers['prev'])
+        self.assertEqual([{'limit': 3, 'marker': 'zone3', 'sort_dir': 'desc'}],
+                         self.queries)
+
+    def test_first_page_backwards(self):
+        ids, markers = self.list(limit=2, marker='zone2', sort_dir='asc',
+                                 reversed_order='true')
+        self.assertEqual(['zone0', 'zone1'], ids)
+        self.assertEqual('zone1', markers['next'])
+        self.assertIsNone(markers['prev'])
+
+
+class RecordSetsListTests(APITestCase):
+
+    def setUp(self):
+        super(RecordSetsListTests, self).setUp()
+        self.recordsets = [
+            {'id': 'rs%d' % index, 'name': 'r%d.example.com.' % index,
+             'type': 'A', 'records': ['192.0.2.%d' % index]}
+            for index in range(3)]
+        self.list_pages = self.useFixture(fixtures.MockPatchObject(
+            designate, '_list_pages',
+            side_effect=lambda *args, **kwargs: iter([self.recordsets]))).mock
+
+    def test_page(self):
+        response = designate.RecordSets().get(
+            make_request(limit=2, sort_key='name', type='A'), 'zone')
+        self.assertEqual(200, response.status_code)
+        body = json_body(response)
+        self.assertEqual(['rs0', 'rs1'],
+                         [rs['id'] for rs in body['recordsets']])
+        self.assertEqual(['zone', 'zone'],
+                         [rs['zone_id'] for rs in body['recordsets']])
+        self.assertEqual('rs1', body['next'])
+        self.assertIsNone(body['prev'])
+        self.list_pages.assert_called_once_with(
+            mock.ANY, self.conn, '/zones/zone/recordsets', 'recordsets',
+            limit=3, sort_key='name', type='A')
+
+    def test_streamed(self):
+        response = designate.RecordSets().get(make_request(), 'zone')
+        self.assertTrue(response.streaming)
+        body = json_body(response)
+        self.assertEqual(['rs0', 'rs1', 'rs2'],
+                         [rs['id'] for rs in body['recordsets']])
+        self.assertEqual({'zone'},
+                         {rs['zone_id'] for rs in body['recordsets']})
+        self.assertIsNone(body['next'])
+
+
+class ConditionalResponseTests(APITestCase):
+
+    def setUp(self):
+        super(ConditionalResponseTests, self).setUp()
+        self.zone = {'id': 'zone', 'name': 'example.com.', 'version': 1,
+                     'updated_at': None, 'status': 'ACTIVE'}
+        self.conn.dns.find_zone.side_effect = lambda zone_id: mock.Mock(
+            **{'to_dict.return_value': dict(self.zone)})
+
+    def get(self, etag=None, **params):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return designate.Zone().get(make_request(headers=headers, **params),
+                                    'zone')
+
+    def test_not_modified(self):
+        response = self.get()
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(self.zone, json_body(response))
+        etag = response['ETag']
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertIn('private', response['Cache-Control'])
+
+        response = self.get(etag)
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b'', response.content)
+        self.assertEqual(etag, response['ETag'])
+
+    def test_modified(self):
+        etag = self.get()['ETag']
+        self.zone['version'] = 2
+        response = self.get(etag)
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response['ETag'])
+
+    def test_fields(self):
+        etag = self.get()['ETag']
+        response = self.get(etag, fields='name')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'id': 'zone', 'name': 'example.com.'},
+                         json_body(response))
+        self.assertEqual(304, self.get(response['ETag'],
+                                       fields='name').status_code)
+
+    def test_list_ignores_timestamp(self):
+        def response(etag=None):
+            headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+            return designate._list_response(
+                make_request(headers=headers), 'zones', [dict(self.zone)],
+                {'next': None, 'prev': None,
+                 'timestamp': designate._now().isoformat()})
+
+        etag = response()['ETag']
+        self.assertEqual(304, response(etag).status_code)
+        self.zone['status'] = 'PENDING'
+        self.assertEqual(200, response(etag).status_code)
+
+
+class ListChangesTests(APITestCase):
+
+    def setUp(self):
+        super(ListChangesTests, self).setUp()
+        self.now = datetime.datetime(2026, 1, 1, 12)
+        self.useFixture(fixtures.MockPatchObject(
+            designate, '_now', return_value=self.now))
+        self.useFixture(fixtures.MockPatchObject(
+            designate.result_cache, '_get_cache',
+            return_value=mock.Mock(**{'get.return_value': []})))
+
+    def at(self, **delta):
+        return (self.now + datetime.timedelta(**delta)).isoformat()
+
+    def changes(self, items, since=None):
+        params = {'changed_since': since} if since else {}
+        return designate._list_changes(
+            make_request(**params), designate.ZONES_PATH, iter(items),
+            {'next': None, 'prev': None, 'timestamp': self.now.isoformat()})
+
+    def test_without_changed_since(self):
+        items, markers = self.changes([{'id': 'zone'}])
+        self.assertEqual([{'id': 'zone'}], list(items))
+        self.assertEqual({'next': None, 'prev': None,
+                          'timestamp': self.now.isoformat()}, markers)
+
+    def test_changed(self):
+        items = [
+            {'id': 'old', 'created_at': self.at(hours=-2),
+             'updated_at': None},
+            {'id': 'updated', 'created_at': self.at(hours=-2),
+             'updated_at': self.at(minutes=-5)},
+            {'id': 'created', 'created_at': self.at(minutes=-1),
+             'updated_at': None},
+            # Within the clock difference allowed for
+            {'id': 'margin', 'created_at': self.at(minutes=-10, seconds=-30),
+             'updated_at': None},
+            {'id': 'unknown', 'created_at': 'not a time'},
+        ]
+        changed, markers = self.changes(items, self.at(minutes=-10))
+        self.assertEqual(['updated', 'created', 'margin', 'unknown'],
+                         [item['id'] for item in changed])
+        self.assertTrue(markers['delta'])
+        self.assertEqual(['old', 'updated', 'created', 'margin', 'unknown'],
+                         markers['ids'])
+        self.assertEqual([], markers['deleted'])
+
+    def test_time_zones(self):
+        items = [{'id': 'zone', 'created_at': self.at(minutes=-5)}]
+        # 11:57 UTC
+        since = (self.now + datetime.timedelta(hours=2, minutes=-3)).replace(
+            tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+        changed, _markers = self.changes(items, since.isoformat())
+        self.assertEqual([], changed)
+
+    def test_invalid(self):
+        error = self.assertRaises(rest_utils.AjaxError, self.changes, [],
+                                  'yesterday')
+        self.assertEqual(400, error.http_status)
+
+    def test_deleted(self):
+        journal = {}
+        cache = designate.result_cache._get_cache.return_value
+        cache.get.side_effect = lambda key, default=None: journal.get(
+            key, default)
+        cache.set.side_effect = lambda key, value, timeout: journal.update(
+            {key: value})
+
+        request = make_request()
+        clock = self.useFixture(fixtures.MockPatchObject(
+            designate.result_cache.time, 'time')).mock
+        clock.return_value = datetime.datetime(
+            2026, 1, 1, 11, 40, tzinfo=datetime.timezone.utc).timestamp()
+        designate.result_cache.record_deleted(request, designate.ZONES_PATH,
+                                              ['before'])
+        clock.return_value = datetime.datetime(
+            2026, 1, 1, 11, 55, tzinfo=datetime.timezone.utc).timestamp()
+        designate.Zone().delete(request, 'after')
+        self.conn.dns.delete_zone.assert_called_once_with(
+            'after', ignore_missing=True)
+
+        _changed, markers = self.changes([], self.at(minutes=-10))
+        self.assertEqual(['after'], markers['deleted'])
+
+
+class UpdateTests(APITestCase):
+
+    def resource(self, **fields):
+        return mock.Mock(**dict(fields, **{'to_dict.return_value': fields}))
+
+    def test_zone(self):
+        self.conn.dns.get_zone.return_value = self.resource(
+            id='zone', email='old@example.com', ttl=3600)
+        self.conn.dns.update_zone.return_value = self.resource(
+            id='zone', email='new@example.com', ttl=3600, version=2)
+        response = designate.Zone().patch(
+            make_data_request('PATCH', {'email': 'new@example.com',
+                                        'ttl': 3600}), 'zone')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'id': 'zone', 'email': 'new@example.com',
+                          'ttl': 3600, 'version': 2}, json_body(response))
+        self.conn.dns.update_zone.assert_called_once_with(
+            'zone', email='new@example.com')
+
+    def test_recordset(self):
+        self.conn.dns.get_recordset.return_value = self.resource(
+            id='rs', ttl=300, records=['192.0.2.1'])
+        self.conn.dns.update_recordset.return_value = self.resource(
+            id='rs', ttl=300, records=['192.0.2.2'], status='PENDING')
+        response = designate.RecordSet().put(
+            make_data_request('PUT', {'records': ['192.0.2.2']}), 'zone',
+            'rs')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'id': 'rs', 'zone_id': 'zone', 'ttl': 300,
+                          'records': ['192.0.2.2'], 'status': 'PENDING'},
+                         json_body(response))
+
+    def test_floating_ip(self):
+        self.conn.dns.update_floating_ip.return_value = self.resource(
+            id='region:fip', ptrdname='www.example.com.', ttl=300)
+        response = designate.DnsFloatingIp().patch(
+            make_data_request('PATCH', {'ptrdname': 'www.example.com.',
+                                        'ttl': 300}), 'region:fip')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'id': 'region:fip', 'ptrdname': 'www.example.com.',
+                          'ttl': 300}, json_body(response))
+
+
+class ChangedFieldsTests(APITestCase):
+
+    def test_types(self):
+        zone = _zone.Zone.existing(id='zone', email='dns@example.com',
+                                   ttl=3600, description=None)
+        self.assertEqual({}, designate._changed_fields(
+            zone, {'email': 'dns@example.com', 'ttl': '3600'}))
+        self.assertEqual({'ttl': '300', 'description': 'new'},
+                         designate._changed_fields(
+                             zone, {'ttl': '300', 'description': 'new'}))
+        self.assertEqual({'ttl': 'soon'},
+                         designate._changed_fields(zone, {'ttl': 'soon'}))
+
+    def test_records_order(self):
+        rs = _rs.Recordset.existing(id='rs', ttl=300,
+                                    records=['192.0.2.1', '192.0.2.2'])
+        self.assertEqual({}, designate._changed_fields(
+            rs, {'records': ['192.0.2.2', '192.0.2.1'], 'ttl': 300}))
+        self.assertEqual({'records': ['192.0.2.1']},
+                         designate._changed_fields(
+                             rs, {'records': ['192.0.2.1']}))
+
+    def test_zone_update_skipped(self):
+        zone = _zone.Zone.existing(id='zone', email='dns@example.com',
+                                   ttl=3600)
+        self.conn.dns.get_zone.return_value = zone
+        response = designate.Zone().patch(
+            make_data_request('PATCH', {'email': 'dns@example.com',
+                                        'ttl': '3600'}), 'zone')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(zone.to_dict(), json_body(response))
+        self.conn.dns.update_zone.assert_not_called()
+
+    def test_recordset_update_skipped(self):
+        self.conn.dns.get_recordset.return_value = _rs.Recordset.existing(
+            id='rs', ttl=300, records=['192.0.2.1'], description='web')
+        response = designate.RecordSet().put(
+            make_data_request('PUT', {'ttl': '300', 'records': ['192.0.2.1'],
+                                      'description': 'web'}), 'zone', 'rs')
+        self.assertEqual(200, response.status_code)
+        self.conn.dns.update_recordset.assert_not_called()
+
+
+class StatusTests(APITestCase):
+
+    def setUp(self):
+        super(StatusTests, self).setUp()
+        self.pending = {'zone1', 'zone2'}
+        self.polls = []
+
+        def list_pages(request, conn, path, key, cache=True, **params):
+            self.polls.append(path)
+            return iter([[{'id': zone_id} for zone_id in self.pending]])
+
+        self.useFixture(fixtures.MockPatchObject(
+            designate, '_list_pages', side_effect=list_pages))
+        self.useFixture(fixtures.MockPatchObject(
+            designate, 'STATUS_POLL_INTERVAL', 0.01))
+        self.conn.dns.get_zone.side_effect = lambda zone_id: mock.Mock(
+            **{'to_dict.return_value': {'id': zone_id, 'status': 'ACTIVE'}})
+        self.useFixture(fixtures.MockPatchObject(
+            designate.result_cache, 'invalidate'))
+
+    def watch(self, session_key='session', **data):
+        request = make_request(dict({'zones': ['zone1']}, **data))
+        request.session = mock.Mock(session_key=session_key)
+        return designate.watch_status(request)
+
+    def test_changed(self):
+        self.pending = {'zone2'}
+        status = self.watch()
+        self.assertEqual([{'id': 'zone1', 'status': 'ACTIVE'}],
+                         status['zones'])
+        self.assertEqual(1, len(self.polls))
+
+    def test_timeout(self):
+        status = self.watch(timeout=0.05)
+        self.assertEqual([], status['zones'])
+        self.assertGreater(len(self.polls), 1)
+
+    def test_long_polling_off(self):
+        self.useFixture(fixtures.MockPatchObject(designate, 'STATUS_WAIT',
+                                                 0))
+        status = self.watch()
+        self.assertEqual([], status['zones'])
+        self.assertEqual(1, len(self.polls))
+
+    def test_waits_per_session(self):
+        holds = [designate._status_wait(mock.Mock(
+            session=mock.Mock(session_key='busy')))
+            for _index in range(designate.STATUS_MAX_WAITS)]
+        self.assertEqual([True] * designate.STATUS_MAX_WAITS,
+                         [hold.__enter__() for hold in holds])
+        self.watch(session_key='busy', timeout=1)
+        self.assertEqual(1, len(self.polls))
+
+        for hold in holds:
+            hold.__exit__(None, None, None)
+        self.watch(session_key='busy', timeout=0.05)
+        self.assertGreater(len(self.polls), 2)
+
+    def test_invalid(self):
+        error = self.assertRaises(rest_utils.AjaxError, self.watch,
+                                  recordsets=[{'id': 'rs'}])
+        self.assertEqual(400, error.http_status)
+
+
+class BatchRecordSetsTests(APITestCase):
+
+    def setUp(self):
+        super(BatchRecordSetsTests, self).setUp()
+        self.useFixture(fixtures.MockPatchObject(
+            designate.result_cache, 'invalidate'))
+        self.useFixture(fixtures.MockPatchObject(
+            designate.result_cache, 'record_deleted'))
+
+    def batch(self, operations):
+        return designate.batch_recordsets(
+            make_request({'operations': operations}), zone_id='zone')
+
+    def test_results(self):
+        self.conn.dns.create_recordset.return_value = mock.Mock(
+            **{'to_dict.return_value': {'id': 'new', 'name': 'www.'}})
+        self.conn.dns.get_recordset.side_effect = (
+            sdk_exceptions.NotFoundException(http_status=404))
+        results = self.batch([
+            {'action': 'create', 'name': 'www.', 'type': 'A', 'ttl': 300,
+             'records': ['192.0.2.1']},
+            {'action': 'create', 'name': 'mail.'},
+            {'action': 'update', 'id': 'gone', 'ttl': 300},
+            {'action': 'delete', 'id': 'old'},
+        ])['results']
+        self.assertEqual(
+            [('create', 'new', 'success', None),
+             ('create', None, 'error', 400),
+             ('update', 'gone', 'error', 404),
+             ('delete', 'old', 'success', None)],
+            [(result['action'], result['id'], result['status'],
+              result.get('code')) for result in results])
+        self.conn.dns.delete_recordset.assert_called_once_with(
+            'old', 'zone', ignore_missing=True)
+        designate.result_cache.record_deleted.assert_called_once_with(
+            mock.ANY, '/zones/zone/recordsets', ['old'])
+
+    def test_invalid(self):
+        for operations in ('create', ['create'], [None],
+                           [{'action': 'rename', 'id': 'rs'}],
+                           [{'action': 'delete'}],
+                           [{'action': 'update', 'id': 'rs'}, 1]):
+            error = self.assertRaises(rest_utils.AjaxError, self.batch,
+                                      operations)
+            self.assertEqual(400, error.http_status)
+        self.conn.dns.update_recordset.assert_not_called()
+
+
+class ImportZoneFileTests(APITestCase):
+
+    def setUp(self):
+        super(ImportZoneFileTests, self).setUp()
+        self.useFixture(fixtures.MockPatchObject(
+            designate.result_cache, 'invalidate'))
+        self.conn.dns.get_zone.return_value = _zone.Zone.existing(
+            id='zone', name='example.com.', ttl=3600)
+        self.recordsets = {}
+
+        def create_recordset(zone_id, **kwargs):
+            key = (kwargs['name'], kwargs['type'])
+            if key in self.recordsets:
+                raise sdk_exceptions.ConflictException(http_status=409)
+            self.recordsets[key] = _rs.Recordset.existing(
+                id='rs%d' % len(self.recordsets), **kwargs)
+            return self.recordsets[key]
+
+        def recordsets(zone_id, name, type):
+            return [self.recordsets[(name, type)]]
+
+        def update_recordset(rs_id, zone_id, **kwargs):
+            for key, rs in self.recordsets.items():
+                if rs.id == rs_id:
+                    self.recordsets[key] = _rs.Recordset.existing(
+                        **dict(rs.to_dict(), **kwargs))
+                    return self.recordsets[key]
+
+        self.conn.dns.create_recordset.side_effect = create_recordset
+        self.conn.dns.recordsets.side_effect = recordsets
+        self.conn.dns.update_recordset.side_effect = update_recordset
+
+    def upload(self, text):
+        upload = uploadedfile.SimpleUploadedFile('example.com.zone',
+                                                 text.encode('utf-8'))
+        request = client.RequestFactory().post('/', {'file': upload})
+        request.user = make_request().user
+        return designate.import_zonefile(request, 'zone')
+
+    def test_import(self):
+        summary = self.upload(
+            '@ IN SOA ns1 hostmaster 1 7200 3600 1209600 300\n'
+            '@ NS ns1\n'
+            'www A 192.0.2.1\n'
+            'mail A 192.0.2.2\n'
+            'www A 192.0.2.3\n')
+        self.assertEqual({'created': 2, 'updated': 1, 'skipped': 2,
+                          'failed': 0, 'errors': []}, summary)
+        self.assertEqual(
+            ['192.0.2.1', '192.0.2.3'],
+            self.recordsets[('www.example.com.', 'A')].records)
+
+    def test_reimport(self):
+        text = ('www A 192.0.2.1\n'
+                'mail A 192.0.2.2\n'
+                'www A 192.0.2.1\n'
+                'www A 192.0.2.3\n')
+        self.upload(text)
+        self.assertEqual(
+            ['192.0.2.1', '192.0.2.3'],
+            self.recordsets[('www.example.com.', 'A')].records)
+        self.conn.dns.update_recordset.reset_mock()
+
+        summary = self.upload(text)
+        self.assertEqual(0, summary['failed'])
+        self.assertEqual(
+            ['192.0.2.1', '192.0.2.3'],
+            self.recordsets[('www.example.com.', 'A')].records)
+
+
+class FilterTests(base.TestCase):
+
+    def test_get_filters(self):
+        request = make_request(name='www*', type='A', status='', limit=10,
+                               marker='zone1', other='x')
+        self.assertEqual({'name': 'www*', 'type': 'A'},
+                         designate._get_filters(request,
+                                                designate.ZONE_FILTERS))
+
+    def test_match_filters(self):
+        items = [{'address': '192.0.2.1', 'ptrdname': 'www.example.com.'},
+                 {'address': '192.0.2.10', 'ptrdname': None},
+                 {'address': '198.51.100.1', 'ptrdname': 'WWW.example.org.'}]
+
+        def match(**filters):
+            return [item['address'] for item in
+                    designate._match_filters(items, filters)]
+
+        self.assertEqual(['192.0.2.1'], match(address='192.0.2.1'))
+        self.assertEqual(['192.0.2.1', '192.0.2.10'], match(address='192.*'))
+        self.assertEqual(['192.0.2.1', '198.51.100.1'],
+                         match(ptrdname='www.*'))
+        self.assertEqual(['198.51.100.1'],
+                         match(address='*.1', ptrdname='*.ORG.'))
+        # Regular expression characters are matched as they are
+        self.assertEqual([], match(address='192.0.2..'))
+        self.assertEqual([], match(ptrdname='www'))
+
+
+class PtrTemplateTests(base.TestCase):
+
+    def test_placeholders(self):
+        self.assertEqual(
+            '192-0-2-1.hosts.example.com.',
+            designate._expand_ptr_template('{ip_dashed}.hosts.example.com.',
+                                           '192.0.2.1'))
+        self.assertEqual(
+            '1.2.0.192.example.com.',
+            designate._expand_ptr_template('{ip_reversed}.example.com.',
+                                           '192.0.2.1'))
+        self.assertEqual(
+            '2001-0db8-0000-0000-0000-0000-0000-0001.example.com.',
+            designate._expand_ptr_template('{ip_dashed}.example.com.',
+                                           '2001:db8::1'))
+
+    def test_rejected(self):
+        for template in ('{ip.__class__.__mro__}.example.com.',
+                         '{ip_dashed[0]}.example.com.',
+                         '{ip_dashed!r}.example.com.',
+                         '{ip_dashed:>80}.example.com.',
+                         '{0}.example.com.',
+                         '{}.example.com.',
+                         '{other}.example.com.',
+                         '{ip_dashed.example.com.',
+                         '{ip_dashed}.example.com',
+                         '{ip_dashed}..example.com.',
+                         'a' * 64 + '.example.com.',
+                         ('a' * 63 + '.') * 4):
+            self.assertRaises(ValueError, designate._expand_ptr_template,
+                              template, '192.0.2.1')
+
+    def test_ipv6_reversed_name_length(self):
+        # The reverse labels of an IPv6 address are 63 characters long
+        template = '{ip_reversed}.%s.' % '.'.join(['a' * 63] * 3)
+        self.assertRaises(ValueError, designate._expand_ptr_template,
+                          template, '2001:db8::1')
+        self.assertEqual(
+            '1.2.0.192.', designate._expand_ptr_template(
+                template, '192.0.2.1')[:10])
+
+
+class BatchFloatingIpsTests(APITestCase):
+
+    def setUp(self):
+        super(BatchFloatingIpsTests, self).setUp()
+        self.fips = {
+            'region:1': _fip.FloatingIP.existing(
+                id='region:1', address='192.0.2.1', ptrdname=None),
+            'region:2': _fip.FloatingIP.existing(
+                id='region:2', address='192.0.2.2',
+                ptrdname='192-0-2-2.example.com.'),
+        }
+
+        def get_floating_ip(fip_id):
+            if fip_id not in self.fips:
+                raise sdk_exceptions.NotFoundException(http_status=404)
+            return self.fips[fip_id]
+
+        def update_floating_ip(fip_id, **kwargs):
+            return _fip.FloatingIP.existing(
+                id=fip_id, address=self.fips[fip_id].address, **kwargs)
+
+        self.conn.dns.get_floating_ip.side_effect = get_floating_ip
+        self.conn.dns.update_floating_ip.side_effect = update_floating_ip
+
+    def batch(self, data):
+        return designate.batch_dns_floatingips(make_request(data))
+
+    def test_set(self):
+        results = self.batch({'ids': ['region:1', 'region:2', 'region:3'],
+                              'template': '{ip_dashed}.example.com.',
+                              'ttl': 300})['results']
+        self.assertEqual(['success', 'success', 'error'],
+                         [result['status'] for result in results])
+        self.assertEqual(['region:1', 'region:2', 'region:3'],
+                         [result['id'] for result in results])
+        self.assertEqual('192-0-2-1.example.com.',
+                         results[0]['result']['ptrdname'])
+        self.assertEqual(404, results[2]['code'])
+        self.conn.dns.update_floating_ip.assert_has_calls([
+            mock.call('region:1', ptrdname='192-0-2-1.example.com.',
+                      ttl=300),
+            mock.call('region:2', ptrdname='192-0-2-2.example.com.',
+                      ttl=300)], any_order=True)
+
+    def test_unset(self):
+        results = self.batch({'ids': ['region:1', 'region:2'],
+                              'template': None})['results']
+        self.assertEqual(['success', 'success'],
+                         [result['status'] for result in results])
+        # The PTR of the first floating IP is already unset
+        self.conn.dns.update_floating_ip.assert_called_once_with(
+            'region:2', ptrdname=None)
+
+    def test_invalid_template(self):
+        for template in ('{ip.__class__}.example.com.', 'example.com', 1):
+            error = self.assertRaises(
+                rest_utils.AjaxError, self.batch,
+                {'ids': ['region:1'], 'template': template})
+            self.assertEqual(400, error.http_status)
+        self.conn.dns.get_floating_ip.assert_not_called()
+
+    def test_invalid_ids(self):
+        error = self.assertRaises(rest_utils.AjaxError, self.batch,
+                                  {'ids': 'region:1'})
+        self.assertEqual(400, error.http_status)
+
+
+class FloatingIpOwnersTests(APITestCase):
+
+    def test_lists_ports_of_floating_ips(self):
+        self.conn.network.ips.return_value = [
+            mock.Mock(**{'to_dict.return_value': {
+                'id': 'fip%d' % index, 'port_id': 'port%d' % (index % 150),
+                'fixed_ip_address': '10.0.0.%d' % index}})
+            for index in range(200)] + [
+            mock.Mock(**{'to_dict.return_value': {'id': 'free',
+                                                  'port_id': None}})]
+        self.conn.network.ports.side_effect = lambda id: [
+            mock.Mock(**{'to_dict.return_value': {
+                'id': port_id, 'device_owner': 'compute:nova'}})
+            for port_id in id]
+        owners = designate._neutron_calls(make_request())[0]()
+
+        self.assertEqual(2, self.conn.network.ports.call_count)
+        port_ids = [port_id for call in
+                    self.conn.network.ports.call_args_list
+                    for port_id in call[1]['id']]
+        self.assertEqual(150, len(set(port_ids)))
+        self.assertEqual('compute:nova', owners['fip160']['device_owner'])
+        self.assertEqual('port10', owners['fip160']['port_id'])
+        self.assertIsNone(owners['free']['device_owner'])
+
+    def test_join_without_neutron(self):
+        fips = designate._join_owners(
+            'region', [{'id': 'region:fip'}], [Exception('down')])
+        self.assertEqual([dict({'id': 'region:fip'},
+                               **dict.fromkeys(designate.OWNER_FIELDS))],
+                         fips)
@@ -0,0 +1,152 @@
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+import time
+
+from designatedashboard.tests import base
+from designatedashboard import zonefile
+
+
+ZONE = """$ORIGIN example.com.
+$TTL 1h
+; the zone apex
+@       IN  SOA ns1 hostmaster (
+                2024010101 ; serial
+                7200 3600 1209600 300 )
+        IN  NS  ns1
+        IN  MX  10 mail
+www  300 IN A  192.0.2.1
+         IN A  192.0.2.2
+mail     A     192.0.2.3
+txt      TXT   "v=spf1 ; -all" "second"
+*.wild   CNAME www.example.org.
+$ORIGIN sub.example.com.
+host 1H30m A 192.0.2.4
+"""
+
+
+class ReadTests(base.TestCase):
+
+    def read(self, text, origin=None):
+        return list(zonefile.read(text.splitlines(True), origin))
+
+    def test_records(self):
+        records = self.read(ZONE)
+        self.assertEqual([
+            ('example.com.', 'SOA', 3600,
+             'ns1 hostmaster 2024010101 7200 3600 1209600 300'),
+            ('example.com.', 'NS', 3600, 'ns1.example.com.'),
+            ('example.com.', 'MX', 3600, '10 mail.example.com.'),
+            ('www.example.com.', 'A', 300, '192.0.2.1'),
+            ('www.example.com.', 'A', 3600, '192.0.2.2'),
+            ('mail.example.com.', 'A', 3600, '192.0.2.3'),
+            ('txt.example.com.', 'TXT', 3600, '"v=spf1 ; -all" "second"'),
+            ('*.wild.example.com.', 'CNAME', 3600, 'www.example.org.'),
+            ('host.sub.example.com.', 'A', 5400, '192.0.2.4'),
+        ], [(record['name'], record['type'], record['ttl'], record['data'])
+            for record in records])
+
+    def test_bytes_and_origin(self):
+        records = self.read('www A 192.0.2.1\n', 'example.com.')
+        self.assertEqual('www.example.com.', records[0]['name'])
+        self.assertIsNone(records[0]['ttl'])
+        records = list(zonefile.read([b'www A 192.0.2.1\n'], 'example.com.'))
+        self.assertEqual('www.example.com.', records[0]['name'])
+
+    def test_last_ttl_without_default(self):
+        records = self.read('a 60 A 192.0.2.1\nb A 192.0.2.2\n',
+                            'example.com.')
+        self.assertEqual([60, 60], [record['ttl'] for record in records])
+
+    def test_errors(self):
+        for text, line in (
+                ('$INCLUDE other.zone\n', 1),
+                ('www A 192.0.2.1\n  ( A\n', 2),
+                ('www IN\n', 1),
+                ('www A\n', 1),
+                ('www CH A 192.0.2.1\n', 1),
+                ('www TXT "open\n', 1),
+                ('  A 192.0.2.1\n', 1),
+                ('$TTL 1x\n', 1),
+                (b'www TXT "\xff"\n', 1)):
+            error = self.assertRaises(zonefile.ZoneFileError, self.read,
+                                      text, 'example.com.')
+            self.assertEqual(line, error.line, text)
+
+    def test_relative_name_without_origin(self):
+        self.assertRaises(zonefile.ZoneFileError, self.read,
+                          'www A 192.0.2.1\n')
+
+    def test_ttl_matching_is_linear(self):
+        start = time.monotonic()
+        self.assertFalse(zonefile._is_ttl('1' * 10000 + 'x'))
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_ttl_units(self):
+        self.assertEqual(93784, zonefile._parse_ttl(1, '1d2H3m4'))
+        self.assertEqual(604800, zonefile._parse_ttl(1, '1w'))
+        for token in ('', 'h', '1hh', '-1', '1.5'):
+            self.assertFalse(zonefile._is_ttl(token), token)
+
+
+class GroupRecordsetsTests(base.TestCase):
+
+    def test_groups_consecutive(self):
+        records = [
+            {'name': 'a.', 'type': 'A', 'ttl': 60, 'data': '192.0.2.1'},
+            {'name': 'a.', 'type': 'A', 'ttl': 30, 'data': '192.0.2.2'},
+            {'name': 'a.', 'type': 'TXT', 'ttl': 60, 'data': '"x"'},
+            {'name': 'a.', 'type': 'A', 'ttl': 60, 'data': '192.0.2.3'},
+        ]
+        self.assertEqual([
+            {'name': 'a.', 'type': 'A', 'ttl': 60,
+             'records': ['192.0.2.1', '192.0.2.2']},
+            {'name': 'a.', 'type': 'TXT', 'ttl': 60, 'records': ['"x"']},
+            {'name': 'a.', 'type': 'A', 'ttl': 60, 'records': ['192.0.2.3']},
+        ], list(zonefile.group_recordsets(records)))
+
+    def test_yields_before_error(self):
+        lines = ['a A 192.0.2.1\n', 'a A 192.0.2.2\n', 'b BAD\n']
+        recordsets = zonefile.group_recordsets(
+            zonefile.read(lines, 'example.com.'))
+        self.assertEqual(['192.0.2.1', '192.0.2.2'],
+                         next(recordsets)['records'])
+        self.assertRaises(zonefile.ZoneFileError, next, recordsets)
+
+
+class WriteTests(base.TestCase):
+
+    def test_write(self):
+        lines = list(zonefile.write('example.com.', 3600, [
+            {'name': 'www.example.com.', 'type': 'A', 'ttl': 300,
+             'records': ['192.0.2.1', '192.0.2.2']},
+            {'name': 'example.com.', 'type': 'NS', 'ttl': None,
+             'records': ['ns1.example.com.']},
+            {'name': 'empty.example.com.', 'type': 'A', 'records': None},
+        ]))
+        self.assertEqual([
+            '$ORIGIN example.com.\n',
+            '$TTL 3600\n',
+            'www.example.com. 300 IN A 192.0.2.1\n',
+            'www.example.com. 300 IN A 192.0.2.2\n',
+            'example.com. IN NS ns1.example.com.\n',
+        ], lines)
+
+    def test_round_trip(self):
+        recordsets = [
+            {'name': 'www.example.com.', 'type': 'A', 'ttl': 300,
+             'records': ['192.0.2.1', '192.0.2.2']},
+            {'name': 'example.com.', 'type': 'MX', 'ttl': 600,
+             'records': ['10 mail.example.com.']},
+        ]
+        lines = zonefile.write('example.com.', None, recordsets)
+        self.assertEqual(recordsets, list(zonefile.group_recordsets(
+            zonefile.read(lines))))
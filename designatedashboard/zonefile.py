@@ -0,0 +1,249 @@
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+"""Streaming reader and writer of BIND master zone files (RFC 1035).
+
+Both work one line at a time, so a zone file never has to be held in
+memory as a whole. The reader understands comments, quoted strings, entries
+continued over several lines with parentheses, ``$ORIGIN`` and ``$TTL``,
+relative and ``@`` owner names, and records that leave out their owner, TTL
+or class. ``$INCLUDE`` and ``$GENERATE`` are not supported.
+"""
+import re
+
+
+CLASSES = ('IN', 'CH', 'HS', 'CS')
+
+# Index of the domain names in the data of the record types that hold any,
+# which are made absolute like the owner names.
+NAME_FIELDS = {
+    'CNAME': (0,),
+    'DNAME': (0,),
+    'NS': (0,),
+    'PTR': (0,),
+    'MX': (1,),
+    'SRV': (3,),
+}
+
+# Each unit ends a part, so that a TTL splits into its parts one way only
+# and matching takes linear time on any token.
+_TTL_RE = re.compile(r'(?:\d+[smhdw])*\d*', re.I)
+_TTL_PART_RE = re.compile(r'(\d+)([smhdw]?)', re.I)
+_TTL_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+class ZoneFileError(ValueError):
+    """A zone file entry that cannot be read."""
+
+    def __init__(self, line, message):
+        super(ZoneFileError, self).__init__('line %d: %s' % (line, message))
+        self.line = line
+
+
+def _is_ttl(token):
+    return bool(token) and _TTL_RE.fullmatch(token) is not None
+
+
+def _parse_ttl(line, token):
+    if not _is_ttl(token):
+        raise ZoneFileError(line, 'invalid TTL %s' % token)
+    return sum(int(value) * _TTL_UNITS[unit.lower()]
+               for value, unit in _TTL_PART_RE.findall(token))
+
+
+def _absolute(name, origin):
+    if name == '@':
+        return origin
+    if name.endswith('.'):
+        return name
+    if origin is None:
+        raise ValueError('relative name %s without an origin' % name)
+    return '%s.%s' % (name, origin)
+
+
+def _entries(lines):
+    """Splits the lines of a zone file into entries.
+
+    :param lines: Iterable of lines, as str or UTF-8 encoded bytes
+    :returns: Generator of tuples of the number of the first line of the
+        entry, whether the entry starts with blanks, and its tokens.
+        Quoted strings are single tokens that keep their quotes.
+    """
+    tokens = []
+    depth = 0
+    first = None
+    blank_owner = False
+    for number, line in enumerate(lines, 1):
+        if isinstance(line, bytes):
+            try:
+                line = line.decode('utf-8')
+            except UnicodeDecodeError:
+                raise ZoneFileError(number, 'not UTF-8 encoded')
+        if not depth:
+            first = number
+            blank_owner = line[:1] in (' ', '\t')
+        token = None
+        quoted = False
+        index = 0
+        while index < len(line):
+            char = line[index]
+            if quoted:
+                token += char
+                if char == '\\' and index + 1 < len(line):
+                    index += 1
+                    token += line[index]
+                elif char == '"':
+                    quoted = False
+            elif char == '"':
+                token = (token or '') + char
+                quoted = True
+            elif char == ';':
+                break
+            elif char in '()':
+                if token is not None:
+                    tokens.append(token)
+                    token = None
+                depth += 1 if char == '(' else -1
+                if depth < 0:
+                    raise ZoneFileError(number, 'unbalanced parentheses')
+            elif char.isspace():
+                if token is not None:
+                    tokens.append(token)
+                    token = None
+            else:
+                if char == '\\' and index + 1 < len(line):
+                    char += line[index + 1]
+                    index += 1
+                token = (token or '') + char
+            index += 1
+        if quoted:
+            raise ZoneFileError(number, 'unterminated quoted string')
+        if token is not None:
+            tokens.append(token)
+        if not depth and tokens:
+            yield first, blank_owner, tokens
+            tokens = []
+    if depth:
+        raise ZoneFileError(first, 'unbalanced parentheses')
+
+
+def read(lines, origin=None):
+    """Reads the records of a zone file.
+
+    :param lines: Iterable of lines, as str or UTF-8 encoded bytes
+    :param origin: Absolute name the relative names are relative to, until
+        a ``$ORIGIN`` entry changes it. Usually the zone name.
+    :returns: Generator of dictionaries with the absolute ``name``, the
+        ``type``, the ``ttl``, or None, and the ``data`` of each record
+    :raises ZoneFileError: On the first entry that cannot be read
+    """
+    default_ttl = None
+    last_ttl = None
+    owner = None
+    for number, blank_owner, tokens in _entries(lines):
+        try:
+            directive = tokens[0].upper()
+            if directive == '$ORIGIN':
+                origin = _absolute(tokens[1], origin)
+                continue
+            if directive == '$TTL':
+                default_ttl = _parse_ttl(number, tokens[1])
+                continue
+            if directive.startswith('$'):
+                raise ZoneFileError(number,
+                                    '%s is not supported' % tokens[0])
+
+            if not blank_owner:
+                owner = _absolute(tokens.pop(0), origin)
+            elif owner is None:
+                raise ZoneFileError(number, 'missing owner name')
+            ttl = None
+            for _index in range(2):
+                if tokens and ttl is None and _is_ttl(tokens[0]):
+                    ttl = _parse_ttl(number, tokens.pop(0))
+                elif tokens and tokens[0].upper() in CLASSES:
+                    if tokens.pop(0).upper() != 'IN':
+                        raise ZoneFileError(number,
+                                            'only the IN class is supported')
+            if not tokens:
+                raise ZoneFileError(number, 'missing record type')
+            rtype = tokens.pop(0).upper()
+            if not tokens:
+                raise ZoneFileError(number, 'missing %s record data' % rtype)
+            for field in NAME_FIELDS.get(rtype, ()):
+                if field < len(tokens):
+                    tokens[field] = _absolute(tokens[field], origin)
+        except ZoneFileError:
+            raise
+        except IndexError:
+            raise ZoneFileError(number, 'missing %s argument' % tokens[0])
+        except ValueError as e:
+            raise ZoneFileError(number, str(e))
+
+        if ttl is not None:
+            last_ttl = ttl
+        elif default_ttl is not None:
+            ttl = default_ttl
+        else:
+            ttl = last_ttl
+        yield {'name': owner, 'type': rtype, 'ttl': ttl,
+               'data': ' '.join(tokens)}
+
+
+def group_recordsets(records):
+    """Groups consecutive records of the same name and type.
+
+    Zone files usually list the records of an owner name together, but a
+    name and type may come back later on, in which case it is yielded again.
+    A ZoneFileError raised by records is raised once the recordset read
+    until then has been yielded.
+
+    :param records: Iterable of record dictionaries, as yielded by read
+    :returns: Generator of dictionaries with the ``name``, ``type``, ``ttl``
+        of the first record and ``records`` of each recordset
+    """
+    recordset = None
+    try:
+        for record in records:
+            if (recordset is None or recordset['name'] != record['name'] or
+                    recordset['type'] != record['type']):
+                if recordset is not None:
+                    yield recordset
+                recordset = {'name': record['name'], 'type': record['type'],
+                             'ttl': record['ttl'], 'records': []}
+            recordset['records'].append(record['data'])
+    except ZoneFileError:
+        # Hand out the records read before the error first
+        if recordset is not None:
+            yield recordset
+        raise
+    if recordset is not None:
+        yield recordset
+
+
+def write(origin, ttl, recordsets):
+    """Writes recordsets as a zone file.
+
+    :param origin: Zone name, written as ``$ORIGIN``
+    :param ttl: Default TTL of the zone, written as ``$TTL``, or None
+    :param recordsets: Iterable of dictionaries with the ``name``, ``type``,
+        ``ttl`` and ``records`` of each recordset
+    :returns: Generator of the lines of the zone file
+    """
+    yield '$ORIGIN %s\n' % origin
+    if ttl:
+        yield '$TTL %d\n' % ttl
+    for recordset in recordsets:
+        prefix = recordset['name']
+        if recordset.get('ttl'):
+            prefix += ' %d' % recordset['ttl']
+        for data in recordset.get('records') or []:
+            yield '%s IN %s %s\n' % (prefix, recordset['type'], data)